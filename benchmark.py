@@ -0,0 +1,227 @@
+"""Finder+ benchmark: time each search phase over a synthetic, seeded tree.
+
+    python benchmark.py --files 20000 --out bench.json
+
+The same seed and parameters always produce the same tree, so JSON files
+written on different commits can be compared phase by phase. Every phase
+runs ``--repeat`` times against a warm OS cache; the fastest run is
+reported as ``seconds`` and all runs are kept under ``runs``.
+"""
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import platform
+import tempfile
+import subprocess
+from datetime import datetime
+
+from finderplus import (
+    DEFAULT_CONFIG, FUZZY_AVAILABLE, Search, TreeSnapshot, fill_stat, make_config,
+    sort_results, walk_files,
+)
+
+
+# ══════════════════════════════════════════════════════════════
+#  SYNTHETIC TREE
+# ══════════════════════════════════════════════════════════════
+WORDS = (
+    "alpha beta gamma delta config server client cache index render parse "
+    "token buffer stream socket handler widget model view report invoice "
+    "user account order payment search result export import backup draft "
+    "final notes readme module helper test main util core api data"
+).split()
+TEXT_EXTS_BENCH   = [".py", ".txt", ".md", ".json", ".log", ".js", ".csv"]
+BINARY_EXTS_BENCH = [".bin", ".png", ".zip", ".pdf"]
+NEEDLE            = "finderplus_needle"   # planted in some text files
+
+def make_tree(root, files=10000, depth=4, per_dir=40, size_median=4096,
+              size_sigma=1.5, max_size=4 << 20, text_ratio=0.7,
+              needle_ratio=0.05, seed=1):
+    """Write a synthetic tree of *files* files under *root*.
+
+    Folders nest up to *depth* levels with about *per_dir* files each.
+    Sizes are log-normal around *size_median* bytes, capped at *max_size*.
+    A *text_ratio* share of files are text (words, one line each), the rest
+    random bytes; *needle_ratio* of the text files contain ``NEEDLE``.
+    Returns the parameters, which identify the tree.
+    """
+    params = dict(files=files, depth=depth, per_dir=per_dir, size_median=size_median,
+                  size_sigma=size_sigma, max_size=max_size, text_ratio=text_ratio,
+                  needle_ratio=needle_ratio, seed=seed)
+    rng  = random.Random(seed)
+    dirs = [root]
+    for i in range(max(1, files // per_dir) - 1):
+        parent = rng.choice(dirs)
+        if parent.count(os.sep) - root.count(os.sep) >= depth: parent = root
+        dirs.append(os.path.join(parent, f"{rng.choice(WORDS)}_{i}"))
+    for d in dirs: os.makedirs(d, exist_ok=True)
+
+    for i in range(files):
+        text = rng.random() < text_ratio
+        ext  = rng.choice(TEXT_EXTS_BENCH if text else BINARY_EXTS_BENCH)
+        name = f"{rng.choice(WORDS)}_{rng.choice(WORDS)}{i}{ext}"
+        size = min(max_size, int(rng.lognormvariate(0, size_sigma) * size_median))
+        path = os.path.join(rng.choice(dirs), name)
+        if text:
+            words = []
+            total = 0
+            while total < size:
+                w = rng.choice(WORDS); words.append(w); total += len(w) + 1
+            if words and rng.random() < needle_ratio:
+                words[rng.randrange(len(words))] = NEEDLE
+            with open(path, "w", encoding="utf-8") as f: f.write(" ".join(words))
+        else:
+            with open(path, "wb") as f: f.write(rng.randbytes(size))
+    return params
+
+
+# ══════════════════════════════════════════════════════════════
+#  PHASES
+# ══════════════════════════════════════════════════════════════
+def timed(fn, repeat, setup=None):
+    """Run *fn* *repeat* times; returns ``(runs, last_result)``.
+
+    *setup*, if given, runs untimed before each run and its result is
+    passed to *fn*.
+    """
+    runs, out = [], None
+    for _ in range(repeat):
+        arg = setup() if setup else None
+        t0 = time.perf_counter()
+        out = fn(arg) if setup else fn()
+        runs.append(time.perf_counter() - t0)
+    return runs, out
+
+def run_search(snapshot, **options):
+    """Run one search against *snapshot*; returns the Search."""
+    s = Search(make_config(snapshot.root, snapshot=snapshot, **options))
+    for _ in s: pass
+    return s
+
+def bench(root, repeat=3, workers=1, render=True, readahead=DEFAULT_CONFIG["readahead"]):
+    """Time every phase over the tree at *root*; returns ``{phase: result}``."""
+    phases = {}
+    def record(name, runs, count=None, **extra):
+        phases[name] = dict(seconds=min(runs), runs=runs, **extra)
+        if count is not None: phases[name]["count"] = count
+
+    runs, n = timed(lambda: sum(1 for _ in walk_files(root)), repeat)
+    record("walk", runs, n)
+
+    runs, n = timed(lambda entries: sum(1 for _, e in entries if e.stat()), repeat,
+                    setup=lambda: list(walk_files(root)))
+    record("stat", runs, n)
+
+    snapshot = TreeSnapshot(root)
+    for _ in snapshot.build({}): pass
+
+    for name, options in (
+        ("match_plain", dict(query="config")),
+        ("match_regex", dict(query=r"^(server|client)_.*\d{2}\.py$", regex=True)),
+        ("match_fuzzy", dict(query="confg", fuzzy=True, fuzzy_threshold=70)),
+        ("match_content", dict(query=NEEDLE, search_content=True, content_workers=workers,
+                               readahead=readahead)),
+    ):
+        if options.get("fuzzy") and not FUZZY_AVAILABLE:
+            phases[name] = dict(skipped="rapidfuzz is not installed"); continue
+        runs, s = timed(lambda: run_search(snapshot, max_results=10**9, **options), repeat)
+        record(name, runs, s.matched, search=s.report()["seconds"])
+
+    results = run_search(snapshot, max_results=10**9).results()
+    for r in results: fill_stat(r)
+    for order in ("Name", "Date", "Size", "Extension"):
+        runs, _ = timed(lambda: sort_results(list(results), order), repeat)
+        record(f"sort_{order.lower()}", runs, len(results))
+
+    if render: phases.update(bench_render(results, root, repeat))
+    return phases
+
+def bench_render(results, root, repeat):
+    """Time ``_populate_tree`` on an offscreen window, flat and grouped."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    try:
+        from PySide6.QtWidgets import QApplication
+        from finderplus_gui import QuickSearch
+    except ImportError as ex:
+        return {"render": dict(skipped=str(ex))}
+    app = QApplication.instance() or QApplication([])
+    window = QuickSearch()
+    window.folder_path = root
+    window.show()
+    out = {}
+    for name, grouped in (("render_flat", False), ("render_grouped", True)):
+        window.group_btn.setChecked(grouped)
+        def populate():
+            window._populate_tree(results)
+            app.processEvents()
+        runs, _ = timed(populate, repeat)
+        out[name] = dict(seconds=min(runs), runs=runs, count=len(results))
+    window.close()
+    return out
+
+
+# ══════════════════════════════════════════════════════════════
+#  ENTRY POINT
+# ══════════════════════════════════════════════════════════════
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, cwd=os.path.dirname(os.path.abspath(__file__)),
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Time Finder+ search phases on a synthetic tree.")
+    ap.add_argument("--files", type=int, default=10000)
+    ap.add_argument("--depth", type=int, default=4)
+    ap.add_argument("--per-dir", type=int, default=40, help="files per folder, on average")
+    ap.add_argument("--size-median", type=int, default=4096, help="bytes")
+    ap.add_argument("--size-sigma", type=float, default=1.5, help="log-normal spread")
+    ap.add_argument("--max-size", type=int, default=4 << 20, help="bytes")
+    ap.add_argument("--text-ratio", type=float, default=0.7)
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--workers", type=int, default=1, help="processes for content matching")
+    ap.add_argument("--readahead", type=int, default=DEFAULT_CONFIG["readahead"],
+                    help="read-ahead threads for content matching with one worker")
+    ap.add_argument("--no-render", action="store_true", help="skip the Qt rendering phases")
+    ap.add_argument("--tree", help="build the tree here and keep it (default: a temp dir)")
+    ap.add_argument("--out", help="write the JSON report here (default: stdout)")
+    a = ap.parse_args(argv)
+
+    if a.tree:
+        os.makedirs(a.tree, exist_ok=True)
+        if os.listdir(a.tree): sys.exit(f"benchmark: {a.tree} is not empty")
+    root = a.tree or tempfile.mkdtemp(prefix="finderplus-bench-")
+    try:
+        t0 = time.perf_counter()
+        params = make_tree(root, a.files, a.depth, a.per_dir, a.size_median, a.size_sigma,
+                           a.max_size, a.text_ratio, seed=a.seed)
+        print(f"Built {a.files:,} files in {time.perf_counter() - t0:.1f}s", file=sys.stderr)
+        report = dict(
+            commit=git_commit(), date=datetime.now().isoformat(timespec="seconds"),
+            python=platform.python_version(), platform=platform.platform(),
+            tree=params, repeat=a.repeat, workers=a.workers, readahead=a.readahead,
+            phases=bench(root, a.repeat, a.workers, render=not a.no_render,
+                         readahead=a.readahead),
+        )
+    finally:
+        if not a.tree: shutil.rmtree(root, ignore_errors=True)
+
+    for name, p in report["phases"].items():
+        line = f"{p['seconds']:9.4f}s" if "seconds" in p else f"  skipped ({p['skipped']})"
+        print(f"{name:<16}{line}", file=sys.stderr)
+    text = json.dumps(report, indent=2)
+    if a.out:
+        with open(a.out, "w", encoding="utf-8") as f: f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
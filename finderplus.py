@@ -1,597 +1,2460 @@
 import sys
 import os
 import re
+import csv
+import json
+import stat
+import time
+import mmap
+import queue
+import heapq
+import hashlib
+import sqlite3
+import threading
+import multiprocessing
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
-import ctypes
-ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID("finderplus.app")
-
-from PySide6.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLineEdit,
-    QLabel, QPushButton, QFileDialog, QFrame, QSplitter,
-    QTreeWidget, QTreeWidgetItem, QTextEdit, QStatusBar, QComboBox,
-    QSpinBox, QMenu, QHeaderView, QMainWindow,
-    QAbstractItemView, QProgressBar
-)
-from PySide6.QtGui import (
-    QFont, QDesktopServices, QAction, QKeySequence, QColor,
-    QSyntaxHighlighter, QTextCharFormat, QPalette, QCursor
-)
-from PySide6.QtCore import Qt, QUrl, QThread, Signal, QTimer
+try:
+    from re import _parser as sre_parse, _constants as sre_constants
+except ImportError:                     # Python < 3.11
+    import sre_parse, sre_constants
 
 try:
-    from rapidfuzz import fuzz
+    from rapidfuzz import fuzz, process as fuzz_process
     FUZZY_AVAILABLE = True
 except ImportError:
     FUZZY_AVAILABLE = False
 
-# ══════════════════════════════════════════════════════════════
-#  PALETTE
-#  bg:          #ffffff   (pure white)
-#  surface:     #f7f8fc   (off-white panels)
-#  text:        #1a1a2e   (near-black — ultra high contrast)
-#  muted:       #6b7280
-#  border:      #e5e7eb
-#
-#  pastel accents (all high-contrast against white):
-#    mint:      bg #d1fae5  text #065f46
-#    sky:       bg #dbeafe  text #1e3a8a
-#    coral:     bg #ffe4e6  text #9f1239
-#    violet:    bg #ede9fe  text #4c1d95
-#    amber:     bg #fef3c7  text #78350f
-#    lime:      bg #ecfccb  text #365314
-#
-#  primary action: #6366f1 (indigo) — crisp, bold
-# ══════════════════════════════════════════════════════════════
 
-STYLE = """
-/* ─── BASE ─────────────────────────────────────────────── */
-QMainWindow, QWidget {
-    background-color: #ffffff;
-    color: #1a1a2e;
-    font-family: 'Outfit', 'Poppins', 'Segoe UI', sans-serif;
-    font-size: 13px;
-}
 
-/* ─── TOOLBAR ───────────────────────────────────────────── */
-QFrame#toolbar {
-    background: #6366f1;
-    border: none;
-    min-height: 60px;
-}
-QFrame#toolbar QLabel {
-    color: #ffffff;
-    background: transparent;
+# Extensions whose contents are searched when content search is enabled.
+TEXT_EXTS = {
+    ".txt",".py",".js",".ts",".jsx",".tsx",".html",".htm",".css",
+    ".scss",".json",".xml",".yaml",".yml",".md",".rst",".toml",
+    ".ini",".cfg",".conf",".sh",".bash",".zsh",".c",".cpp",".h",
+    ".hpp",".java",".kt",".go",".rs",".rb",".php",".swift",".r",
+    ".sql",".log",".csv",".env",".tf",".ipynb",".lua",".dart",
+    ".vue",".svelte",".fish",".ps1",".bat",".cmd",
 }
 
-/* ─── FILTER PANEL ──────────────────────────────────────── */
-QFrame#filterPanel {
-    background: #f7f8fc;
-    border-bottom: 2px solid #e5e7eb;
-}
 
-/* ─── INPUTS ────────────────────────────────────────────── */
-QLineEdit {
-    background: #ffffff;
-    border: 2px solid #e5e7eb;
-    border-radius: 8px;
-    color: #1a1a2e;
-    padding: 7px 12px;
-    font-size: 13px;
-    selection-background-color: #c7d2fe;
-    selection-color: #1a1a2e;
-}
-QLineEdit:focus {
-    border-color: #6366f1;
-    background: #fafafe;
-}
-QLineEdit::placeholder {
-    color: #9ca3af;
-}
+# ══════════════════════════════════════════════════════════════
+#  IGNORE RULES
+# ══════════════════════════════════════════════════════════════
+IGNORE_FILES = (".gitignore", ".ignore")
+
+def _glob_regex(glob):
+    """Translate one gitignore glob, without leading or trailing slashes,
+    to a regex over ``/``-separated relative paths."""
+    out, i, n = [], 0, len(glob)
+    while i < n:
+        ch = glob[i]
+        if glob.startswith("**/", i):
+            out.append("(?:.*/)?"); i += 3; continue
+        if glob.startswith("**", i):
+            out.append(".*"); i += 2; continue
+        if ch == "*":
+            out.append("[^/]*")
+        elif ch == "?":
+            out.append("[^/]")
+        elif ch == "[" and glob.find("]", i + 2) > 0:
+            j = glob.find("]", i + 2)
+            body = glob[i + 1:j].replace("\\", "\\\\")
+            out.append("[" + ("^" + body[1:] if body.startswith("!") else body) + "]")
+            i = j + 1; continue
+        elif ch == "\\" and i + 1 < n:
+            out.append(re.escape(glob[i + 1])); i += 2; continue
+        else:
+            out.append(re.escape(ch))
+        i += 1
+    return "".join(out)
+
+def _parse_rule(line):
+    """Return ``(regex, negated, dir_only, anchored)`` for one ignore-file
+    line, or None. Unanchored rules match the entry's name alone."""
+    line = re.sub(r"(?<!\\) +$", "", line.rstrip("\r\n"))
+    if not line or line.startswith("#"): return None
+    negated = line.startswith("!")
+    if negated: line = line[1:]
+    dir_only = line.endswith("/")
+    line = line.rstrip("/")
+    if not line: return None
+    # A slash anywhere but the end ties the pattern to the ignore file's
+    # directory; otherwise it matches a name at any depth below it.
+    anchored = "/" in line
+    return "(?:" + _glob_regex(line.lstrip("/")) + ")$", negated, dir_only, anchored
+
+
+class _RuleSet:
+    """The compiled rules of one ignore file (or of the exclude list)."""
+    __slots__ = ("base", "rules", "name_rx", "path_rx")
+    FLAGS = re.IGNORECASE if os.name == "nt" else 0
+
+    def __init__(self, base, lines):
+        self.base = base.rstrip(os.sep) + os.sep
+        rules = [r for r in map(_parse_rule, lines) if r]
+        self.rules, self.name_rx, self.path_rx = None, (None, None), (None, None)
+        if any(r[1] for r in rules):
+            # Later rules override earlier ones, so they are tried in turn.
+            self.rules = [(re.compile(rx, self.FLAGS), neg, d, a) for rx, neg, d, a in rules]
+            return
+        # Without negations any hit decides, so each kind of rule is one
+        # alternation: (files, directories) over names and over paths.
+        def combine(anchored, dirs):
+            rx = [r[0] for r in rules if r[3] == anchored and (dirs or not r[2])]
+            return re.compile("|".join(rx), self.FLAGS) if rx else None
+        self.name_rx = combine(False, False), combine(False, True)
+        self.path_rx = combine(True, False), combine(True, True)
+
+    def __bool__(self): return bool(self.rules or self.name_rx[1] or self.path_rx[1])
+
+    def match(self, path, is_dir, name=None):
+        """True if the rules ignore *path*, False if they re-include it,
+        None if no rule applies. *name* saves splitting it off *path*."""
+        if name is None: name = os.path.basename(path)
+        rel = None
+        if self.rules is None:
+            rx = self.name_rx[is_dir]
+            if rx is not None and rx.match(name): return True
+            rx = self.path_rx[is_dir]
+            if rx is None: return None
+            rel = path[len(self.base):]
+            if os.sep != "/": rel = rel.replace(os.sep, "/")
+            return True if rx.match(rel) else None
+        for rx, negated, dir_only, anchored in reversed(self.rules):
+            if dir_only and not is_dir: continue
+            if anchored and rel is None:
+                rel = path[len(self.base):]
+                if os.sep != "/": rel = rel.replace(os.sep, "/")
+            if rx.match(rel if anchored else name): return not negated
+        return None
+
+
+class IgnoreRules:
+    """Exclude globs and, optionally, ignore files for one search root.
+
+    Both use gitignore syntax: ``node_modules`` ignores that name at any
+    depth, ``build/`` only directories, ``/dist`` or ``docs/*.pdf`` paths
+    relative to where the rule is written, ``!keep.log`` re-includes. The
+    excludes are relative to *root* and always win. With *ignore_files*,
+    each directory's ``.gitignore`` and ``.ignore`` apply below it, deeper
+    files taking precedence, along with those of the enclosing git
+    repository above *root*. Each directory's files are read and compiled
+    once per instance.
+    """
+
+    def __init__(self, root, excludes=(), ignore_files=False):
+        self.root         = root
+        self._prefix      = root.rstrip(os.sep) + os.sep
+        self.key          = (tuple(excludes), bool(ignore_files))
+        self.ignore_files = ignore_files
+        self._excludes    = _RuleSet(root, excludes)
+        self._scopes      = {}   # directory -> tuple of _RuleSets, outermost first
+        self._hidden      = {}   # directory -> whether it or a parent is ignored
+
+    def _read(self, folder):
+        if not self.ignore_files: return ()
+        lines = []
+        for name in IGNORE_FILES:
+            try:
+                with open(os.path.join(folder, name), encoding="utf-8", errors="ignore") as fh:
+                    lines += fh.readlines()
+            except OSError:
+                pass
+        rules = _RuleSet(folder, lines)
+        return (rules,) if rules else ()
+
+    def _repo_scope(self):
+        """Rules from ignore files between *root* and its git repository's top."""
+        if not self.ignore_files: return ()
+        folders, path = [], os.path.dirname(self.root)
+        while True:
+            folders.append(path)
+            if os.path.exists(os.path.join(path, ".git")): break
+            parent = os.path.dirname(path)
+            if parent == path: return ()
+            path = parent
+        return sum((self._read(f) for f in reversed(folders)), ())
+
+    def scope(self, folder):
+        """Return the ignore-file rules that apply to entries of *folder*."""
+        scope = self._scopes.get(folder)
+        if scope is None:
+            parent = os.path.dirname(folder)
+            if folder == self.root or parent == folder or not folder.startswith(self._prefix):
+                scope = self._repo_scope()
+            else:
+                scope = self.scope(parent)
+            scope = self._scopes[folder] = scope + self._read(folder)
+        return scope
+
+    def ignored(self, path, is_dir, scope=None, name=None):
+        """True if the entry *path* is excluded; *scope* is its directory's."""
+        hit = self._excludes.match(path, is_dir, name) if self._excludes else None
+        if hit is not None: return hit
+        if scope is None: scope = self.scope(os.path.dirname(path))
+        for rules in reversed(scope):
+            hit = rules.match(path, is_dir, name)
+            if hit is not None: return hit
+        return False
+
+    def hidden(self, folder):
+        """True if *folder* is below *root* and it or any parent is ignored."""
+        hit = self._hidden.get(folder)
+        if hit is None:
+            parent = os.path.dirname(folder)
+            if folder == self.root or parent == folder or not folder.startswith(self._prefix):
+                hit = False
+            else:
+                hit = self.hidden(parent) or self.ignored(folder, True)
+            self._hidden[folder] = hit
+        return hit
 
-/* ─── BUTTONS ───────────────────────────────────────────── */
-QPushButton {
-    background: #ffffff;
-    border: 2px solid #e5e7eb;
-    border-radius: 8px;
-    color: #374151;
-    padding: 7px 16px;
-    font-size: 12px;
-    font-weight: 600;
-    min-width: 80px;
-    min-height: 34px;
-}
-QPushButton:hover {
-    border-color: #6366f1;
-    color: #6366f1;
-    background: #eef2ff;
-}
-QPushButton:pressed {
-    background: #e0e7ff;
-    border-color: #4f46e5;
-    color: #4f46e5;
-}
+def ignore_rules(config):
+    """Return the ``IgnoreRules`` for *config*'s folder, or None if it has none."""
+    if not (config["excludes"] or config["ignore_files"]): return None
+    return IgnoreRules(config["folder"], config["excludes"], config["ignore_files"])
 
-/* primary / accent */
-QPushButton#accentBtn {
-    background: #ffffff;
-    border: 2px solid #ffffff;
-    border-radius: 8px;
-    color: #4f46e5;
-    font-size: 13px;
-    font-weight: 700;
-    min-width: 150px;
-    min-height: 38px;
-    padding: 6px 20px;
-}
-QPushButton#accentBtn:hover {
-    background: #eef2ff;
-    border-color: #e0e7ff;
-    color: #3730a3;
-}
-QPushButton#accentBtn:pressed {
-    background: #e0e7ff;
-    color: #3730a3;
-}
 
-/* danger */
-QPushButton#dangerBtn {
-    color: #dc2626;
-    border-color: #fecaca;
-    background: #fff5f5;
-    min-width: 80px;
-}
-QPushButton#dangerBtn:hover {
-    background: #fee2e2;
-    border-color: #f87171;
-}
+# ══════════════════════════════════════════════════════════════
+#  FILE WALKER
+# ══════════════════════════════════════════════════════════════
+def walk_files(folder, stats=None, abort=None, on_dir=None, ignore=None):
+    """Yield ``(root, DirEntry)`` for every file under *folder*.
+
+    Traversal is top-down in the same order as ``os.walk`` and skips hidden
+    directories. Entries are yielded as each directory is read, so matching
+    overlaps with the walk, and callers can reuse ``DirEntry.stat()`` instead
+    of calling ``os.stat`` again. When *stats* is given, its ``"files"`` and
+    ``"dirs"`` counters are updated as the walk proceeds. *on_dir* is called
+    with each directory's path before any of its files are yielded.
+    With *ignore* (``IgnoreRules``), ignored directories are never entered
+    and ignored files never yielded; ``"pruned"`` and ``"ignored"`` count
+    them.
+    """
+    if stats is None: stats = {}
+    for k in ("files", "dirs", "pruned", "ignored"): stats.setdefault(k, 0)
+    stack = [folder]
+    while stack:
+        if abort and abort(): return
+        root = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(root) as it:
+                stats["dirs"] += 1
+                if on_dir: on_dir(root)
+                scope = ignore.scope(root) if ignore else None
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        if not entry.name.startswith(".") and not entry.is_symlink():
+                            if ignore and ignore.ignored(entry.path, True, scope, entry.name):
+                                stats["pruned"] += 1
+                            else:
+                                subdirs.append(entry.path)
+                        continue
+                    if ignore and ignore.ignored(entry.path, False, scope, entry.name):
+                        stats["ignored"] += 1; continue
+                    stats["files"] += 1
+                    yield root, entry
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+
+def list_dir(path, ignore=None):
+    """Return ``(files, subdirs)``, the paths directly inside *path*.
+
+    Both follow the same skip rules as ``walk_files``, and are empty if
+    *path* cannot be read.
+    """
+    files, subdirs = [], []
+    scope = ignore.scope(path) if ignore else None
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if ignore and ignore.ignored(entry.path, is_dir, scope, entry.name):
+                    continue
+                if not is_dir:
+                    files.append(entry.path)
+                elif not entry.name.startswith(".") and not entry.is_symlink():
+                    subdirs.append(entry.path)
+    except OSError:
+        pass
+    return files, subdirs
+
+def walk_dirs(folder, abort=None, ignore=None):
+    """Return ``{path: st_mtime_ns}`` for *folder* and every directory
+    ``walk_files`` would enter under it."""
+    mtimes, stack = {}, [folder]
+    while stack:
+        if abort and abort(): break
+        path = stack.pop()
+        try:
+            mtimes[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            continue
+        stack.extend(list_dir(path, ignore)[1])
+    return mtimes
+
+def poll_changes(mtimes):
+    """Return the paths in *mtimes* whose ``st_mtime_ns`` has changed or
+    that have gone, updating *mtimes* to match.
+
+    A value of None records the path's current mtime without reporting it.
+    """
+    changed = []
+    for path, old in list(mtimes.items()):
+        try:
+            now = os.stat(path).st_mtime_ns
+        except OSError:
+            del mtimes[path]; changed.append(path); continue
+        if now != old:
+            mtimes[path] = now
+            if old is not None: changed.append(path)
+    return changed
 
-/* toggle buttons — mint when off, indigo when on */
-QPushButton#toggleBtn {
-    min-width: 48px;
-    max-width: 58px;
-    min-height: 34px;
-    padding: 6px 8px;
-    font-size: 13px;
-    font-weight: 800;
-    letter-spacing: 0;
-    background: #f0fdf4;
-    border: 2px solid #bbf7d0;
-    color: #15803d;
-    border-radius: 8px;
-}
-QPushButton#toggleBtn:hover {
-    background: #dcfce7;
-    border-color: #86efac;
-}
-QPushButton#toggleBtn:checked {
-    background: #6366f1;
-    border-color: #6366f1;
-    color: #ffffff;
-}
-QPushButton#toggleBtn:checked:hover {
-    background: #4f46e5;
-    border-color: #4f46e5;
-}
 
-/* ─── COMBOBOX ──────────────────────────────────────────── */
-QComboBox {
-    background: #ffffff;
-    border: 2px solid #e5e7eb;
-    border-radius: 8px;
-    color: #1a1a2e;
-    padding: 6px 10px;
-    font-size: 12px;
-    min-width: 120px;
-    min-height: 34px;
-}
-QComboBox:hover { border-color: #6366f1; }
-QComboBox:focus { border-color: #6366f1; }
-QComboBox::drop-down { border: none; width: 22px; }
-QComboBox QAbstractItemView {
-    background: #ffffff;
-    border: 2px solid #c7d2fe;
-    border-radius: 8px;
-    color: #1a1a2e;
-    selection-background-color: #e0e7ff;
-    selection-color: #4f46e5;
-    outline: none;
-    padding: 4px;
-}
+# ══════════════════════════════════════════════════════════════
+#  FILE INDEX
+# ══════════════════════════════════════════════════════════════
+INDEX_DIR = os.path.join(os.path.expanduser("~"), ".finderplus", "index")
+
+
+def index_db_path(root, index_dir=INDEX_DIR, suffix=""):
+    """Return the database path used to index *root*, creating *index_dir*."""
+    root = os.path.normcase(os.path.abspath(root))
+    key  = hashlib.sha1(root.encode("utf-8")).hexdigest()[:16]
+    os.makedirs(index_dir, exist_ok=True)
+    return os.path.join(index_dir, f"{key}{suffix}.db")
+
+
+class IndexedStat:
+    __slots__ = ("st_size", "st_mtime")
+
+    def __init__(self, size, mtime):
+        self.st_size = size; self.st_mtime = mtime
+
+
+class IndexedEntry:
+    """Stand-in for ``os.DirEntry`` backed by a row of the file index.
+
+    A *size* of None means the row was never stat'ed; ``stat()`` then goes
+    to disk.
+    """
+    __slots__ = ("name", "path", "_stat")
+
+    def __init__(self, name, path, size, mtime):
+        self.name = name; self.path = path
+        self._stat = IndexedStat(size, mtime) if size is not None else None
+
+    def stat(self): return self._stat if self._stat is not None else os.stat(self.path)
+
+
+class FileIndex:
+    """Opt-in, per-root SQLite index of file names, sizes and mtimes.
+
+    The index lives under ``INDEX_DIR`` and is only touched when a search
+    asks for it: there is no watcher or background refresh. ``refresh()``
+    is incremental. A directory whose mtime is unchanged is not listed
+    again: its known files are re-stat'ed, so edits made in place are
+    picked up, and only rows whose size or mtime changed are rewritten.
+    Its known subdirectories are checked too, because a directory's
+    mtime says nothing about changes further down. ``refresh(full=True)``
+    lists every directory again.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS dirs (
+            id       INTEGER PRIMARY KEY,
+            path     TEXT UNIQUE NOT NULL,
+            parent   INTEGER,
+            mtime_ns INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS files (
+            dir_id   INTEGER NOT NULL,
+            name     TEXT NOT NULL,
+            ext      TEXT NOT NULL,
+            size     INTEGER NOT NULL,
+            mtime    REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS files_dir  ON files(dir_id);
+        CREATE INDEX IF NOT EXISTS dirs_parent ON dirs(parent);
+        CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+    """
+
+    def __init__(self, root, index_dir=INDEX_DIR):
+        self.root = os.path.abspath(root)
+        self.db_path = index_db_path(self.root, index_dir)
+        self.db = sqlite3.connect(self.db_path)
+        self.db.executescript(self.SCHEMA)
+
+    def close(self): self.db.close()
+
+    def is_built(self):
+        row = self.db.execute("SELECT value FROM meta WHERE key = 'refreshed'").fetchone()
+        return row is not None
+
+    def refresh(self, full=False, stats=None, abort=None):
+        """Bring the index in line with the disk; returns ``stats``.
+
+        ``stats`` gains ``"rescanned"`` and ``"unchanged"`` directory counts
+        and an ``"updated"`` count of files edited in place, alongside the
+        usual ``"files"`` and ``"dirs"`` counters.
+        """
+        if stats is None: stats = {}
+        for k in ("files", "dirs", "rescanned", "unchanged", "updated"): stats.setdefault(k, 0)
+        db    = self.db
+        known = {p: (i, m) for i, p, m in db.execute("SELECT id, path, mtime_ns FROM dirs")}
+        seen  = set()
+        stack = [(self.root, None)]
+        with db:
+            while stack:
+                if abort and abort(): return stats
+                path, parent = stack.pop()
+                try:
+                    mtime_ns = os.stat(path).st_mtime_ns
+                except OSError:
+                    continue
+                stats["dirs"] += 1
+                rec = known.get(path)
+                if rec and rec[1] == mtime_ns and not full:
+                    dir_id = rec[0]; seen.add(dir_id)
+                    stats["unchanged"] += 1
+                    self._restat(dir_id, path, stats)
+                    subdirs = [p for (p,) in db.execute(
+                        "SELECT path FROM dirs WHERE parent = ? ORDER BY path DESC", (dir_id,))]
+                    stack.extend((p, dir_id) for p in subdirs)
+                    continue
+
+                rows, subdirs = [], []
+                try:
+                    with os.scandir(path) as it:
+                        for entry in it:
+                            try:
+                                if entry.is_dir():
+                                    if not entry.name.startswith(".") and not entry.is_symlink():
+                                        subdirs.append(entry.path)
+                                    continue
+                                st = entry.stat()
+                            except OSError:
+                                continue
+                            rows.append((entry.name, Path(entry.name).suffix.lower(),
+                                         st.st_size, st.st_mtime))
+                except OSError:
+                    continue
+                if rec:
+                    dir_id = rec[0]
+                    db.execute("UPDATE dirs SET parent = ?, mtime_ns = ? WHERE id = ?",
+                               (parent, mtime_ns, dir_id))
+                    db.execute("DELETE FROM files WHERE dir_id = ?", (dir_id,))
+                else:
+                    dir_id = db.execute("INSERT INTO dirs (path, parent, mtime_ns) VALUES (?, ?, ?)",
+                                        (path, parent, mtime_ns)).lastrowid
+                db.executemany("INSERT INTO files (dir_id, name, ext, size, mtime) VALUES (?, ?, ?, ?, ?)",
+                               [(dir_id,) + r for r in rows])
+                seen.add(dir_id)
+                stats["rescanned"] += 1
+                stats["files"] += len(rows)
+                stack.extend((p, dir_id) for p in reversed(subdirs))
+
+            gone = [i for i, _ in known.values() if i not in seen]
+            db.executemany("DELETE FROM files WHERE dir_id = ?", [(i,) for i in gone])
+            db.executemany("DELETE FROM dirs WHERE id = ?", [(i,) for i in gone])
+            db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('refreshed', ?)",
+                       (datetime.now().isoformat(timespec="seconds"),))
+        return stats
+
+    def _restat(self, dir_id, path, stats):
+        """Re-stat the known files of the unchanged directory *dir_id* and
+        rewrite the rows of those edited in place."""
+        changed = []
+        rows = self.db.execute(
+            "SELECT rowid, name, size, mtime FROM files WHERE dir_id = ?", (dir_id,)).fetchall()
+        for rowid, name, size, mtime in rows:
+            try:
+                st = os.stat(os.path.join(path, name))
+            except OSError:
+                continue
+            if st.st_size != size or st.st_mtime != mtime:
+                changed.append((st.st_size, st.st_mtime, rowid))
+        self.db.executemany("UPDATE files SET size = ?, mtime = ? WHERE rowid = ?", changed)
+        stats["files"] += len(rows)
+        stats["updated"] += len(changed)
+
+    def entries(self, types=None, min_size=None, max_size=None,
+                start_dt=None, end_dt=None, stats=None, ignore=None):
+        """Yield ``(root, IndexedEntry)`` for indexed files passing the filters.
+
+        Size and date bounds use the same units as the search config (KB and
+        ``datetime``). Plain ``.ext`` type filters are answered by the ``ext``
+        column; anything else is left to the caller's own suffix check. The
+        index holds every file, so *ignore* rules are applied to its rows.
+        """
+        if stats is None: stats = {}
+        for k in ("files", "dirs", "pruned", "ignored"): stats.setdefault(k, 0)
+        where, args = [], []
+        if types and all(t.startswith(".") and t.count(".") == 1 for t in types):
+            where.append(f"f.ext IN ({','.join('?' * len(types))})")
+            args += [t.lower() for t in types]
+        if min_size: where.append("f.size >= ?");  args.append(min_size * 1024)
+        if max_size: where.append("f.size <= ?");  args.append(max_size * 1024)
+        if start_dt: where.append("f.mtime >= ?"); args.append(start_dt.timestamp())
+        if end_dt:   where.append("f.mtime <= ?"); args.append(end_dt.timestamp())
+        sql = ("SELECT d.path, f.name, f.size, f.mtime FROM files f "
+               "JOIN dirs d ON d.id = f.dir_id")
+        if where: sql += " WHERE " + " AND ".join(where)
+        seen, pruned = set(), set()
+        for root, name, size, mtime in self.db.execute(sql, args):
+            path = os.path.join(root, name)
+            if ignore:
+                if ignore.hidden(root):
+                    if root not in seen:
+                        seen.add(root)
+                        top = root
+                        while ignore.hidden(os.path.dirname(top)): top = os.path.dirname(top)
+                        pruned.add(top); stats["pruned"] = len(pruned)
+                    continue
+                if ignore.ignored(path, False):
+                    stats["ignored"] += 1; continue
+            stats["files"] += 1
+            yield root, IndexedEntry(name, path, size, mtime)
+
+
+class TrigramIndex:
+    """Per-root, persisted trigram index over the contents of text files.
+
+    Each file is lowercased (the same folding content search uses) and
+    broken into UTF-8 byte trigrams. A query's required literals give a set
+    of trigrams, and only files containing all of them can match. Those
+    files are then verified with ``scan_content``; the index only narrows,
+    it never decides a match on its own.
+
+    Files are keyed by path and trusted only while their ``(size, mtime)``
+    still matches. A file that is new or has changed is re-indexed while it
+    is searched, while it is hot in the page cache; it gets a fresh id,
+    so postings left behind by its old version simply stop matching.
+
+    Postings are written in segments, one row per trigram holding a packed
+    array of file ids, because a row per (trigram, file) pair makes the
+    first build insert-bound. ``compact()`` merges segments and drops dead
+    ids; it runs on an explicit refresh.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS docs (
+            id    INTEGER PRIMARY KEY AUTOINCREMENT,
+            path  TEXT UNIQUE NOT NULL,
+            size  INTEGER NOT NULL,
+            mtime REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS segments (id INTEGER PRIMARY KEY AUTOINCREMENT);
+        CREATE TABLE IF NOT EXISTS postings (
+            tri  INTEGER NOT NULL,
+            seg  INTEGER NOT NULL,
+            docs BLOB NOT NULL,
+            PRIMARY KEY (tri, seg)
+        ) WITHOUT ROWID;
+    """
+    FLUSH_POSTINGS = 4_000_000   # buffered (trigram, file) pairs per segment
+    MAX_BYTES      = 5 * 1024 * 1024   # larger files are always scanned
+
+    def __init__(self, root, index_dir=INDEX_DIR):
+        self.root = os.path.abspath(root)
+        self.db_path = index_db_path(self.root, index_dir, "-trigrams")
+        self.db = sqlite3.connect(self.db_path)
+        self.db.executescript(self.SCHEMA)
+        self.docs = {p: (i, sz, mt) for i, p, sz, mt in
+                     self.db.execute("SELECT id, path, size, mtime FROM docs")}
+        self._buf, self._buffered = {}, 0
+
+    def close(self):
+        self._flush()
+        self.db.commit(); self.db.close()
+
+    def is_current(self, path, size, mtime):
+        doc = self.docs.get(path)
+        return doc is not None and doc[1] == size and doc[2] == mtime
+
+    def add(self, path, size, mtime):
+        """(Re-)index the contents of *path*."""
+        text = read_text(path)
+        tris = trigrams(text.lower())
+        if path in self.docs:
+            self.db.execute("DELETE FROM docs WHERE path = ?", (path,))
+        doc_id = self.db.execute("INSERT INTO docs (path, size, mtime) VALUES (?, ?, ?)",
+                                 (path, size, mtime)).lastrowid
+        self.docs[path] = (doc_id, size, mtime)
+        buf = self._buf
+        for t in tris:
+            ids = buf.get(t)
+            if ids is None: buf[t] = ids = array("I")
+            ids.append(doc_id)
+        self._buffered += len(tris)
+        if self._buffered >= self.FLUSH_POSTINGS: self._flush()
+
+    def _flush(self):
+        if not self._buf: return
+        seg = self.db.execute("INSERT INTO segments DEFAULT VALUES").lastrowid
+        self.db.executemany("INSERT INTO postings (tri, seg, docs) VALUES (?, ?, ?)",
+                            ((t, seg, ids.tobytes()) for t, ids in self._buf.items()))
+        self._buf, self._buffered = {}, 0
+
+    def prune(self):
+        """Drop files that no longer exist, then compact the postings."""
+        gone = [p for p in self.docs if not os.path.exists(p)]
+        self.db.executemany("DELETE FROM docs WHERE path = ?", [(p,) for p in gone])
+        for p in gone: del self.docs[p]
+        self.compact()
+
+    def compact(self):
+        """Merge all segments into one, dropping ids of dead files."""
+        self._flush()
+        live = {d[0] for d in self.docs.values()}
+        db   = self.db
+        seg  = db.execute("INSERT INTO segments DEFAULT VALUES").lastrowid
+        merged, cur, ids = [], None, array("I")
+        for tri, blob in db.execute("SELECT tri, docs FROM postings ORDER BY tri").fetchall():
+            if tri != cur:
+                if ids: merged.append((cur, seg, ids.tobytes()))
+                cur, ids = tri, array("I")
+            a = array("I"); a.frombytes(blob)
+            ids.extend(d for d in a if d in live)
+        if ids: merged.append((cur, seg, ids.tobytes()))
+        db.execute("DELETE FROM postings")
+        db.execute("DELETE FROM segments WHERE id <> ?", (seg,))
+        db.executemany("INSERT INTO postings (tri, seg, docs) VALUES (?, ?, ?)", merged)
+        db.commit()
+
+    def candidates(self, query, is_regex):
+        """Return the ids of indexed files that may match, or ``None``.
+
+        ``None`` means the query has no literal of three or more characters
+        that every match must contain, so the index cannot narrow anything.
+        """
+        literals = required_literals(query) if is_regex else [query]
+        tris = set()
+        for lit in literals:
+            tris |= trigrams(lit.lower())
+        if not tris: return None
+        result = {d[0] for d in self.docs.values()}
+        for t in tris:
+            found = set()
+            for (blob,) in self.db.execute("SELECT docs FROM postings WHERE tri = ?", (t,)):
+                a = array("I"); a.frombytes(blob); found.update(a)
+            result &= found
+            if not result: break
+        return result
+
+
+def trigrams(text):
+    """Return the distinct UTF-8 byte trigrams of *text* as integers."""
+    data = text.encode("utf-8")
+    return {(a << 16) | (b << 8) | c for a, b, c in set(zip(data, data[1:], data[2:]))}
+
+
+def required_literals(pattern):
+    """Return literal runs that every match of regex *pattern* must contain.
+
+    Only the top-level sequence is considered: literals are joined until
+    something that is not a plain character (a class, an optional item, an
+    alternation) breaks the run. Groups and repeats with a minimum of one
+    are required too, so their own literal runs are collected separately.
+    """
+    try:
+        parsed = sre_parse.parse(pattern)
+    except Exception:
+        return []
+    runs = []
+    def walk(items):
+        run = []
+        for op, av in items:
+            if op is sre_constants.LITERAL:
+                run.append(chr(av)); continue
+            runs.append("".join(run)); run = []
+            if op is sre_constants.SUBPATTERN:
+                walk(av[-1])
+            elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT) and av[0] >= 1:
+                walk(av[2])
+        runs.append("".join(run))
+    walk(parsed)
+    return [r for r in runs if len(r) >= 3]
 
-/* ─── SPINBOX ───────────────────────────────────────────── */
-QSpinBox {
-    background: #ffffff;
-    border: 2px solid #e5e7eb;
-    border-radius: 8px;
-    color: #1a1a2e;
-    padding: 5px 8px;
-    min-height: 32px;
-}
-QSpinBox:focus { border-color: #6366f1; }
-QSpinBox::up-button, QSpinBox::down-button {
-    border: none; background: transparent; width: 16px;
-}
 
-/* ─── TREE ──────────────────────────────────────────────── */
-QTreeWidget {
-    background: #ffffff;
-    border: 2px solid #e5e7eb;
-    border-radius: 10px;
-    alternate-background-color: #f9fafb;
-    show-decoration-selected: 1;
-    outline: none;
-}
-QTreeWidget::item {
-    padding: 5px 8px;
-    border-radius: 6px;
-    margin: 1px 4px;
-}
-QTreeWidget::item:hover {
-    background: #f0f9ff;
-}
-QTreeWidget::item:selected {
-    background: #e0e7ff;
-    color: #3730a3;
-}
-QTreeWidget::item:selected:hover {
-    background: #c7d2fe;
-}
+# ══════════════════════════════════════════════════════════════
+#  TREE SNAPSHOT
+# ══════════════════════════════════════════════════════════════
+# A snapshot younger than this is trusted without a revalidation pass.
+SNAPSHOT_TTL = 2.0   # seconds
+
+
+class TreeSnapshot:
+    """Compact in-memory copy of one walked folder tree.
+
+    Everything is stored in parallel columns rather than per-file objects:
+    directories are numbered in walk order, and a directory's files occupy
+    one contiguous run of file rows starting at ``dir_first``. Sizes and
+    mtimes are filled in as files are stat'ed; ``-1`` marks a row that has
+    not been stat'ed yet. A snapshot built with *ignore* rules only holds
+    what they let through; ``ignore_key`` tells which rules those were.
+    """
+
+    def __init__(self, root, ignore=None):
+        self.root       = root
+        self.ignore     = ignore
+        self.ignore_key = ignore.key if ignore else None
+        self.pruned     = 0               # directories left out by the rules
+        self.ignored    = 0               # files left out by the rules
+        self.dir_paths  = []              # dir id -> path
+        self.dir_parent = array("i")      # dir id -> parent dir id, -1 for root
+        self.dir_mtime  = array("q")      # dir id -> st_mtime_ns
+        self.dir_first  = array("I")      # dir id -> first file row
+        self.names      = []              # file row -> name
+        self.file_dir   = array("I")      # file row -> dir id
+        self.sizes      = array("q")      # file row -> st_size
+        self.mtimes     = array("d")      # file row -> st_mtime
+        self.complete   = False
+        self.validated  = time.monotonic()
+
+    def __len__(self): return len(self.names)
+
+    def add_dir(self, path, parent, mtime_ns):
+        self.dir_paths.append(path)
+        self.dir_parent.append(parent)
+        self.dir_mtime.append(mtime_ns)
+        self.dir_first.append(len(self.names))
+        return len(self.dir_paths) - 1
+
+    def add_file(self, dir_id, name, size=-1, mtime=-1.0):
+        self.names.append(name); self.file_dir.append(dir_id)
+        self.sizes.append(size); self.mtimes.append(mtime)
+        return len(self.names) - 1
+
+    def _rows(self, dir_id):
+        end = self.dir_first[dir_id + 1] if dir_id + 1 < len(self.dir_first) else len(self.names)
+        return self.dir_first[dir_id], end
+
+    def build(self, stats, abort=None):
+        """Walk ``root``, recording it, and yield ``(root, entry)`` as it goes.
+
+        ``complete`` is only set once the walk has run to the end.
+        """
+        ids = {}
+        def on_dir(path):
+            try:
+                mtime_ns = os.stat(path).st_mtime_ns
+            except OSError:
+                mtime_ns = 0
+            ids[path] = self.add_dir(path, ids.get(os.path.dirname(path), -1), mtime_ns)
+        before = stats.get("pruned", 0), stats.get("ignored", 0)
+        for root, entry in walk_files(self.root, stats, abort, on_dir, self.ignore):
+            row = self.add_file(ids[root], entry.name)
+            yield root, SnapshotEntry(self, row, root, entry)
+        self.pruned, self.ignored = stats["pruned"] - before[0], stats["ignored"] - before[1]
+        self.complete = not (abort and abort())
+        self.validated = time.monotonic()
+
+    def entries(self, stats):
+        """Yield ``(root, entry)`` for every file in the snapshot."""
+        paths, names, file_dir = self.dir_paths, self.names, self.file_dir
+        stats["pruned"] = stats.get("pruned", 0) + self.pruned
+        stats["ignored"] = stats.get("ignored", 0) + self.ignored
+        for row in range(len(names)):
+            stats["files"] += 1
+            yield paths[file_dir[row]], SnapshotEntry(self, row, paths[file_dir[row]])
+
+    def revalidate(self, abort=None):
+        """Return ``(snapshot, changed)`` after checking directory mtimes.
+
+        Directories whose mtime is unchanged keep their rows as they are;
+        changed ones are listed again and new subdirectories are walked.
+        Files edited in place without touching their directory keep their
+        old size and mtime until the next rescan.
+        """
+        children = {}
+        for d, p in enumerate(self.dir_parent):
+            if p >= 0: children.setdefault(p, []).append(d)
+        new, changed = TreeSnapshot(self.root, self.ignore), 0
+        ignore = self.ignore
+        stack = [(0 if self.dir_paths else None, self.root, -1)]
+        while stack:
+            if abort and abort(): return self, 0
+            old_id, path, parent = stack.pop()
+            try:
+                mtime_ns = os.stat(path).st_mtime_ns
+            except OSError:
+                changed += 1; continue
+            nid  = new.add_dir(path, parent, mtime_ns)
+            kids = children.get(old_id, []) if old_id is not None else []
+            if old_id is not None and self.dir_mtime[old_id] == mtime_ns:
+                lo, hi = self._rows(old_id)
+                new.names.extend(self.names[lo:hi])
+                new.file_dir.extend(array("I", [nid]) * (hi - lo))
+                new.sizes.extend(self.sizes[lo:hi]); new.mtimes.extend(self.mtimes[lo:hi])
+                stack.extend((k, self.dir_paths[k], nid) for k in reversed(kids))
+                continue
+            changed += 1
+            known, subdirs = {self.dir_paths[k]: k for k in kids}, []
+            scope = ignore.scope(path) if ignore else None
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        if ignore and ignore.ignored(entry.path, is_dir, scope, entry.name):
+                            continue
+                        if is_dir:
+                            if not entry.name.startswith(".") and not entry.is_symlink():
+                                subdirs.append(entry.path)
+                            continue
+                        new.add_file(nid, entry.name)
+            except OSError:
+                continue
+            stack.extend((known.get(p), p, nid) for p in reversed(subdirs))
+        new.complete = True
+        return new, changed
 
-QHeaderView::section {
-    background: #f1f5f9;
-    border: none;
-    border-bottom: 2px solid #e5e7eb;
-    border-right: 1px solid #e5e7eb;
-    color: #64748b;
-    font-size: 10px;
-    font-weight: 800;
-    letter-spacing: 0.12em;
-    padding: 6px 10px;
-    text-transform: uppercase;
-}
-QHeaderView::section:last { border-right: none; }
-
-/* ─── TEXT EDIT ─────────────────────────────────────────── */
-QTextEdit {
-    background: #f8fafc;
-    border: 2px solid #e5e7eb;
-    border-radius: 10px;
-    color: #1e293b;
-    padding: 10px 12px;
-    font-family: 'Cascadia Code', 'Fira Code', 'JetBrains Mono', 'Consolas', monospace;
-    font-size: 11.5px;
-    selection-background-color: #c7d2fe;
-    selection-color: #1a1a2e;
-}
 
-/* ─── SPLITTER ──────────────────────────────────────────── */
-QSplitter { background: #ffffff; }
-QSplitter::handle { background: #e5e7eb; }
-QSplitter::handle:horizontal { width: 2px; }
-QSplitter::handle:vertical   { height: 2px; }
-QSplitter::handle:hover { background: #6366f1; }
-
-/* ─── SCROLLBARS ────────────────────────────────────────── */
-QScrollBar:vertical {
-    background: #f1f5f9;
-    width: 8px;
-    border-radius: 4px;
-    margin: 4px 2px;
-}
-QScrollBar::handle:vertical {
-    background: #cbd5e1;
-    min-height: 28px;
-    border-radius: 4px;
-}
-QScrollBar::handle:vertical:hover { background: #6366f1; }
-QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0; }
-QScrollBar:horizontal {
-    background: #f1f5f9;
-    height: 8px;
-    border-radius: 4px;
-    margin: 2px 4px;
-}
-QScrollBar::handle:horizontal {
-    background: #cbd5e1;
-    min-width: 28px;
-    border-radius: 4px;
-}
-QScrollBar::handle:horizontal:hover { background: #6366f1; }
-QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal { width: 0; }
-
-/* ─── STATUS BAR ────────────────────────────────────────── */
-QStatusBar {
-    background: #f1f5f9;
-    border-top: 1px solid #e5e7eb;
-    color: #64748b;
-    font-size: 11px;
-    padding: 2px 10px;
-}
-QStatusBar::item { border: none; }
-
-/* ─── PROGRESS BAR ──────────────────────────────────────── */
-QProgressBar {
-    background: #e5e7eb;
-    border: none;
-    border-radius: 2px;
-    height: 4px;
-    max-height: 4px;
-    color: transparent;
-}
-QProgressBar::chunk {
-    background: qlineargradient(x1:0,y1:0,x2:1,y2:0,
-        stop:0 #6366f1, stop:0.5 #a78bfa, stop:1 #38bdf8);
-    border-radius: 2px;
-}
+class SnapshotEntry:
+    """``DirEntry`` stand-in for one file row of a ``TreeSnapshot``.
 
-/* ─── MENU ──────────────────────────────────────────────── */
-QMenu {
-    background: #ffffff;
-    border: 2px solid #e5e7eb;
-    border-radius: 10px;
-    color: #1a1a2e;
-    padding: 5px;
-}
-QMenu::item {
-    padding: 7px 20px 7px 12px;
-    border-radius: 6px;
-    font-size: 12px;
-}
-QMenu::item:selected {
-    background: #e0e7ff;
-    color: #4f46e5;
-}
-QMenu::separator { height: 1px; background: #e5e7eb; margin: 4px 0; }
-
-/* ─── LABELS ────────────────────────────────────────────── */
-QLabel#appTitle {
-    font-size: 18px;
-    font-weight: 800;
-    color: #ffffff;
-    letter-spacing: 0.02em;
-}
-QLabel#appSubtitle {
-    font-size: 11px;
-    color: #c7d2fe;
-    letter-spacing: 0.04em;
-}
-QLabel#sectionLabel {
-    color: #6b7280;
-    font-size: 10px;
-    font-weight: 800;
-    letter-spacing: 0.14em;
-}
-QLabel#statAccent {
-    color: #6366f1;
-    font-size: 11px;
-    font-weight: 700;
-}
-QLabel#statMuted {
-    color: #9ca3af;
-    font-size: 11px;
-}
-QLabel#folderLabel {
-    color: #e0e7ff;
-    font-size: 12px;
-}
+    ``stat()`` answers from the snapshot's columns when it can and records
+    the result when it has to go to disk, so each file is stat'ed at most
+    once per snapshot.
+    """
+    __slots__ = ("snap", "row", "name", "path", "_entry")
 
-/* ─── COLORED SECTION TAGS ──────────────────────────────── */
-QLabel#tagMint {
-    background: #d1fae5;
-    color: #065f46;
-    border-radius: 5px;
-    padding: 2px 8px;
-    font-size: 10px;
-    font-weight: 800;
-    letter-spacing: 0.1em;
-}
-QLabel#tagSky {
-    background: #dbeafe;
-    color: #1e40af;
-    border-radius: 5px;
-    padding: 2px 8px;
-    font-size: 10px;
-    font-weight: 800;
-    letter-spacing: 0.1em;
-}
-"""
+    def __init__(self, snap, row, root, entry=None):
+        self.snap = snap; self.row = row; self._entry = entry
+        self.name = snap.names[row]
+        self.path = entry.path if entry is not None else os.path.join(root, self.name)
+
+    def stat(self):
+        snap, row = self.snap, self.row
+        if snap.sizes[row] >= 0:
+            return IndexedStat(snap.sizes[row], snap.mtimes[row])
+        st = self._entry.stat() if self._entry is not None else os.stat(self.path)
+        snap.sizes[row] = st.st_size; snap.mtimes[row] = st.st_mtime
+        return st
 
 
 # ══════════════════════════════════════════════════════════════
-#  SEARCH WORKER
+#  SEARCH ENGINE
 # ══════════════════════════════════════════════════════════════
-class SearchWorker(QThread):
-    result_ready = Signal(list)
-    progress     = Signal(int)
-    status_msg   = Signal(str)
-    finished     = Signal(int, float)
-
-    def __init__(self, config):
-        super().__init__()
-        from PySide6.QtWidgets import QStyle
-        # inside __init__, after super().__init__():
-        self.setWindowIcon(self.style().standardIcon(QStyle.SP_FileDialogContentsView))
-        self.config = config
-        self._abort = False
+DEFAULT_CONFIG = dict(
+    folder="", query="", types=[], start_dt=None, end_dt=None,
+    fuzzy=False, fuzzy_threshold=60, regex=False, case_sensitive=False,
+    search_content=False, content_workers=1, content_max_mb=0,
+    readahead=0, readahead_mb=64,   # read-ahead only pays off on cold or network storage
+    use_index=False, refresh_index=False, min_size=None, max_size=None,
+    sort_by="Relevance", max_results=5000, refine_from=None, snapshot=None,
+    paths=None, roots=None, excludes=[], ignore_files=False, duplicates=False,
+    lines=False, context_lines=0, max_lines=100, keep_results=True, terms=[],
+)
+
+# What every Search counts and times; see Search.report().
+COUNTERS = ("dirs", "files", "stat_calls", "skipped_type", "skipped_name",
+            "skipped_unreadable", "skipped_size", "skipped_date", "skipped_not_text",
+            "skipped_too_big", "skipped_trigram", "skipped_ignored", "pruned_dirs",
+            "content_scanned", "content_bytes")
+PHASES   = ("walk", "stat", "match", "content", "sort")
+
+def make_config(folder, **options):
+    """Return a search config for *folder*, with *options* over the defaults."""
+    c = dict(DEFAULT_CONFIG, folder=os.path.abspath(folder))
+    c.update(options)
+    return c
+
+
+class Result:
+    """One matching file.
+
+    A search can hold ``2 * max_results`` of these at once, so they are kept
+    small: ``folder`` is shared by every file of a folder, ``mtime`` is the
+    raw ``st_mtime`` float, and ``full_path``, ``rel_path`` and ``ext`` are
+    worked out when asked for. ``size`` and ``mtime`` are None until the
+    file is stat'ed; see ``fill_stat``. A file that could not be stat'ed
+    then is ``missing``.
+    """
+    __slots__ = ("name", "folder", "root", "size", "mtime", "score", "name_matched",
+                 "content_matches", "lines", "line_count", "terms", "dup_group")
+
+    def __init__(self, name, folder, root, size=None, mtime=None, score=100,
+                 name_matched=True, content_matches=(), lines=None, line_count=0, terms=None):
+        self.name = name; self.folder = folder; self.root = root
+        self.size = size; self.mtime = mtime
+        self.score = score; self.name_matched = name_matched
+        self.content_matches = content_matches
+        self.lines = lines; self.line_count = line_count
+        self.terms = terms   # {term: occurrences} in a multi-term search
+        self.dup_group = None
+
+    @property
+    def full_path(self): return os.path.join(self.folder, self.name)
+
+    @property
+    def rel_path(self):
+        folder, root = self.folder, self.root
+        if folder == root: return self.name
+        if folder.startswith(root) and folder[len(root)] == os.sep:
+            return os.path.join(folder[len(root) + 1:], self.name)
+        return os.path.relpath(self.full_path, root)
+
+    @property
+    def ext(self): return os.path.splitext(self.name)[1].lower()
+
+    @property
+    def missing(self): return self.mtime == STAT_MISSING
+
+    @property
+    def modified(self):
+        """``mtime`` as a local datetime."""
+        return datetime.fromtimestamp(self.mtime)
+
+    def __repr__(self): return f"Result({self.full_path!r})"
+
+
+def path_entries(paths, stats, ignore=None):
+    """Yield ``(root, entry)`` for each of *paths* that is still a file.
+
+    Lets a live update re-check just the files that changed.
+    """
+    for path in paths:
+        if ignore and (ignore.hidden(os.path.dirname(path)) or ignore.ignored(path, False)):
+            continue
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        if not stat.S_ISREG(st.st_mode): continue
+        stats["files"] += 1
+        root, name = os.path.split(path)
+        yield root, IndexedEntry(name, path, st.st_size, st.st_mtime)
+
+def refine_entries(results, stats):
+    """Yield ``(root, entry)`` pairs for a previous result list.
+
+    Lets a refined search run the normal matching loop over the rows it
+    already has instead of over the folder.
+    """
+    for r in results:
+        stats["files"] += 1
+        if r.missing: yield r.folder, IndexedEntry(r.name, r.full_path, None, None)
+        else:         yield r.folder, IndexedEntry(r.name, r.full_path, r.size, r.mtime)
+
+
+class Search:
+    """One search over a config dict, run by iterating it.
+
+    Iterating yields matches in scan order as they are found, at most
+    ``max_results`` of them. Once it is exhausted, ``results()`` holds the
+    best ``max_results`` for the sort order, and ``matched`` counts every
+    match seen. Stopping the loop early, or calling ``abort()`` from another
+    thread, ends the scan. An invalid regex raises ``re.error`` from the
+    constructor. *progress(files, dirs)* and *status(message)* are optional
+    callbacks. With ``keep_results`` off every match is yielded, uncapped,
+    and none is kept, so ``results()`` is empty; exports stream that way.
+    With ``terms`` set, the query is replaced by that list: names and
+    contents are matched against all of them at once, each match records
+    which terms it holds, and ``term_totals`` sums them.
+    """
+
+    def __init__(self, config, progress=None, status=None):
+        self.config    = c = config
+        self._progress = progress or (lambda files, dirs: None)
+        self._status   = status or (lambda message: None)
+        self._abort    = False
+        self._top      = TopK(c["max_results"], sort_key(c["sort_by"]))
+        self._streamed = 0
+        self._out      = []
+        self._folders  = {}    # folder -> the one string every row of it shares
+        self._settle   = None
+        self.matched   = 0
+        self.truncated = False
+        self.elapsed   = 0.0
+        self.source    = None
+        self.counts    = dict.fromkeys(COUNTERS, 0)
+        self.timings   = dict.fromkeys(PHASES, 0.0)
+        self._regex    = None
+        self._terms    = None
+        self.term_totals = {}   # term -> [files, occurrences]
+        terms = tuple(t for t in c["terms"] if t)
+        if terms:
+            self._terms = term_matcher(terms, c["regex"], c["case_sensitive"])
+        elif c["regex"] and c["query"]:
+            self._regex = re.compile(c["query"], 0 if c["case_sensitive"] else re.IGNORECASE)
+        self._needle = bool(c["query"] or terms)
+        self._lines  = c["lines"] and not terms
 
     def abort(self): self._abort = True
+    def aborted(self): return self._abort
+
+    def results(self):
+        """Return the best ``max_results`` matches, best first."""
+        t0 = time.perf_counter()
+        out = self._top.results()
+        self.timings["sort"] += time.perf_counter() - t0
+        return out
+
+    def report(self):
+        """Return counters, phase timings and settings as a JSON-ready dict.
+
+        ``match`` is the time the scan spent on its own work (name matching,
+        filters, ranking) once walking, stat and content reads are taken out.
+        """
+        c = self.config
+        settings = {k: v.isoformat() if isinstance(v, datetime) else v
+                    for k, v in c.items() if k not in ("refine_from", "snapshot", "paths")}
+        report = dict(
+            source=self.source, elapsed=round(self.elapsed, 6),
+            matched=self.matched, truncated=self.truncated,
+            counts=dict(self.counts),
+            seconds={k: round(v, 6) for k, v in self.timings.items()},
+            config=settings,
+        )
+        if self._terms is not None:
+            report["terms"] = term_report(self._terms.terms, [self.term_totals])
+        return report
 
-    def run(self):
-        t0 = datetime.now()
-        c  = self.config
-        results = []
-
-        regex_obj = None
-        if c["regex"] and c["query"]:
-            flags = 0 if c["case_sensitive"] else re.IGNORECASE
-            try:
-                regex_obj = re.compile(c["query"], flags)
-            except re.error:
-                self.status_msg.emit("Invalid regex pattern")
-                self.finished.emit(0, 0.0)
-                return
+    def _drain(self):
+        out, self._out = self._out, []
+        return out
 
+    def __iter__(self):
+        t0 = time.monotonic()
+        c  = self.config
+        regex_obj = self._regex
         q_cmp = c["query"] if c["case_sensitive"] else c["query"].lower()
+        types = tuple(t.lower() for t in c["types"])
+
+        # Parallel content mode: candidate files are handed to a process pool
+        # and collected as they complete. At most ``workers * 4`` files are in
+        # flight so the walk never runs far ahead of the matchers.
+        workers  = c["content_workers"] if c["search_content"] and self._needle else 1
+        pool     = content_pool(workers) if workers > 1 else None
+        inflight = {}
+
+        # Without a process pool, reader threads still keep the disk busy:
+        # they read the next candidates into memory, at most ``readahead_mb``
+        # of them, while this thread matches the ones already read, in
+        # order. Larger files are matched in place.
+        readers = c["readahead"] if not pool and c["search_content"] and self._needle else 0
+        reader  = ThreadPoolExecutor(readers, "finderplus-read") if readers > 0 else None
+
+        # Fuzzy names are collected into blocks and scored in one call each.
+        fuzzy_block = ([] if c["fuzzy"] and FUZZY_AVAILABLE and c["query"] and not regex_obj
+                       and self._terms is None else None)
+
+        max_bytes = c["content_max_mb"] * 1024 * 1024
+        walked  = {"files": 0, "dirs": 0, "pruned": 0, "ignored": 0}
+        ignore  = ignore_rules(c)
+        refine  = c["refine_from"] is not None
+        listed  = refine or c["paths"] is not None
+        index   = self._open_index() if c["use_index"] and not listed else None
+        self._plan_stat(index is not None or c["paths"] is not None)
+        tri, candidates = None, None
+        if c["use_index"] and c["search_content"] and self._needle and not listed:
+            tri, candidates = self._open_trigrams()
+        self._tri, self._candidates, self._max_bytes = tri, candidates, max_bytes
+        self._pool, self._workers, self._inflight = pool, workers, inflight
+        self._reader, self._readers, self._reads = reader, readers, deque()
+        # Line mode keeps every matching line instead of a few snippets;
+        # multi-term mode counts every term instead.
+        if self._terms is not None:
+            self._scan_path, self._scan_buf = scan_terms, scan_terms_buffer
+            self._scan_args = (tuple(self._terms.terms), c["regex"], c["case_sensitive"])
+        elif self._lines:
+            self._scan_path, self._scan_buf = grep_file, grep_buffer
+            self._scan_args = (c["query"], c["regex"], c["case_sensitive"],
+                               c["context_lines"], c["max_lines"])
+        else:
+            self._scan_path, self._scan_buf = scan_content, scan_buffer
+            self._scan_args = (c["query"], c["regex"], c["case_sensitive"])
+        self._read_budget, self._read_bytes = c["readahead_mb"] << 20, 0
+        snapshot, building = c["snapshot"], False
+        if snapshot is not None and snapshot.ignore_key != (ignore.key if ignore else None):
+            snapshot = None
+        if c["paths"] is not None:
+            self.source = "paths"
+            source = path_entries(c["paths"], walked, ignore)
+        elif refine:
+            self.source = "refine"
+            source = refine_entries(c["refine_from"], walked)
+        elif index:
+            self.source = "index"
+            source = index.entries(c["types"], c["min_size"], c["max_size"],
+                                   c["start_dt"], c["end_dt"], walked, ignore)
+        elif snapshot is not None:
+            self.source = "snapshot"
+            source = snapshot.entries(walked)
+        elif not c["keep_results"]:
+            # A streamed search (an export, or the walk under a duplicates
+            # search) reads the tree once; no snapshot is kept.
+            self.source = "walk"
+            source = walk_files(c["folder"], walked, lambda: self._abort, ignore=ignore)
+        else:
+            self.source = "walk"
+            snapshot, building = TreeSnapshot(c["folder"], ignore), True
+            source = snapshot.build(walked, lambda: self._abort)
 
-        all_files = []
+        # The clock only runs while the scan has control, not while the
+        # caller handles a match, so the phase times add up to the scan.
+        perf, busy = time.perf_counter, 0.0
         try:
-            for root, dirs, files in os.walk(c["folder"]):
-                if self._abort: break
-                dirs[:] = [d for d in dirs if not d.startswith(".")]
-                for f in files:
-                    all_files.append((root, f, os.path.join(root, f)))
-        except PermissionError:
-            pass
-
-        total = len(all_files)
-        self.status_msg.emit(f"Scanning {total:,} files...")
-
-        TEXT_EXTS = {
-            ".txt",".py",".js",".ts",".jsx",".tsx",".html",".htm",".css",
-            ".scss",".json",".xml",".yaml",".yml",".md",".rst",".toml",
-            ".ini",".cfg",".conf",".sh",".bash",".zsh",".c",".cpp",".h",
-            ".hpp",".java",".kt",".go",".rs",".rb",".php",".swift",".r",
-            ".sql",".log",".csv",".env",".tf",".ipynb",".lua",".dart",
-            ".vue",".svelte",".fish",".ps1",".bat",".cmd",
-        }
-
-        for i, (root, f, full_path) in enumerate(all_files):
-            if self._abort: break
-            if i % 300 == 0:
-                self.progress.emit(int(i / max(total, 1) * 100))
-
-            if c["types"] and not any(f.lower().endswith(t.lower()) for t in c["types"]):
-                continue
-            try:
-                stat = os.stat(full_path)
-            except (PermissionError, FileNotFoundError):
-                continue
-
-            file_size = stat.st_size
-            mtime     = datetime.fromtimestamp(stat.st_mtime)
-
-            if c["min_size"] and file_size < c["min_size"] * 1024: continue
-            if c["max_size"] and file_size > c["max_size"] * 1024: continue
-            if c["start_dt"] and mtime < c["start_dt"]: continue
-            if c["end_dt"]   and mtime > c["end_dt"]:   continue
+            mark = perf()
+            for r in self._scan(self._timed(source), walked, types, q_cmp, regex_obj, fuzzy_block):
+                busy += perf() - mark
+                yield r
+                mark = perf()
+            busy += perf() - mark
+        except GeneratorExit:
+            self._abort = True
+            raise
+        finally:
+            for fut in inflight: fut.cancel()
+            if reader: reader.shutdown(wait=False, cancel_futures=True)
+            self._reads.clear()
+            if index: index.close()
+            if tri: tri.close()
+            self.truncated = self._abort or c["keep_results"] and (
+                self.matched > c["max_results"] or self._full())
+            self.elapsed   = time.monotonic() - t0
+            tm = self.timings
+            tm["match"] = max(0.0, busy - tm["walk"] - tm["stat"] - tm["content"])
+            self.counts["dirs"], self.counts["files"] = walked["dirs"], walked["files"]
+            self.counts["pruned_dirs"] = walked["pruned"]
+            self.counts["skipped_ignored"] = walked["ignored"]
+        self._settle = (source, snapshot, building, listed or index is not None)
+
+    def _timed(self, source):
+        """Pass *source* through, adding the time spent in it to ``walk``."""
+        perf, tm = time.perf_counter, self.timings
+        it = iter(source)
+        while True:
+            t0 = perf()
+            item = next(it, None)
+            tm["walk"] += perf() - t0
+            if item is None: return
+            yield item
+
+    def _scan(self, source, walked, types, q_cmp, regex_obj, fuzzy_block):
+        c, terms = self.config, self._terms
+        for root, entry in source:
+            if self._abort or self._full(): break
+            if walked["files"] % 300 == 0:
+                self._progress(walked["files"], walked["dirs"])
+
+            # Cheapest predicates first: extension and name here, size and
+            # date in _resolve once a name (or content search) needs the file.
+            f = entry.name
+            if types and not f.lower().endswith(types):
+                self.counts["skipped_type"] += 1; continue
 
             f_cmp = f if c["case_sensitive"] else f.lower()
-            name_matched    = False
-            name_score      = 0
-            content_matches = []
+            name_matched = False
+            name_score   = 0
 
-            if not c["query"]:
+            if terms is not None:
+                if terms.search(f): name_matched = True; name_score = 100
+            elif not c["query"]:
                 name_matched = True; name_score = 100
             elif regex_obj:
                 if regex_obj.search(f): name_matched = True; name_score = 100
-            elif c["fuzzy"] and FUZZY_AVAILABLE:
-                name_score = fuzz.partial_ratio(q_cmp, f_cmp)
-                if name_score >= c["fuzzy_threshold"]: name_matched = True
+            elif fuzzy_block is not None:
+                fuzzy_block.append((root, entry, f_cmp))
+                if len(fuzzy_block) >= FUZZY_BLOCK:
+                    self._score_block(fuzzy_block, q_cmp); fuzzy_block = []
+                    yield from self._drain()
+                continue
             else:
                 if q_cmp in f_cmp: name_matched = True; name_score = 100
 
-            if c["search_content"] and c["query"] and not name_matched:
-                ext = Path(f).suffix.lower()
-                if ext in TEXT_EXTS and file_size < 5 * 1024 * 1024:
-                    try:
-                        with open(full_path, "r", encoding="utf-8", errors="ignore") as fh:
-                            content = fh.read()
-                        if regex_obj:
-                            for m in regex_obj.finditer(content):
-                                s = max(0, m.start()-60); e = min(len(content), m.end()+60)
-                                content_matches.append(content[s:e].replace("\n"," ").strip())
-                                if len(content_matches) >= 3: break
-                        else:
-                            cc  = content if c["case_sensitive"] else content.lower()
-                            idx = 0
-                            while len(content_matches) < 3:
-                                pos = cc.find(q_cmp, idx)
-                                if pos == -1: break
-                                s = max(0, pos-60); e = min(len(content), pos+60+len(c["query"]))
-                                content_matches.append(content[s:e].replace("\n"," ").strip())
-                                idx = pos + 1
-                    except Exception:
-                        pass
-
-            if not name_matched and not content_matches: continue
-
-            results.append({
-                "name":            f,
-                "full_path":       full_path,
-                "rel_path":        os.path.relpath(full_path, c["folder"]),
-                "folder":          root,
-                "size":            file_size,
-                "mtime":           mtime,
-                "score":           name_score,
-                "name_matched":    name_matched,
-                "content_matches": content_matches,
-                "ext":             Path(f).suffix.lower(),
-            })
-            if len(results) >= c["max_results"]: break
-
-        s = c["sort_by"]
-        if   s == "Name":      results.sort(key=lambda x: x["name"].lower())
-        elif s == "Date":      results.sort(key=lambda x: x["mtime"], reverse=True)
-        elif s == "Size":      results.sort(key=lambda x: x["size"],  reverse=True)
-        elif s == "Relevance": results.sort(key=lambda x: x["score"], reverse=True)
-        elif s == "Extension": results.sort(key=lambda x: (x["ext"], x["name"].lower()))
-
-        elapsed = (datetime.now() - t0).total_seconds()
-        self.result_ready.emit(results)
-        self.finished.emit(len(results), elapsed)
+            self._resolve(root, entry, name_matched, name_score)
+            if self._out: yield from self._drain()
+
+        if fuzzy_block and not self._abort:
+            self._score_block(fuzzy_block, q_cmp)
+            yield from self._drain()
+        inflight, reads = self._inflight, self._reads
+        while (inflight or reads) and not self._abort and not self._full():
+            t0 = time.perf_counter()
+            if reads: self._match_read()
+            else: self._collect(inflight)
+            self.timings["content"] += time.perf_counter() - t0
+            yield from self._drain()
+
+    def settle_snapshot(self):
+        """Do the background half of a finished search.
+
+        Finishes recording a walk that stopped early, or checks that the
+        snapshot the search ran against is still current. Returns
+        ``(snapshot, changed)`` when there is a new snapshot to keep.
+        """
+        if self._settle is None: return None
+        source, snapshot, building, other = self._settle
+        self._settle = None
+        if building:
+            for _ in source:
+                if self._abort: break
+            return (snapshot, False) if snapshot.complete else None
+        if snapshot is not None and not other:
+            if time.monotonic() - snapshot.validated >= SNAPSHOT_TTL:
+                fresh, changed = snapshot.revalidate(lambda: self._abort)
+                if fresh is not snapshot: return fresh, changed > 0
+        return None
+
+    def _score_block(self, block, q_cmp):
+        """Fuzzy-score a block of collected names and resolve each file.
+
+        With content search on, files below the threshold can still match by
+        content and keep their real score, so no cutoff is applied then.
+        """
+        c = self.config
+        cutoff = 0 if c["search_content"] else c["fuzzy_threshold"]
+        scores = fuzzy_scores(q_cmp, [b[-1] for b in block], cutoff)
+        for (root, entry, _), score in zip(block, scores):
+            if self._abort or self._full(): return
+            self._resolve(root, entry, score >= c["fuzzy_threshold"], score)
+
+    def _plan_stat(self, free):
+        """Decide whether files are stat'ed during the scan.
+
+        Only size and date filters, and sorting by size or date, need the
+        stat result to pick matches. Otherwise size and mtime are display
+        fields and are filled in by ``fill_stat`` when a row is shown or
+        exported. Where stat costs nothing (index rows, and ``DirEntry.stat``
+        on Windows, which comes with the directory listing) it is always used.
+        """
+        c = self.config
+        self._stat_filter = bool(c["min_size"] or c["max_size"] or c["start_dt"] or c["end_dt"])
+        self._stat_eager  = (self._stat_filter or c["sort_by"] in ("Date", "Size")
+                             or free or os.name == "nt")
+        self._min_bytes = (c["min_size"] or 0) * 1024
+        self._max_size  = (c["max_size"] or 0) * 1024
+        self._start_ts  = c["start_dt"].timestamp() if c["start_dt"] else None
+        self._end_ts    = c["end_dt"].timestamp()   if c["end_dt"]   else None
+
+    def _resolve(self, root, entry, name_matched, name_score):
+        """Finish one file once its name has been scored: check size and date,
+        search its contents if the name did not match, then record it if
+        anything did."""
+        c, n = self.config, self.counts
+        content = c["search_content"] and self._needle and (
+            self._lines or self._terms is not None or not name_matched)
+        if not name_matched and not content:
+            n["skipped_name"] += 1; return
+        f, full_path = entry.name, entry.path
+        st = None
+        if content or self._stat_eager:
+            t0 = time.perf_counter()
+            try:
+                st = entry.stat()
+            except OSError:
+                n["skipped_unreadable"] += 1; return
+            finally:
+                self.timings["stat"] += time.perf_counter() - t0
+                n["stat_calls"] += 1
+            if self._stat_filter:
+                if (st.st_size < self._min_bytes
+                        or self._max_size and st.st_size > self._max_size):
+                    n["skipped_size"] += 1; return
+                if (self._start_ts is not None and st.st_mtime < self._start_ts
+                        or self._end_ts is not None and st.st_mtime > self._end_ts):
+                    n["skipped_date"] += 1; return
+        content_matches = []
+        if content:
+            t0 = time.perf_counter()
+            content_matches = self._search_content(root, f, full_path, st, name_score,
+                                                   name_matched)
+            self.timings["content"] += time.perf_counter() - t0
+            if content_matches is None: return   # added once the pool is done with it
+            if not content_matches and not name_matched: return
+        self._add(root, f, full_path, st, name_score, name_matched, content_matches)
+
+    def _search_content(self, root, f, full_path, st, name_score, name_matched=False):
+        """Return the content matches for one file, or hand it to a pool
+        (whose matches are added as they come back) and return None.
+        A file that is only searched for its lines in line mode
+        (*name_matched*) is added whatever its contents hold."""
+        n = self.counts
+        if Path(f).suffix.lower() not in TEXT_EXTS:
+            n["skipped_not_text"] += 1; return []
+        if self._tri is not None and not isinstance(st, os.stat_result):
+            # Index and snapshot rows can predate an edit made in place, so
+            # the trigram postings are only trusted against a fresh stat.
+            try:
+                st = os.stat(full_path)
+            except OSError:
+                n["skipped_unreadable"] += 1; return []
+            n["stat_calls"] += 1
+        file_size = st.st_size
+        if self._max_bytes and file_size > self._max_bytes:
+            n["skipped_too_big"] += 1; return []
+        tri = self._tri
+        if tri is not None and file_size <= TrigramIndex.MAX_BYTES:
+            if tri.is_current(full_path, file_size, st.st_mtime):
+                if (self._candidates is not None and tri.docs[full_path][0] not in self._candidates
+                        and not name_matched):
+                    n["skipped_trigram"] += 1; return []
+            else:
+                tri.add(full_path, file_size, st.st_mtime)
+        # The size of each file searched, not what was read: a scan can stop
+        # at the first match or at the line cap.
+        n["content_scanned"] += 1; n["content_bytes"] += file_size
+        inflight = self._inflight
+        meta = (root, f, full_path, st, name_score, name_matched)
+        if self._pool:
+            try:
+                fut = self._pool.submit(self._scan_path, full_path, *self._scan_args)
+            except BrokenProcessPool:
+                self._pool_broken()
+            else:
+                inflight[fut] = meta
+                while len(inflight) >= self._workers * 4 and not self._abort:
+                    self._collect(inflight)
+                return None
+        if self._reader and file_size <= self._read_budget:
+            reads = self._reads
+            while reads and not self._abort and (
+                    len(reads) >= self._readers * 4
+                    or self._read_bytes + file_size > self._read_budget):
+                self._match_read()
+            fut = self._reader.submit(read_file, full_path, self.aborted)
+            reads.append((fut, meta))
+            self._read_bytes += file_size
+            while reads and reads[0][0].done() and not self._abort:
+                self._match_read()
+            return None
+        return self._scan_path(full_path, *self._scan_args) or []
+
+    def _open_index(self):
+        """Open the folder's index, refreshing it first if asked or unbuilt.
+
+        Returns ``None`` (so the caller walks the disk instead) if the index
+        cannot be used or the refresh was aborted.
+        """
+        c = self.config
+        try:
+            index = FileIndex(c["folder"])
+            if c["refresh_index"] or not index.is_built():
+                self._status("Refreshing index...")
+                st = index.refresh(abort=lambda: self._abort)
+                if self._abort:
+                    index.close(); return None
+                self._status(
+                    f"Index refreshed: {st['rescanned']:,} folders rescanned, "
+                    f"{st['unchanged']:,} unchanged, {st['updated']:,} files updated")
+            return index
+        except (sqlite3.Error, OSError) as ex:
+            self._status(f"Index unavailable ({ex}), scanning folder")
+            return None
+
+    def _open_trigrams(self):
+        """Open the folder's trigram index and narrow the query with it."""
+        c = self.config
+        try:
+            tri = TrigramIndex(c["folder"])
+            if c["refresh_index"]: tri.prune()
+            if self._terms is None: return tri, tri.candidates(c["query"], c["regex"])
+            # A file can hold any of the terms: the candidates are the union.
+            candidates = set()
+            for term in self._terms.terms:
+                found = tri.candidates(term, c["regex"])
+                if found is None: return tri, None
+                candidates |= found
+            return tri, candidates
+        except (sqlite3.Error, OSError) as ex:
+            self._status(f"Content index unavailable ({ex})")
+            return None, None
+
+    def _full(self):
+        """True once no later match could make it into the results.
+
+        That only happens when every match ranks the same (plain filename
+        search sorted by relevance), so the first ``max_results`` found are
+        the answer; otherwise the whole tree is scanned for the top K.
+        """
+        c = self.config
+        return (c["sort_by"] == "Relevance" and not c["fuzzy"] and not c["search_content"]
+                and self._terms is None and len(self._top) >= c["max_results"])
+
+    def _collect(self, inflight):
+        done, _ = wait(inflight, timeout=0.1, return_when=FIRST_COMPLETED)
+        for fut in done:
+            meta = inflight.pop(fut)
+            if fut.cancelled() or self._full(): continue
+            try:
+                content_matches = fut.result()
+            except BrokenProcessPool:
+                # Every file still in flight fails the same way; each is
+                # scanned again here, and the rest of the search runs inline.
+                self._pool_broken()
+                content_matches = self._scan_path(meta[2], *self._scan_args) or []
+            except Exception:
+                continue
+            if content_matches or meta[5]:
+                self._add(*meta, content_matches)
+
+    def _pool_broken(self):
+        """Stop using a pool whose worker died; the next search gets a new one."""
+        if self._pool is None: return
+        discard_pool(self._pool)
+        self._pool = None
+        self._status("A content worker stopped, searching the rest in this process")
+
+    def _match_read(self):
+        """Match the oldest read-ahead file, waiting for it if need be."""
+        fut, meta = self._reads.popleft()
+        self._read_bytes -= meta[3].st_size
+        buf = None if fut.cancelled() else fut.result()
+        if buf is None or self._full(): return
+        content_matches = self._scan_buf(buf, *self._scan_args)
+        if content_matches or meta[5]: self._add(*meta, content_matches)
+
+    def _add(self, root, f, full_path, st, name_score, name_matched, content_matches):
+        c = self.config
+        # Line mode scans return ``(count, lines)``; the first few matching
+        # lines double as the file's snippets.
+        lines, line_count, terms = None, 0, None
+        if self._terms is not None:
+            # Term scans return ``(hits, snippets)``; hits in the name count
+            # too, and the score is the number of different terms found.
+            terms, content_matches = content_matches or ({}, [])
+            for term, n in self._terms.count(f).items(): terms[term] = terms.get(term, 0) + n
+            name_score = len(terms)
+            for term, n in terms.items():
+                total = self.term_totals.setdefault(term, [0, 0])
+                total[0] += 1; total[1] += n
+        elif self._lines:
+            line_count, lines = content_matches or (0, [])
+            content_matches = [t for _, t, hit in lines if hit][:MAX_SNIPPETS]
+        r = Result(f, self._folders.setdefault(root, root), c["folder"],
+                   st.st_size if st else None, st.st_mtime if st else None,
+                   name_score, name_matched, content_matches, lines, line_count, terms)
+        self.matched += 1
+        if not c["keep_results"]:
+            self._out.append(r); return
+        if not self._top.push(r): return
+        if self._streamed >= c["max_results"]: return
+        self._out.append(r); self._streamed += 1
+
+
+# Roots on the same device are searched this many at a time, so a disk is
+# not made to seek between walks; roots on different devices run at once.
+DEVICE_CONCURRENCY = 1
+
+def search_roots(config):
+    """Return the folders *config* searches: ``roots`` made absolute, with
+    duplicates and roots inside another root dropped, or just ``folder``."""
+    roots = sorted({os.path.abspath(r) for r in config["roots"] or ()} or {config["folder"]})
+    return [r for i, r in enumerate(roots)
+            if not any(r.startswith(o.rstrip(os.sep) + os.sep) for o in roots[:i])]
+
+def make_search(config, progress=None, status=None):
+    """Return a ``Search``, or a ``MultiSearch`` if *config* has several
+    roots, or a ``DuplicateSearch`` over either in duplicates mode."""
+    if config["duplicates"]: return DuplicateSearch(config, progress, status)
+    if len(search_roots(config)) > 1: return MultiSearch(config, progress, status)
+    return Search(config, progress, status)
+
+
+class MultiSearch:
+    """A search over several root folders, used exactly like a ``Search``.
+
+    Each root gets its own ``Search`` on its own thread, at most
+    ``DEVICE_CONCURRENCY`` at a time per device. Iterating yields matches
+    from all of them as they arrive, up to ``max_results`` in total, and
+    ``results()`` merges the roots' best matches into one sorted, capped
+    list: the overall best ``max_results`` are always among them.
+    """
+
+    def __init__(self, config, progress=None, status=None):
+        self.config    = c = config
+        self._progress = progress or (lambda files, dirs: None)
+        self._walked   = {}
+        self.matched   = 0
+        self.truncated = False
+        self.elapsed   = 0.0
+        self.source    = "roots"
+        self.searches  = []
+        for root in search_roots(c):
+            sub = dict(c, folder=root, roots=None, snapshot=None)
+            if c["refine_from"] is not None:
+                sub["refine_from"] = [r for r in c["refine_from"] if r.root == root]
+            if c["paths"] is not None:
+                prefix = root.rstrip(os.sep) + os.sep
+                sub["paths"] = [p for p in c["paths"] if p.startswith(prefix)]
+            self.searches.append(Search(sub, self._progress_of(root), status))
+
+    def _progress_of(self, root):
+        def progress(files, dirs):
+            self._walked[root] = (files, dirs)
+            self._progress(sum(f for f, _ in self._walked.values()),
+                           sum(d for _, d in self._walked.values()))
+        return progress
+
+    def abort(self):
+        for s in self.searches: s.abort()
+    def aborted(self): return any(s.aborted() for s in self.searches)
+
+    def __iter__(self):
+        t0 = time.monotonic()
+        out, done = queue.Queue(), object()
+        locks = {}   # device -> semaphore; dict.setdefault is atomic
+        def run(s):
+            try:
+                try:
+                    dev = os.stat(s.config["folder"]).st_dev
+                except OSError:
+                    dev = s.config["folder"]
+                with locks.setdefault(dev, threading.BoundedSemaphore(DEVICE_CONCURRENCY)):
+                    for r in s: out.put(r)
+            except BaseException as ex:
+                out.put(ex)
+            out.put(done)
+        threads = [threading.Thread(target=run, args=(s,), daemon=True,
+                                    name="finderplus-root") for s in self.searches]
+        for t in threads: t.start()
+        c = self.config
+        streamed, running = 0, len(threads)
+        cap = c["max_results"] if c["keep_results"] else sys.maxsize
+        try:
+            while running:
+                r = out.get()
+                if r is done: running -= 1; continue
+                if isinstance(r, BaseException): raise r
+                if streamed < cap:
+                    streamed += 1
+                    yield r
+        except GeneratorExit:
+            self.abort()
+            raise
+        finally:
+            if running: self.abort()
+            for t in threads: t.join()
+            self.matched   = sum(s.matched for s in self.searches)
+            self.truncated = self.matched > cap or any(s.truncated for s in self.searches)
+            self.elapsed   = time.monotonic() - t0
+
+    def results(self):
+        """Return the best ``max_results`` matches across all roots."""
+        merged = [r for s in self.searches for r in s.results()]
+        sort_results(merged, self.config["sort_by"])
+        del merged[self.config["max_results"]:]
+        return merged
+
+    def report(self):
+        """Like ``Search.report()``, summed over the roots, with each root's
+        own report under ``roots``. Phase times are summed across threads."""
+        reports = [s.report() for s in self.searches]
+        total   = dict(reports[0], source=self.source, elapsed=round(self.elapsed, 6),
+                       matched=self.matched, truncated=self.truncated)
+        total["counts"]  = {k: sum(r["counts"][k] for r in reports) for k in COUNTERS}
+        total["seconds"] = {k: round(sum(r["seconds"][k] for r in reports), 6) for k in PHASES}
+        total["config"]  = dict(reports[0]["config"], folder=None,
+                                roots=[s.config["folder"] for s in self.searches])
+        if "terms" in reports[0]:
+            total["terms"] = term_report(reports[0]["terms"], [s.term_totals for s in self.searches])
+        total["roots"]   = reports
+        return total
+
+    def settle_snapshot(self):
+        """Snapshots are kept for single-root searches only."""
+        return None
 
 
 # ══════════════════════════════════════════════════════════════
-#  MATCH HIGHLIGHTER
+#  DUPLICATES
 # ══════════════════════════════════════════════════════════════
-class MatchHighlighter(QSyntaxHighlighter):
-    def __init__(self, doc, query, case_sensitive=False, is_regex=False):
-        super().__init__(doc)
-        self.query = query; self.case_sensitive = case_sensitive; self.is_regex = is_regex
-        self.fmt = QTextCharFormat()
-        self.fmt.setBackground(QColor("#fde68a"))
-        self.fmt.setForeground(QColor("#78350f"))
-
-    def highlightBlock(self, text):
-        if not self.query: return
-        if self.is_regex:
-            flags = 0 if self.case_sensitive else re.IGNORECASE
-            try:
-                for m in re.finditer(self.query, text, flags):
-                    self.setFormat(m.start(), m.end()-m.start(), self.fmt)
-            except: pass
+# Files are first compared by a hash of this many bytes from each end;
+# files no larger than twice this are then hashed in full by that read.
+PARTIAL_BYTES = 4096
+HASH_THREADS  = 4      # hashing threads when read-ahead is off
+DUP_COUNTERS  = ("dup_candidates", "partial_hashed", "full_hashed", "skipped_hardlink",
+                 "bytes_hashed", "dup_groups")
+
+
+def partial_hash(path, size):
+    """Return ``(digest, (st_dev, st_ino), bytes_read)`` over the first and
+    last ``PARTIAL_BYTES`` of *path*, or None if it cannot be read."""
+    h = hashlib.blake2b(digest_size=16)
+    try:
+        with open(path, "rb") as fh:
+            st   = os.fstat(fh.fileno())
+            head = fh.read(PARTIAL_BYTES)
+            h.update(head)
+            tail = b""
+            if size > 2 * PARTIAL_BYTES:
+                fh.seek(-PARTIAL_BYTES, os.SEEK_END)
+                tail = fh.read(PARTIAL_BYTES)
+            elif size > PARTIAL_BYTES:
+                tail = fh.read()
+            h.update(tail)
+    except OSError:
+        return None
+    return h.digest(), (st.st_dev, st.st_ino), len(head) + len(tail)
+
+def full_hash(path, abort=None):
+    """Return ``(digest, bytes_read)`` over all of *path*, read in chunks,
+    or None if it cannot be read or *abort* says to stop."""
+    h, n = hashlib.blake2b(digest_size=16), 0
+    try:
+        with open(path, "rb", buffering=0) as fh:
+            while True:
+                if abort and abort(): return None
+                chunk = fh.read(READ_CHUNK)
+                if not chunk: break
+                h.update(chunk); n += len(chunk)
+    except OSError:
+        return None
+    return h.digest(), n
+
+
+class DuplicateSearch:
+    """Finds identical files among a search's matches; used like a ``Search``.
+
+    The matches of the config's own search (query, types, size, date,
+    roots) are streamed from a plain walk, neither kept nor snapshotted,
+    and bucketed by size as they arrive: only the first file of each size
+    is held until a second shows up. Files sharing a size have
+    both ends hashed, and files still sharing that hash are hashed in full,
+    both on the read-ahead threads while the walk goes on, so most files
+    are never opened and few are read to the end. Iterating yields each
+    duplicate as soon as a second copy is confirmed, with ``dup_group``
+    set; ``results()`` lists whole groups, most reclaimable bytes first,
+    up to ``max_results`` files. Empty files and hard links to a file
+    already seen are not reported.
+    """
+
+    def __init__(self, config, progress=None, status=None):
+        self.config    = c = config
+        self.search    = make_search(dict(c, duplicates=False, keep_results=False,
+                                          snapshot=None, sort_by="Relevance"),
+                                     progress, status)
+        self._status   = status or (lambda message: None)
+        self._groups   = {}   # (size, digest) -> rows, once two are confirmed
+        self.matched   = 0
+        self.truncated = False
+        self.elapsed   = 0.0
+        self.source    = "duplicates"
+        self.counts    = dict.fromkeys(DUP_COUNTERS, 0)
+        self.hash_time = 0.0
+
+    def abort(self): self.search.abort()
+    def aborted(self): return self.search.aborted()
+
+    def _hash(self, stage, r):
+        """Run one hashing stage for *r* on a pool thread; returns
+        ``(result, seconds)``."""
+        t0 = time.perf_counter()
+        if stage == "partial": out = partial_hash(r.full_path, r.size)
+        else:                  out = full_hash(r.full_path, self.aborted)
+        return out, time.perf_counter() - t0
+
+    def __iter__(self):
+        t0  = time.monotonic()
+        cnt = self.counts
+        by_size, by_partial, by_full, inodes = {}, {}, {}, set()
+        pool    = ThreadPoolExecutor(self.config["readahead"] or HASH_THREADS, "finderplus-hash")
+        pending = {}   # future -> (stage, row)
+
+        def submit(stage, r):
+            pending[pool.submit(self._hash, stage, r)] = (stage, r)
+
+        def bucket(table, key, r):
+            # A bucket's first row waits for company; the second brings it
+            # along to the next stage, and later ones go straight through.
+            # Only that first row is held, so the tables grow with the
+            # distinct keys rather than with every file.
+            first = table.get(key, r)
+            if first is r:
+                table[key] = r; return []
+            if first is None: return [r]
+            table[key] = None
+            return [first, r]
+
+        def finish(fut):
+            stage, r = pending.pop(fut)
+            out, seconds = fut.result()
+            self.hash_time += seconds
+            if out is None: return []
+            if stage == "partial":
+                digest, inode, n = out
+                cnt["partial_hashed"] += 1; cnt["bytes_hashed"] += n
+                if inode in inodes:
+                    cnt["skipped_hardlink"] += 1; return []
+                inodes.add(inode)
+                key = (r.size, digest)
+                if r.size <= 2 * PARTIAL_BYTES: return confirm(key, r)
+                for other in bucket(by_partial, key, r): submit("full", other)
+                return []
+            digest, n = out
+            cnt["full_hashed"] += 1; cnt["bytes_hashed"] += n
+            return confirm((r.size, digest), r)
+
+        def confirm(key, r):
+            # Confirmed groups are kept whole; results() lists them.
+            group = by_full.setdefault(key, [])
+            group.append(r)
+            if len(group) == 1: return []
+            if len(group) == 2:
+                cnt["dup_groups"] += 1
+                self._groups[key] = rows = group
+                for row in group: row.dup_group = cnt["dup_groups"]
+            else:
+                r.dup_group = group[0].dup_group
+                rows = [r]
+            self.matched += len(rows)
+            return rows
+
+        try:
+            for r in self.search:
+                size = fill_stat(r).size
+                if size:
+                    for other in bucket(by_size, size, r):
+                        cnt["dup_candidates"] += 1
+                        submit("partial", other)
+                for fut in [f for f in pending if f.done()]:
+                    yield from finish(fut)
+            if pending: self._status(f"Comparing {len(pending):,} files...")
+            while pending:
+                if self.aborted(): break
+                done, _ = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                for fut in done: yield from finish(fut)
+        except GeneratorExit:
+            self.abort()
+            raise
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+            self.elapsed = time.monotonic() - t0
+
+    def results(self):
+        """Return whole duplicate groups, most reclaimable bytes first, each
+        ordered by path, up to ``max_results`` files in all."""
+        groups = sorted(self._groups.values(),
+                        key=lambda rows: (-rows[0].size * (len(rows) - 1), rows[0].dup_group))
+        out, cap = [], self.config["max_results"]
+        for rows in groups:
+            if out and len(out) + len(rows) > cap:
+                self.truncated = True; break
+            out.extend(sorted(rows, key=lambda r: r.full_path))
+        return out
+
+    def report(self):
+        """Like ``Search.report()``, with the duplicate counters added and the
+        time spent hashing, summed across threads, under ``hash``."""
+        report = self.search.report()
+        report.update(source=self.source, elapsed=round(self.elapsed, 6),
+                      matched=self.matched, truncated=self.truncated)
+        report["counts"].update(self.counts)
+        report["seconds"]["hash"] = round(self.hash_time, 6)
+        report["config"].update(duplicates=True, max_results=self.config["max_results"],
+                                sort_by=self.config["sort_by"])
+        return report
+
+    def settle_snapshot(self): return self.search.settle_snapshot()
+
+
+# ══════════════════════════════════════════════════════════════
+#  CONTENT SCANNING
+# ══════════════════════════════════════════════════════════════
+# Snippets keep this many characters of context either side of a match.
+SNIPPET_CONTEXT = 60
+MAX_SNIPPETS    = 3
+TEXT_CHUNK      = 1 << 20   # characters per read on the decoded-text path
+READ_CHUNK      = 1 << 20   # bytes per read in the read-ahead threads
+LINE_CHARS      = 300       # characters kept of each line in line mode
+
+
+def scan_content(path, query, is_regex, case_sensitive):
+    """Return up to three snippets of *path* around matches of *query*.
+
+    The file is memory-mapped and searched as bytes with a compiled
+    pattern, so memory use does not grow with file size and only the
+    snippet windows are ever decoded. Queries that bytes matching cannot
+    express (non-ASCII text matched case-insensitively, non-ASCII regexes)
+    fall back to reading decoded text in fixed-size overlapping chunks.
+
+    Module-level so it can be shipped to a process pool; patterns are
+    compiled on the worker side (``re`` caches them per process).
+    """
+    rx = _byte_pattern(query, is_regex, case_sensitive)
+    if rx is not None:
+        try:
+            with open(path, "rb") as fh:
+                if os.fstat(fh.fileno()).st_size == 0: return []
+                with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return _byte_snippets(mm, rx)
+        except (OSError, ValueError):
+            return []
+    return _scan_text_chunks(path, query, is_regex, 0 if case_sensitive else re.IGNORECASE)
+
+
+def read_file(path, abort=None):
+    """Return the bytes of *path*, or None if it cannot be read or *abort*
+    says to stop.
+
+    Used by the read-ahead threads: plain ``read()`` calls release the GIL
+    while they wait on the disk, which faulting in a memory map does not,
+    and *abort* is checked between chunks.
+    """
+    buf = bytearray()
+    try:
+        with open(path, "rb") as fh:
+            while True:
+                if abort and abort(): return None
+                data = fh.read(READ_CHUNK)
+                if not data: return buf
+                buf += data
+    except OSError:
+        return None
+
+
+def scan_buffer(buf, query, is_regex, case_sensitive):
+    """``scan_content`` for a file already read into *buf*."""
+    rx = _byte_pattern(query, is_regex, case_sensitive)
+    if rx is not None: return _byte_snippets(buf, rx)
+    try:
+        rx = re.compile(query if is_regex else re.escape(query),
+                        0 if case_sensitive else re.IGNORECASE)
+    except re.error:
+        return []
+    text, C, content_matches = buf.decode("utf-8", "ignore"), SNIPPET_CONTEXT, []
+    for m in rx.finditer(text):
+        content_matches.append(text[max(0, m.start() - C):m.end() + C].replace("\n", " ").strip())
+        if len(content_matches) >= MAX_SNIPPETS: break
+    return content_matches
+
+
+def grep_file(path, query, is_regex, case_sensitive, context=0, max_lines=100):
+    """Return ``(count, lines)`` for the lines of *path* matching *query*,
+    or None if none do.
+
+    ``count`` is the exact number of matching lines. ``lines`` holds the
+    first *max_lines* of them as ``(number, text, True)`` tuples, in file
+    order, with up to *context* lines either side of each as ``(number,
+    text, False)``. The file is read a chunk at a time, cut at line
+    breaks, so memory stays flat however large it is (a single line is
+    always held whole). Only lines that are kept are decoded.
+    """
+    rx, text = _line_pattern(query, is_regex, case_sensitive)
+    if rx is None: return None
+    try:
+        with open(path, "rb") as fh:
+            return _grep_chunks(_line_chunks(fh), rx, text, context, max_lines)
+    except OSError:
+        return None
+
+
+def grep_buffer(buf, query, is_regex, case_sensitive, context=0, max_lines=100):
+    """``grep_file`` for a file already read into *buf*."""
+    rx, text = _line_pattern(query, is_regex, case_sensitive)
+    if rx is None or not buf: return None   # an empty file has no lines, as in grep_file
+    return _grep_chunks((buf,), rx, text, context, max_lines)
+
+
+def _line_pattern(query, is_regex, case_sensitive):
+    """Return ``(pattern, over_text)``: *query* compiled so ``^`` and ``$``
+    match at line breaks, over bytes when possible."""
+    rx = _byte_pattern(query, is_regex, case_sensitive, re.MULTILINE)
+    if rx is not None: return rx, False
+    try:
+        return re.compile(query if is_regex else re.escape(query),
+                          re.MULTILINE | (0 if case_sensitive else re.IGNORECASE)), True
+    except re.error:
+        return None, False
+
+
+def _line_chunks(fh):
+    """Yield the contents of *fh* in pieces of about ``READ_CHUNK`` bytes,
+    each ending at a line break (the last one possibly not)."""
+    rest = b""
+    while True:
+        data = fh.read(READ_CHUNK)
+        if not data: break
+        cut = data.rfind(b"\n") + 1
+        if not cut:
+            rest += data; continue
+        yield rest + data[:cut] if rest else data[:cut]
+        rest = data[cut:]
+    if rest: yield rest
+
+
+def _grep_chunks(chunks, rx, text, context, max_lines):
+    # Matching lines are found with C-level searches and counts over each
+    # chunk; a chunk is only split into lines if some of it is kept.
+    count, kept, out = 0, 0, []
+    base, last, after = 1, 0, 0   # first line of the chunk; last line kept; context runs to
+    tail = {}                     # number -> line, the last *context* lines before the chunk
+    for chunk in chunks:
+        if text: chunk = chunk.decode("utf-8", "ignore")
+        nl = "\n" if text else b"\n"
+        hits, pos, at, n = [], 0, 0, 0
+        while True:
+            m = rx.search(chunk, pos)
+            # An empty match just past the final line break is not a line.
+            if m is None or m.start() == len(chunk) and chunk.endswith(nl): break
+            n += chunk.count(nl, at, m.start()); at = m.start()
+            start = chunk.rfind(nl, 0, at) + 1
+            hits.append((n, at - start))
+            pos = chunk.find(nl, at) + 1
+            if not pos: break
+        count += len(hits)
+        ends  = chunk.endswith(nl)
+        lines = None
+        if hits and kept < max_lines or after >= base:
+            lines = chunk.split(nl)
+            if ends: lines.pop()
+            def keep(i, hit=False, col=0):
+                nonlocal last
+                line = lines[i] if i >= 0 else tail[base + i]
+                if not text: line = line.decode("utf-8", "ignore")
+                line = line.rstrip("\r")
+                if len(line) > LINE_CHARS:
+                    cut  = max(0, col - LINE_CHARS // 4)
+                    line = ("\u2026" if cut else "") + line[cut:cut + LINE_CHARS]
+                out.append((base + i, line, hit)); last = base + i
+            for i, col in hits:
+                if kept >= max_lines: break
+                for j in range(last - base + 1, min(after - base, i - 1) + 1): keep(j)
+                for j in range(max(i - context, last - base + 1), i):
+                    if j >= 0 or base + j in tail: keep(j)
+                keep(i, True, col); kept += 1
+                after = base + i + context
+            for j in range(last - base + 1, min(after - base, len(lines) - 1) + 1): keep(j)
+        size = chunk.count(nl) + (not ends)
+        if context:
+            recent = lines
+            if recent is None:
+                recent = chunk.rsplit(nl, context + ends)
+                if ends: recent.pop()
+            recent = recent[-context:]
+            first = base + size - len(recent)
+            tail = {k: v for k, v in tail.items() if k >= base + size - context}
+            tail.update((first + k, line) for k, line in enumerate(recent))
+        base += size
+    return (count, out) if count else None
+
+
+def _byte_pattern(query, is_regex, case_sensitive, flags=0):
+    """Compile *query* to match raw UTF-8 bytes, or return None when bytes
+    matching cannot express it."""
+    if not (query.isascii() or (case_sensitive and not is_regex)): return None
+    if is_regex and not _bytes_safe(query): return None
+    raw = query.encode("utf-8")
+    try:
+        return re.compile(raw if is_regex else re.escape(raw),
+                          flags | (0 if case_sensitive else re.IGNORECASE))
+    except re.error:
+        return None
+
+
+@lru_cache(maxsize=64)
+def _bytes_safe(pattern):
+    """Return True if regex *pattern* matches UTF-8 bytes exactly as it
+    matches the decoded text.
+
+    Anything that can consume a non-ASCII character (``.``, ``\\w``, ``\\s``,
+    ``\\d``, negated classes, ``\\b``, characters above ``\\x7f``) would
+    see one byte of it instead, so such patterns must run on text.
+    """
+    try:
+        parsed = sre_parse.parse(pattern)
+    except Exception:
+        return False
+    unsafe = (sre_constants.ANY, sre_constants.NOT_LITERAL, sre_constants.CATEGORY,
+              sre_constants.NEGATE)
+    def safe(items):
+        for op, av in items:
+            if op in unsafe: return False
+            if op is sre_constants.LITERAL and av > 0x7f: return False
+            if op is sre_constants.RANGE and av[1] > 0x7f: return False
+            if op is sre_constants.AT and av in (sre_constants.AT_BOUNDARY,
+                                                 sre_constants.AT_NON_BOUNDARY): return False
+            if op is sre_constants.IN:
+                if not safe(av): return False
+            elif not all(safe(sub) for sub in _subpatterns(av)): return False
+        return True
+    return safe(parsed)
+
+def _subpatterns(av):
+    """Yield the nested pattern sequences in one parsed item's argument."""
+    if isinstance(av, sre_parse.SubPattern):
+        yield av
+    elif isinstance(av, (tuple, list)):
+        for x in av: yield from _subpatterns(x)
+
+
+def _byte_snippets(buf, rx):
+    content_matches = []
+    for m in rx.finditer(buf):
+        content_matches.append(_snippet(buf, m.start(), m.end()))
+        if len(content_matches) >= MAX_SNIPPETS: break
+    return content_matches
+
+
+def _snippet(data, s, e):
+    """Return the match at ``data[s:e]`` with its context, as one line of text."""
+    C = SNIPPET_CONTEXT
+    if isinstance(data, str):
+        return data[max(0, s - C):e + C].replace("\n", " ").strip()
+    window = C * 4   # UTF-8 is at most 4 bytes a character
+    before = data[max(0, s - window):s].decode("utf-8", "ignore")[-C:]
+    match  = data[s:min(e, s + window)].decode("utf-8", "ignore")
+    after  = data[e:e + window].decode("utf-8", "ignore")[:C]
+    return (before + match + after).replace("\n", " ").strip()
+
+
+def _scan_text_chunks(path, query, is_regex, flags):
+    try:
+        rx = re.compile(query if is_regex else re.escape(query), flags)
+    except re.error:
+        return []
+    C = SNIPPET_CONTEXT
+    # Matches must start before ``limit`` so that a match running across a
+    # chunk boundary, and its trailing context, are never cut off.
+    keep = C + (4096 if is_regex else len(query))
+    content_matches, buf, pos = [], "", 0
+    try:
+        with open(path, "r", encoding="utf-8", errors="ignore") as fh:
+            while len(content_matches) < MAX_SNIPPETS:
+                data = fh.read(TEXT_CHUNK)
+                buf += data
+                limit = len(buf) if not data else max(pos, len(buf) - keep)
+                for m in rx.finditer(buf, pos):
+                    if m.start() >= limit: break
+                    s = max(0, m.start() - C); e = min(len(buf), m.end() + C)
+                    content_matches.append(buf[s:e].replace("\n", " ").strip())
+                    if len(content_matches) >= MAX_SNIPPETS: break
+                if not data: break
+                drop = max(0, limit - C)
+                buf, pos = buf[drop:], limit - drop
+    except Exception:
+        pass
+    return content_matches
+
+
+def read_text(path):
+    """Return the decoded contents of *path*, or "" if it cannot be read."""
+    try:
+        with open(path, "r", encoding="utf-8", errors="ignore") as fh:
+            return fh.read()
+    except Exception:
+        return ""
+
+
+_pool, _pool_workers = None, 0
+_pool_lock = threading.Lock()
+
+def content_pool(workers):
+    """Return the shared content-search process pool, sized to *workers*.
+
+    The pool outlives individual searches so typing does not pay process
+    start-up on every keystroke; it is only rebuilt when the size changes.
+    """
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"))
+            _pool_workers = workers
+        return _pool
+
+def discard_pool(pool):
+    """Drop *pool* as the shared pool, once a worker has died and broken it."""
+    global _pool
+    with _pool_lock:
+        if _pool is pool: _pool = None
+    pool.shutdown(wait=False)
+
+
+# ══════════════════════════════════════════════════════════════
+#  MULTI-TERM MATCHING
+# ══════════════════════════════════════════════════════════════
+TRIE_MAX_CHARS = 500   # longer terms go into a flat alternation instead
+
+def _trie_pattern(words):
+    """Return regex source matching any of *words*, shaped as a trie so a
+    shared prefix is tried once and the longest word at a position wins."""
+    trie = {}
+    for w in words:
+        node = trie
+        for ch in w: node = node.setdefault(ch, {})
+        node[""] = {}
+    def build(node):
+        alts = [re.escape(ch) + build(child) for ch, child in node.items() if ch]
+        if not alts: return ""
+        body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+        return f"(?:{body})?" if "" in node else body
+    return build(trie)
+
+
+class TermMatcher:
+    """Finds every occurrence of any of many terms in one pass over the text.
+
+    Literal terms are merged into a single trie-shaped regex, which ``re``
+    scans with its first-character skip. Each hit is the longest term
+    starting at that position, and shorter terms it begins with count at
+    the same spot. The scan resumes one character later, so overlapping
+    occurrences are all found, as with an Aho–Corasick automaton. With
+    *is_regex* the terms are patterns joined as named alternatives: a
+    match counts for the first one that matched, and matches do not
+    overlap. A term with groups of its own would have their numbers and
+    names changed by the join, so each such term gets a pass of its own.
+    A bad pattern raises ``re.error`` naming the term.
+    """
+
+    def __init__(self, terms, is_regex=False, case_sensitive=False):
+        self.terms    = list(dict.fromkeys(t for t in terms if t))
+        self.is_regex = is_regex
+        flags = 0 if case_sensitive else re.IGNORECASE
+        if is_regex:
+            shared, own = [], []
+            for t in self.terms:
+                try:
+                    rx = re.compile(t, flags)
+                except re.error as ex:
+                    raise re.error(f"term {t!r}: {ex.msg}") from None
+                (own if rx.groups else shared).append(t)
+            self._names  = {f"t{i}": t for i, t in enumerate(shared)}
+            joined  = "|".join(f"(?P<{n}>{t})" for n, t in self._names.items())
+            sources = [(None, joined)] if shared else []
+            sources += [(t, t) for t in own]
+            self.longest = None
         else:
-            t = text if self.case_sensitive else text.lower()
-            q = self.query if self.case_sensitive else self.query.lower()
-            idx = 0
+            self._fold  = (lambda s: s) if case_sensitive else str.lower
+            self._owner = {}   # folded term -> the term it stands for
+            for t in self.terms: self._owner.setdefault(self._fold(t), t)
+            keys = self._owner
+            self._also = {k: [k[:i] for i in range(1, len(k)) if k[:i] in keys] for k in keys}
+            self.longest = max(map(len, keys), default=0)
+            sources = [(None, _trie_pattern(keys) if self.longest <= TRIE_MAX_CHARS else
+                        "|".join(re.escape(k) for k in sorted(keys, key=len, reverse=True)))]
+        # One ``(term, text pattern, bytes pattern)`` per pass; *term* is
+        # None for the joined pattern. Bytes matching is used only when
+        # every pass can do it.
+        self._passes = []
+        for term, source in sources:
+            brx = None
+            if (source.isascii() and (not is_regex or _bytes_safe(source))
+                    or case_sensitive and not is_regex):
+                try:
+                    brx = re.compile(source.encode("utf-8"), flags)
+                except re.error:
+                    pass
+            self._passes.append((term, re.compile(source, flags), brx))
+        self.binary = all(brx is not None for _, _, brx in self._passes)
+
+    def search(self, text):
+        """Return True if any term occurs in *text*."""
+        return any(rx.search(text) for _, rx, _ in self._passes)
+
+    def finditer(self, data, pos=0, limit=None):
+        """Yield ``(start, end, term)`` for each term occurrence in *data*
+        starting at or after *pos* and before *limit*, in order. *data* is
+        text, or bytes when ``binary`` is set."""
+        binary = not isinstance(data, str)
+        limit  = len(data) if limit is None else limit
+        if self.is_regex:
+            runs = [self._regex_hits(brx if binary else rx, term, data, pos, limit)
+                    for term, rx, brx in self._passes]
+            yield from runs[0] if len(runs) == 1 else heapq.merge(*runs)
+            return
+        _, rx, brx = self._passes[0]
+        fold, owner, also, search = self._fold, self._owner, self._also, (brx if binary else rx).search
+        m = search(data, pos)
+        while m and m.start() < limit:
+            start, end, key = m.start(), m.end(), m.group()
+            key = fold(key.decode("utf-8", "ignore") if binary else key)
+            if key in owner:
+                yield start, end, owner[key]
+                for p in also[key]: yield start, end, owner[p]
+            m = search(data, start + 1)
+
+    def _regex_hits(self, rx, term, data, pos, limit):
+        for m in rx.finditer(data, pos):
+            if m.start() >= limit: return
+            if m.end() > m.start(): yield m.start(), m.end(), term or self._names[m.lastgroup]
+
+    def count(self, data):
+        """Return ``{term: occurrences}`` for the terms found in *data*."""
+        hits = {}
+        for _, _, term in self.finditer(data): hits[term] = hits.get(term, 0) + 1
+        return hits
+
+
+def read_terms(text):
+    """Split pasted or loaded *text* into terms: one a line, trimmed, with
+    blank lines and repeats dropped."""
+    return list(dict.fromkeys(t for t in (line.strip() for line in text.splitlines()) if t))
+
+
+@lru_cache(maxsize=4)
+def term_matcher(terms, is_regex, case_sensitive):
+    """Return a ``TermMatcher`` for the tuple *terms*, built once per process."""
+    return TermMatcher(terms, is_regex, case_sensitive)
+
+
+def scan_terms(path, terms, is_regex, case_sensitive):
+    """Count every one of *terms* in *path* in a single pass.
+
+    Returns ``(hits, snippets)``, *hits* mapping each term found to its
+    number of occurrences, or None if none was found. As in
+    ``scan_content``, the file is memory-mapped and matched as bytes when
+    the terms allow it, and read as text in overlapping chunks otherwise.
+    """
+    tm = term_matcher(terms, is_regex, case_sensitive)
+    if tm.binary:
+        try:
+            with open(path, "rb") as fh:
+                if os.fstat(fh.fileno()).st_size == 0: return None
+                with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    hits, snippets = _count_terms(tm, mm, {}, [])
+        except (OSError, ValueError):
+            return None
+        return (hits, snippets) if hits else None
+    keep = SNIPPET_CONTEXT + (4096 if is_regex else tm.longest)
+    hits, snippets, buf, pos = {}, [], "", 0
+    try:
+        with open(path, "r", encoding="utf-8", errors="ignore") as fh:
             while True:
-                pos = t.find(q, idx)
-                if pos == -1: break
-                self.setFormat(pos, len(q), self.fmt)
-                idx = pos + 1
+                data = fh.read(TEXT_CHUNK)
+                buf += data
+                limit = len(buf) if not data else max(pos, len(buf) - keep)
+                _count_terms(tm, buf, hits, snippets, pos, limit)
+                if not data: break
+                drop = max(0, limit - SNIPPET_CONTEXT)
+                buf, pos = buf[drop:], limit - drop
+    except Exception:
+        pass
+    return (hits, snippets) if hits else None
+
+
+def scan_terms_buffer(buf, terms, is_regex, case_sensitive):
+    """``scan_terms`` for a file already read into *buf*."""
+    tm = term_matcher(terms, is_regex, case_sensitive)
+    if not tm.binary: buf = buf.decode("utf-8", "ignore")
+    hits, snippets = _count_terms(tm, buf, {}, [])
+    return (hits, snippets) if hits else None
+
+
+def _count_terms(tm, data, hits, snippets, pos=0, limit=None):
+    # Hits within one snippet's context of the last one would repeat it.
+    last = -SNIPPET_CONTEXT
+    for s, e, term in tm.finditer(data, pos, limit):
+        hits[term] = hits.get(term, 0) + 1
+        if s >= last + SNIPPET_CONTEXT and len(snippets) < MAX_SNIPPETS:
+            snippets.append(_snippet(data, s, e)); last = s
+    return hits, snippets
 
 
 # ══════════════════════════════════════════════════════════════
 #  HELPERS
 # ══════════════════════════════════════════════════════════════
-EXT_COLORS = {
-    ".py":"#2563eb",   ".ipynb":"#7c3aed",
-    ".js":"#d97706",   ".ts":"#1d4ed8",  ".jsx":"#0891b2", ".tsx":"#0891b2",
-    ".html":"#dc2626", ".css":"#2563eb", ".scss":"#9333ea",
-    ".json":"#16a34a", ".yaml":"#7c3aed",".yml":"#7c3aed",
-    ".md":"#4f46e5",   ".rs":"#ea580c",  ".go":"#0891b2",
-    ".java":"#ca8a04", ".kt":"#7c3aed",  ".rb":"#dc2626",
-    ".sh":"#16a34a",   ".bash":"#16a34a",
-    ".txt":"#64748b",  ".log":"#64748b",
-    ".sql":"#b45309",  ".csv":"#15803d",
-    ".c":"#4338ca",    ".cpp":"#4338ca",
-    ".png":"#db2777",  ".jpg":"#db2777",  ".jpeg":"#db2777",
-    ".svg":"#ea580c",  ".pdf":"#dc2626",
-    ".zip":"#854d0e",  ".tar":"#854d0e",
-}
-def ext_color(ext): return EXT_COLORS.get(ext, "#64748b")
+# Fuzzy mode scores this many names per rapidfuzz call.
+FUZZY_BLOCK = 4096
+
+def fuzzy_scores(query, names, cutoff=0):
+    """Return ``fuzz.partial_ratio(query, name)`` for each of *names*.
+
+    The whole block is scored in a single rapidfuzz call spread over all
+    cores; scores below *cutoff* come back as 0. ``cdist`` needs numpy, so
+    without it the block goes through ``extract`` instead (one core).
+    """
+    try:
+        return fuzz_process.cdist([query], names, scorer=fuzz.partial_ratio,
+                                  score_cutoff=cutoff, dtype="float64", workers=-1)[0].tolist()
+    except ImportError:
+        scores = [0.0] * len(names)
+        for _, score, i in fuzz_process.extract(query, names, scorer=fuzz.partial_ratio,
+                                                score_cutoff=cutoff, limit=None):
+            scores[i] = score
+        return scores
+
+# ``mtime`` of a result whose deferred stat failed.
+STAT_MISSING = float("-inf")
+
+def fill_stat(r):
+    """Fill in ``size`` and ``mtime`` for a result the scan did not stat.
+
+    A file that cannot be stat'ed (gone since the scan, or a dangling
+    symlink) is marked ``missing``, as the scan would have skipped it:
+    filtered and sorted views and exports leave it out.
+    """
+    if r.mtime is None:
+        try:
+            st = os.stat(r.full_path)
+            r.size, r.mtime = st.st_size, st.st_mtime
+        except OSError:
+            r.size, r.mtime = 0, STAT_MISSING
+    return r
+
+def sort_key(sort_by):
+    """Return a key that orders results best-first for *sort_by*.
+
+    Descending orders are expressed by negating the value, so every key
+    sorts ascending and keeps equal rows in scan order.
+    """
+    s = sort_by
+    if   s == "Name":      return lambda x: x.name.lower()
+    elif s == "Date":      return lambda x: -x.mtime
+    elif s == "Size":      return lambda x: -x.size
+    elif s == "Relevance": return lambda x: -x.score
+    elif s == "Extension": return lambda x: (x.ext, x.name.lower())
+    return None
+
+def sort_results(results, sort_by):
+    key = sort_key(sort_by)
+    if key: results.sort(key=key)
+    return results
+
+def format_terms(hits):
+    """Return ``{term: occurrences}`` as text, most frequent first."""
+    return ", ".join(f"{t} ({n:,})" for t, n in sorted(hits.items(), key=lambda kv: -kv[1]))
+
+def term_report(terms, totals):
+    """Merge ``term_totals`` dicts into ``{term: {"files": n, "hits": n}}``
+    over all of *terms*, most hits first, unmatched terms last with zeros."""
+    merged = {t: [0, 0] for t in terms}
+    for tot in totals:
+        for t, (files, hits) in tot.items():
+            m = merged.setdefault(t, [0, 0]); m[0] += files; m[1] += hits
+    return {t: dict(files=f, hits=h)
+            for t, (f, h) in sorted(merged.items(), key=lambda kv: -kv[1][1])}
+
+
+class TopK:
+    """Keep the best *k* of a stream of results under a sort key.
+
+    Entries are precomputed ``(key, seq)`` tuples, so ties keep scan order.
+    The buffer is cut back to the best *k* whenever it reaches ``2 * k``,
+    which bounds memory at ``2 * k`` rows however many matches there are.
+    After the first cut, anything ranking below the current k-th entry is
+    rejected with a single tuple comparison.
+    """
+
+    def __init__(self, k, key=None):
+        self.k, self.key = k, key or (lambda x: 0)
+        self._items, self._seq, self._cut = [], 0, None
+
+    def __len__(self): return min(len(self._items), self.k)
+
+    def push(self, r):
+        """Offer *r*; returns False if it cannot be among the best k."""
+        rank = (self.key(r), self._seq); self._seq += 1
+        if self._cut is not None and rank > self._cut: return False
+        self._items.append((rank, r))
+        if len(self._items) >= 2 * self.k: self._prune()
+        return True
+
+    def _prune(self):
+        self._items.sort(key=lambda e: e[0])
+        del self._items[self.k:]
+        if len(self._items) >= self.k: self._cut = self._items[-1][0]
+
+    def results(self):
+        """Return the best k, best first."""
+        self._prune()
+        return [r for _, r in self._items]
+
+def is_refinement(old, new):
+    """Return True if every match for config *new* is also a match for *old*.
+
+    When it holds and the *old* search ran to completion without hitting
+    its result cap, the new results can be computed from the old ones
+    instead of walking the folder again.
+    """
+    if old["folder"] != new["folder"] or old["roots"] != new["roots"]: return False
+    if old["excludes"] != new["excludes"] or old["ignore_files"] != new["ignore_files"]: return False
+    # Dropping files can leave a duplicate with no copy left to match.
+    if old["duplicates"] or new["duplicates"]: return False
+
+    oq, nq = old["query"], new["query"]
+    if old["terms"] or new["terms"]:
+        # Only narrower filters over the same terms reuse a multi-term search.
+        if any(old[k] != new[k] for k in ("terms", "regex", "case_sensitive", "search_content")):
+            return False
+    elif oq:
+        if old["regex"] != new["regex"] or old["fuzzy"] != new["fuzzy"]: return False
+        if new["search_content"] and not old["search_content"]: return False
+        if old["fuzzy"] and FUZZY_AVAILABLE:
+            if oq != nq or old["case_sensitive"] != new["case_sensitive"]: return False
+            if new["fuzzy_threshold"] < old["fuzzy_threshold"]: return False
+        else:
+            if old["case_sensitive"] and not new["case_sensitive"]: return False
+            if old["regex"]:
+                if oq != nq: return False
+            elif old["case_sensitive"]:
+                if oq not in nq: return False
+            elif oq.lower() not in nq.lower(): return False
+
+    if old["types"]:
+        if not new["types"]: return False
+        if not {t.lower() for t in new["types"]} <= {t.lower() for t in old["types"]}: return False
+    if (new["min_size"] or 0) < (old["min_size"] or 0): return False
+    if old["max_size"] and not (new["max_size"] and new["max_size"] <= old["max_size"]): return False
+    # A higher content cap (0 is none) reaches files the old search skipped as too big.
+    if old["content_max_mb"] and not (new["content_max_mb"]
+                                      and new["content_max_mb"] <= old["content_max_mb"]): return False
+    if old["start_dt"] and not (new["start_dt"] and new["start_dt"] >= old["start_dt"]): return False
+    if old["end_dt"]   and not (new["end_dt"]   and new["end_dt"]   <= old["end_dt"]):   return False
+    return True
+
+# Config keys that decide which files match; the rest only shape the view.
+SCAN_KEYS = ("folder", "roots", "query", "fuzzy", "fuzzy_threshold", "regex",
+             "case_sensitive", "search_content", "content_max_mb", "excludes", "ignore_files",
+             "duplicates", "lines", "context_lines", "max_lines", "terms")
+
+def is_view_change(old, new, complete=True):
+    """Return True if config *new* can be shown from *old*'s results alone.
+
+    That holds when the query is unchanged and the post-filters are no
+    wider, whatever the sort order or cap. If *old* stopped at its cap
+    (*complete* is False) only a smaller cap under the same sort qualifies.
+    """
+    if old is None or any(old[k] != new[k] for k in SCAN_KEYS): return False
+    if complete: return is_refinement(old, new)
+    return (new["max_results"] <= old["max_results"]
+            and all(old[k] == new[k] for k in
+                    ("sort_by", "types", "min_size", "max_size", "start_dt", "end_dt")))
+
+def view_needs_stat(c):
+    """Return True if config *c*'s view reads each result's size or mtime."""
+    return bool(c["min_size"] or c["max_size"] or c["start_dt"] or c["end_dt"]
+                or c["sort_by"] in ("Date", "Size"))
+
+def view_results(results, c):
+    """Apply config *c*'s post-filters, sort order and cap to *results*."""
+    types = [t.lower() for t in c["types"]]
+    lo    = (c["min_size"] or 0) * 1024
+    hi    = c["max_size"] and c["max_size"] * 1024
+    start = c["start_dt"] and c["start_dt"].timestamp()
+    end   = c["end_dt"] and c["end_dt"].timestamp()
+    if view_needs_stat(c):
+        for r in results: fill_stat(r)
+    out   = [r for r in results
+             if r.mtime != STAT_MISSING
+             and (not types or r.name.lower().endswith(tuple(types)))
+             and (not lo or r.size >= lo) and (not hi or r.size <= hi)
+             and (not start or r.mtime >= start) and (not end or r.mtime <= end)]
+    sort_results(out, c["sort_by"])
+    del out[c["max_results"]:]
+    return out
 
 def fmt_size(b):
     if b < 1024:  return f"{b} B"
@@ -601,604 +2464,280 @@ def fmt_size(b):
 
 
 # ══════════════════════════════════════════════════════════════
-#  MAIN WINDOW
+#  EXPORT
 # ══════════════════════════════════════════════════════════════
-class QuickSearch(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("Finder+")
-        self.setMinimumSize(1050, 680)
-        self.resize(1300, 820)
-        self.folder_path      = ""
-        self._worker          = None
-        self._current_results = []
-        self._search_timer    = QTimer()
-        self._search_timer.setSingleShot(True)
-        self._search_timer.setInterval(320)
-        self._search_timer.timeout.connect(self.run_search)
-        self.init_ui()
-        self.setup_shortcuts()
-
-    # ── UI ────────────────────────────────────────────────────
-    def init_ui(self):
-        central = QWidget()
-        self.setCentralWidget(central)
-        root = QVBoxLayout(central)
-        root.setContentsMargins(0, 0, 0, 0)
-        root.setSpacing(0)
-
-        root.addWidget(self._build_toolbar())
-        root.addWidget(self._build_filter_panel())
-
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setRange(0, 100)
-        self.progress_bar.setFixedHeight(4)
-        self.progress_bar.hide()
-        root.addWidget(self.progress_bar)
-
-        body = QWidget()
-        body.setStyleSheet("background:#ffffff;")
-        body_lay = QHBoxLayout(body)
-        body_lay.setContentsMargins(12, 12, 12, 12)
-        body_lay.setSpacing(12)
-
-        splitter = QSplitter(Qt.Horizontal)
-        splitter.setHandleWidth(2)
-        splitter.addWidget(self._build_results_panel())
-        splitter.addWidget(self._build_preview_panel())
-        splitter.setSizes([740, 500])
-        body_lay.addWidget(splitter)
-        root.addWidget(body, stretch=1)
-
-        self.status_bar = QStatusBar()
-        self.setStatusBar(self.status_bar)
-        self._lbl_folder = QLabel("No folder selected")
-        self._lbl_folder.setObjectName("statMuted")
-        self._lbl_count  = QLabel("")
-        self._lbl_count.setObjectName("statAccent")
-        self._lbl_time   = QLabel("")
-        self._lbl_time.setObjectName("statMuted")
-        self.status_bar.addWidget(self._lbl_folder)
-        self.status_bar.addPermanentWidget(self._lbl_count)
-        self.status_bar.addPermanentWidget(self._lbl_time)
-
-    def _build_toolbar(self):
-        bar = QFrame()
-        bar.setObjectName("toolbar")
-        bar.setMinimumHeight(60)
-        lay = QHBoxLayout(bar)
-        lay.setContentsMargins(20, 8, 20, 8)
-        lay.setSpacing(14)
-
-        # title
-        title = QLabel("Finder+")
-        title.setStyleSheet(
-            "color: #ffffff; font-size: 22px; font-weight: 800; "
-            "letter-spacing: 1px; background: transparent; border: none;"
-        )
-        title.setMinimumWidth(120)
-        lay.addWidget(title)
+EXPORT_FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl",
+                  ".db": "sqlite", ".sqlite": "sqlite", ".sqlite3": "sqlite"}
+CSV_HEADER     = ("Name", "Path", "Root", "Size", "Modified", "Extension", "Score",
+                  "Content match", "Terms")
+SQLITE_BATCH   = 1000   # rows per executemany
+
+def export_format(path):
+    """Return the export format *path*'s extension names; ``txt`` otherwise."""
+    return EXPORT_FORMATS.get(os.path.splitext(path)[1].lower(), "txt")
+
+def result_dict(r):
+    """Return result *r* as a JSON-ready dict, stat'ing it if need be.
+    The caller leaves out ``missing`` results."""
+    fill_stat(r)
+    row = {
+        "path": r.full_path, "root": r.root, "name": r.name, "size": r.size,
+        "mtime": r.modified.isoformat(timespec="seconds"),
+        "score": r.score, "content_matches": r.content_matches,
+    }
+    if r.dup_group is not None: row["group"] = r.dup_group
+    if r.terms is not None: row["terms"] = r.terms
+    if r.lines is not None:
+        row["line_count"] = r.line_count
+        row["lines"] = [{"line": n, "text": t, "match": hit} for n, t, hit in r.lines]
+    return row
+
+
+class Exporter:
+    """Write results to *path* one at a time, as they arrive.
+
+    *fmt* is ``csv``, ``jsonl``, ``sqlite`` (a ``results`` table, replaced
+    if there is one) or ``txt`` (one path per line after the *header*
+    lines); by default it follows *path*'s extension. Nothing is held but
+    the pending SQLite batch, so a search of any size can be written out.
+    Use it as a context manager, or call ``close()``.
+    """
+
+    def __init__(self, path, fmt=None, header=()):
+        self.path, self.fmt, self.count = path, fmt or export_format(path), 0
+        self._file = self._db = None
+        if self.fmt == "sqlite":
+            self._db = sqlite3.connect(path)
+            self._db.executescript("""
+                PRAGMA journal_mode=OFF;
+                PRAGMA synchronous=OFF;
+                DROP TABLE IF EXISTS results;
+                CREATE TABLE results (
+                    path TEXT, root TEXT, folder TEXT, name TEXT, ext TEXT,
+                    size INTEGER, mtime REAL, score REAL, content_matches TEXT,
+                    dup_group INTEGER, line_count INTEGER, terms TEXT);
+            """)
+            self._batch = []
+            return
+        self._file = open(path, "w", encoding="utf-8", newline="" if self.fmt == "csv" else None)
+        if self.fmt == "csv":
+            self._csv = csv.writer(self._file)
+            self._csv.writerow(CSV_HEADER)
+        elif self.fmt == "txt":
+            for line in header: self._file.write(line + "\n")
+
+    def write(self, r):
+        """Write *r*; a file that can no longer be stat'ed is left out."""
+        fmt = self.fmt
+        if fmt != "txt" and fill_stat(r).missing: return
+        if fmt == "txt":
+            self._file.write(r.full_path + "\n")
+        elif fmt == "jsonl":
+            self._file.write(json.dumps(result_dict(r)) + "\n")
+        elif fmt == "csv":
+            self._csv.writerow((r.name, r.full_path, r.root, r.size,
+                                r.modified.isoformat(sep=" ", timespec="seconds"), r.ext,
+                                r.score, r.content_matches[0] if r.content_matches else "",
+                                format_terms(r.terms) if r.terms else ""))
+        else:
+            self._batch.append((r.full_path, r.root, r.folder, r.name, r.ext, r.size, r.mtime,
+                                r.score, json.dumps(r.content_matches), r.dup_group,
+                                r.line_count if r.lines is not None else None,
+                                json.dumps(r.terms) if r.terms is not None else None))
+            if len(self._batch) >= SQLITE_BATCH: self._flush()
+        self.count += 1
 
-        lay.addWidget(self._vsep("#818cf8"))
+    def _flush(self):
+        self._db.executemany("INSERT INTO results VALUES (?,?,?,?,?,?,?,?,?,?,?,?)", self._batch)
+        self._batch = []
 
-        # folder display
-        self.folder_label = QLabel("No folder selected")
-        self.folder_label.setStyleSheet(
-            "color: #c7d2fe; font-size: 12px; background: transparent; border: none;"
-        )
-        self.folder_label.setMaximumWidth(480)
-        lay.addWidget(self.folder_label)
-
-        # Select Folder — ghost/outline style that belongs on the indigo bar
-        folder_btn = QPushButton("Select Folder")
-        folder_btn.setStyleSheet(
-            "QPushButton {"
-            "  background: transparent;"
-            "  border: 2px solid #a5b4fc;"
-            "  border-radius: 8px;"
-            "  color: #e0e7ff;"
-            "  font-size: 13px;"
-            "  font-weight: 700;"
-            "  min-width: 140px;"
-            "  min-height: 36px;"
-            "  padding: 6px 20px;"
-            "}"
-            "QPushButton:hover {"
-            "  background: #4f46e5;"
-            "  border-color: #c7d2fe;"
-            "  color: #ffffff;"
-            "}"
-            "QPushButton:pressed {"
-            "  background: #3730a3;"
-            "  border-color: #818cf8;"
-            "}"
-        )
-        folder_btn.clicked.connect(self.select_folder)
-        lay.addWidget(folder_btn)
-
-        lay.addStretch()
-
-        # Export — soft indigo pill
-        export_btn = QPushButton("Export")
-        export_btn.setStyleSheet(
-            "QPushButton {"
-            "  background: rgba(255,255,255,0.15);"
-            "  border: 2px solid rgba(255,255,255,0.35);"
-            "  border-radius: 8px;"
-            "  color: #e0e7ff;"
-            "  font-size: 12px;"
-            "  font-weight: 700;"
-            "  min-width: 82px;"
-            "  min-height: 34px;"
-            "  padding: 6px 14px;"
-            "}"
-            "QPushButton:hover {"
-            "  background: rgba(255,255,255,0.25);"
-            "  border-color: rgba(255,255,255,0.6);"
-            "  color: #ffffff;"
-            "}"
-            "QPushButton:pressed { background: rgba(255,255,255,0.1); }"
-        )
-        export_btn.clicked.connect(self.export_results)
-        lay.addWidget(export_btn)
-
-        # Clear — soft red pill that still feels at home on indigo
-        clear_btn = QPushButton("Clear")
-        clear_btn.setStyleSheet(
-            "QPushButton {"
-            "  background: rgba(254,202,202,0.2);"
-            "  border: 2px solid rgba(252,165,165,0.5);"
-            "  border-radius: 8px;"
-            "  color: #fecaca;"
-            "  font-size: 12px;"
-            "  font-weight: 700;"
-            "  min-width: 72px;"
-            "  min-height: 34px;"
-            "  padding: 6px 12px;"
-            "}"
-            "QPushButton:hover {"
-            "  background: rgba(239,68,68,0.3);"
-            "  border-color: #fca5a5;"
-            "  color: #ffffff;"
-            "}"
-            "QPushButton:pressed { background: rgba(239,68,68,0.5); }"
-        )
-        clear_btn.clicked.connect(self.clear_all)
-        lay.addWidget(clear_btn)
-
-        return bar
+    def close(self):
+        if self._db is not None:
+            self._flush()
+            self._db.commit(); self._db.close(); self._db = None
+        if self._file is not None:
+            self._file.close(); self._file = None
 
-    def _build_filter_panel(self):
-        panel = QFrame()
-        panel.setObjectName("filterPanel")
-        outer = QVBoxLayout(panel)
-        outer.setContentsMargins(16, 10, 16, 10)
-        outer.setSpacing(8)
+    def __enter__(self): return self
+    def __exit__(self, *exc): self.close()
 
-        # ── Row 1: search + mode toggles ──
-        r1 = QHBoxLayout(); r1.setSpacing(8)
 
-        tag1 = QLabel("SEARCH")
-        tag1.setStyleSheet(
-            "background: #6366f1; color: #ffffff; border-radius: 6px;"
-            "padding: 4px 10px; font-size: 10px; font-weight: 800; letter-spacing: 0.1em;"
-        )
-        tag1.setFixedHeight(28)
-        r1.addWidget(tag1)
-
-        self.search_bar = QLineEdit()
-        self.search_bar.setPlaceholderText("Type to search filenames or file contents...")
-        self.search_bar.setMinimumHeight(36)
-        self.search_bar.textChanged.connect(self._trigger)
-        r1.addWidget(self.search_bar)
-
-        def tbtn(text, tip, sc=""):
-            b = QPushButton(text)
-            b.setObjectName("toggleBtn")
-            b.setCheckable(True)
-            b.setToolTip(f"{tip}  {sc}".strip())
-            b.toggled.connect(self._trigger)
-            return b
-
-        self.btn_regex   = tbtn(".*",  "Regex mode",            "Ctrl+R")
-        self.btn_case    = tbtn("Aa",  "Case sensitive",         "Ctrl+Shift+C")
-        self.btn_fuzzy   = tbtn("~",   "Fuzzy match",            "Ctrl+F")
-        self.btn_content = tbtn("[ ]", "Search inside files",    "Ctrl+Shift+F")
-
-        if not FUZZY_AVAILABLE:
-            self.btn_fuzzy.setEnabled(False)
-            self.btn_fuzzy.setToolTip("pip install rapidfuzz to enable fuzzy matching")
-
-        for b in (self.btn_regex, self.btn_case, self.btn_fuzzy, self.btn_content):
-            r1.addWidget(b)
-        outer.addLayout(r1)
-
-        # ── Row 2: filters ──
-        r2 = QHBoxLayout(); r2.setSpacing(8)
-
-        tag2 = QLabel("FILTERS")
-        tag2.setStyleSheet(
-            "background: #06b6d4; color: #ffffff; border-radius: 6px;"
-            "padding: 4px 10px; font-size: 10px; font-weight: 800; letter-spacing: 0.1em;"
-        )
-        tag2.setFixedHeight(28)
-        r2.addWidget(tag2)
-
-        self.type_filter = QLineEdit()
-        self.type_filter.setPlaceholderText("Extensions: .py .js .txt")
-        self.type_filter.setMaximumWidth(200)
-        self.type_filter.setMinimumHeight(32)
-        self.type_filter.textChanged.connect(self._trigger)
-        r2.addWidget(self.type_filter)
-
-        r2.addWidget(self._vsep())
-
-        self.start_date = QLineEdit()
-        self.start_date.setPlaceholderText("From YYYY-MM-DD")
-        self.start_date.setMaximumWidth(138)
-        self.start_date.setMinimumHeight(32)
-        self.start_date.textChanged.connect(self._trigger)
-        r2.addWidget(self.start_date)
-
-        self.end_date = QLineEdit()
-        self.end_date.setPlaceholderText("To YYYY-MM-DD")
-        self.end_date.setMaximumWidth(138)
-        self.end_date.setMinimumHeight(32)
-        self.end_date.textChanged.connect(self._trigger)
-        r2.addWidget(self.end_date)
-
-        r2.addWidget(self._vsep())
-
-        for ltext in ["SIZE KB"]:
-            lbl = QLabel(ltext); lbl.setObjectName("sectionLabel"); r2.addWidget(lbl)
-
-        self.min_size = QSpinBox()
-        self.min_size.setRange(0, 1_000_000); self.min_size.setSpecialValueText("min")
-        self.min_size.setMaximumWidth(78); self.min_size.setMinimumHeight(32)
-        self.min_size.valueChanged.connect(self._trigger)
-        r2.addWidget(self.min_size)
-
-        dash = QLabel("—"); dash.setObjectName("sectionLabel"); r2.addWidget(dash)
-
-        self.max_size = QSpinBox()
-        self.max_size.setRange(0, 1_000_000); self.max_size.setSpecialValueText("max")
-        self.max_size.setMaximumWidth(78); self.max_size.setMinimumHeight(32)
-        self.max_size.valueChanged.connect(self._trigger)
-        r2.addWidget(self.max_size)
-
-        r2.addWidget(self._vsep())
-
-        sort_lbl = QLabel("SORT"); sort_lbl.setObjectName("sectionLabel"); r2.addWidget(sort_lbl)
-        self.sort_combo = QComboBox()
-        self.sort_combo.addItems(["Relevance","Name","Date","Size","Extension"])
-        self.sort_combo.setMinimumHeight(32)
-        self.sort_combo.currentTextChanged.connect(self._trigger)
-        r2.addWidget(self.sort_combo)
-
-        r2.addWidget(self._vsep())
-
-        max_lbl = QLabel("MAX"); max_lbl.setObjectName("sectionLabel"); r2.addWidget(max_lbl)
-        self.max_results_spin = QSpinBox()
-        self.max_results_spin.setRange(10, 100_000); self.max_results_spin.setValue(5000)
-        self.max_results_spin.setSingleStep(500); self.max_results_spin.setMaximumWidth(82)
-        self.max_results_spin.setMinimumHeight(32)
-        self.max_results_spin.valueChanged.connect(self._trigger)
-        r2.addWidget(self.max_results_spin)
-
-        self.fuzzy_thr_lbl = QLabel("THRESHOLD"); self.fuzzy_thr_lbl.setObjectName("sectionLabel")
-        self.fuzzy_thr_lbl.hide(); r2.addWidget(self.fuzzy_thr_lbl)
-
-        self.fuzzy_threshold = QSpinBox()
-        self.fuzzy_threshold.setRange(0,100); self.fuzzy_threshold.setValue(60)
-        self.fuzzy_threshold.setMaximumWidth(68); self.fuzzy_threshold.setMinimumHeight(32)
-        self.fuzzy_threshold.hide(); self.fuzzy_threshold.valueChanged.connect(self._trigger)
-        r2.addWidget(self.fuzzy_threshold)
-        self.btn_fuzzy.toggled.connect(lambda v:(
-            self.fuzzy_thr_lbl.setVisible(v), self.fuzzy_threshold.setVisible(v)))
-
-        r2.addStretch()
-
-        self.group_btn = QPushButton("Group by folder")
-        self.group_btn.setCheckable(True)
-        self.group_btn.setMinimumHeight(32)
-        self.group_btn.toggled.connect(lambda _: self._populate_tree(self._current_results))
-        r2.addWidget(self.group_btn)
-
-        outer.addLayout(r2)
-        return panel
-
-    def _build_results_panel(self):
-        wrap = QWidget()
-        wrap.setStyleSheet("QWidget { background: #ffffff; }")
-        lay = QVBoxLayout(wrap)
-        lay.setContentsMargins(0, 0, 0, 0)
-        lay.setSpacing(6)
-
-        hdr = QHBoxLayout()
-        res_lbl = QLabel("RESULTS")
-        res_lbl.setStyleSheet(
-            "color: #6366f1; font-size: 10px; font-weight: 800; letter-spacing: 0.15em;"
-        )
-        hdr.addWidget(res_lbl); hdr.addStretch()
-        lay.addLayout(hdr)
-
-        self.tree = QTreeWidget()
-        self.tree.setColumnCount(4)
-        self.tree.setHeaderLabels(["Name", "Path", "Size", "Modified"])
-        self.tree.setAlternatingRowColors(True)
-        self.tree.setSelectionMode(QAbstractItemView.ExtendedSelection)
-        self.tree.setRootIsDecorated(True)
-        self.tree.header().setSectionResizeMode(0, QHeaderView.Interactive)
-        self.tree.header().setSectionResizeMode(1, QHeaderView.Stretch)
-        self.tree.header().setSectionResizeMode(2, QHeaderView.Fixed)
-        self.tree.header().setSectionResizeMode(3, QHeaderView.Fixed)
-        self.tree.header().resizeSection(0, 240)
-        self.tree.header().resizeSection(2, 78)
-        self.tree.header().resizeSection(3, 94)
-        self.tree.setContextMenuPolicy(Qt.CustomContextMenu)
-        self.tree.customContextMenuRequested.connect(self._context_menu)
-        self.tree.currentItemChanged.connect(self._on_select)
-        self.tree.itemActivated.connect(self._open_item)
-        lay.addWidget(self.tree)
-        return wrap
-
-    def _build_preview_panel(self):
-        wrap = QWidget()
-        wrap.setStyleSheet("QWidget { background: #ffffff; }")
-        lay = QVBoxLayout(wrap)
-        lay.setContentsMargins(0, 0, 0, 0)
-        lay.setSpacing(6)
-
-        hdr = QHBoxLayout()
-        hdr.setContentsMargins(0, 0, 0, 0)
-        prev_lbl = QLabel("PREVIEW")
-        prev_lbl.setStyleSheet(
-            "color: #06b6d4; font-size: 10px; font-weight: 800; letter-spacing: 0.15em;"
-        )
-        hdr.addWidget(prev_lbl); hdr.addStretch()
-        self.preview_path_lbl = QLabel("")
-        self.preview_path_lbl.setObjectName("statMuted")
-        self.preview_path_lbl.setMaximumWidth(300)
-        hdr.addWidget(self.preview_path_lbl)
-        lay.addLayout(hdr)
-
-        self.preview = QTextEdit()
-        self.preview.setReadOnly(True)
-        self.preview.setLineWrapMode(QTextEdit.NoWrap)
-        lay.addWidget(self.preview)
-        self._highlighter = None
-        return wrap
-
-    # ── HELPERS ───────────────────────────────────────────────
-    def _vsep(self, color="#e5e7eb"):
-        s = QFrame(); s.setFrameShape(QFrame.VLine)
-        s.setStyleSheet(f"color: {color};"); s.setFixedHeight(22)
-        return s
-
-    # ── SHORTCUTS ─────────────────────────────────────────────
-    def setup_shortcuts(self):
-        for key, fn in [
-            ("Ctrl+R",       lambda: self.btn_regex.setChecked(not self.btn_regex.isChecked())),
-            ("Ctrl+F",       lambda: self.btn_fuzzy.setChecked(not self.btn_fuzzy.isChecked())),
-            ("Ctrl+Shift+F", lambda: self.btn_content.setChecked(not self.btn_content.isChecked())),
-            ("Ctrl+Shift+C", lambda: self.btn_case.setChecked(not self.btn_case.isChecked())),
-            ("Ctrl+L",       self.search_bar.setFocus),
-            ("Escape",       self.abort_search),
-            ("Ctrl+E",       self.export_results),
-            ("Ctrl+O",       self.select_folder),
-        ]:
-            a = QAction(self); a.setShortcut(QKeySequence(key))
-            a.triggered.connect(fn); self.addAction(a)
-
-    # ── EVENTS ────────────────────────────────────────────────
-    def _trigger(self): self._search_timer.start()
-
-    def select_folder(self):
-        folder = QFileDialog.getExistingDirectory(self, "Select Folder")
-        if folder:
-            self.folder_path = folder
-            display = folder if len(folder) < 65 else "..." + folder[-62:]
-            self.folder_label.setText(display)
-            self._lbl_folder.setText(display)
-            self.run_search()
-
-    def abort_search(self):
-        if self._worker and self._worker.isRunning():
-            self._worker.abort(); self.progress_bar.hide()
-            self.status_bar.showMessage("Cancelled", 2000)
-
-    def clear_all(self):
-        for w in (self.search_bar, self.type_filter, self.start_date, self.end_date):
-            w.clear()
-        self.tree.clear(); self.preview.clear()
-        self.preview_path_lbl.setText("")
-        self._current_results = []
-        self._lbl_count.setText(""); self._lbl_time.setText("")
-
-    # ── SEARCH ────────────────────────────────────────────────
-    def run_search(self):
-        if not self.folder_path: return
-        self.abort_search()
-        types = [t.strip() for t in self.type_filter.text().replace(","," ").split() if t.strip()]
-        s, e  = self.start_date.text().strip(), self.end_date.text().strip()
+# ══════════════════════════════════════════════════════════════
+#  COMMAND LINE
+# ══════════════════════════════════════════════════════════════
+SORT_CHOICES = {"relevance": "Relevance", "name": "Name", "date": "Date",
+                "size": "Size", "extension": "Extension"}
+
+def cli(argv=None):
+    """Run ``finderplus.py --cli``: search without the GUI, one match per line.
+
+    Without ``--sort`` matches are printed as they are found; with it the
+    best ``--max`` are printed once the scan is done. Exits 0 if anything
+    matched, 1 if nothing did and 2 on a bad argument or pattern.
+    """
+    import argparse
+
+    def day(text): return datetime.strptime(text, "%Y-%m-%d")
+
+    ap = argparse.ArgumentParser(prog="finderplus.py --cli",
+                                 description="Search a folder without opening the window.")
+    ap.add_argument("folder")
+    ap.add_argument("query", nargs="?", default="")
+    ap.add_argument("--root", action="append", default=[], metavar="DIR",
+                    help="search DIR as well; may be repeated")
+    ap.add_argument("-r", "--regex", action="store_true", help="treat the query as a regex")
+    ap.add_argument("-f", "--fuzzy", type=int, metavar="SCORE",
+                    help="fuzzy-match names scoring at least SCORE (0-100)")
+    ap.add_argument("-s", "--case-sensitive", action="store_true")
+    ap.add_argument("-e", "--term", action="append", default=[], metavar="TERM",
+                    help="search for TERM as well, in one pass with the query and other "
+                         "terms, and report which were found; may be repeated")
+    ap.add_argument("-F", "--terms-file", metavar="FILE",
+                    help="read terms from FILE, one a line ('-' for stdin)")
+    ap.add_argument("-c", "--content", action="store_true", help="search file contents too")
+    ap.add_argument("--lines", action="store_true",
+                    help="print every matching line as PATH:LINE:TEXT, like grep (implies -c)")
+    ap.add_argument("-C", "--context", type=int, default=0, metavar="N",
+                    help="with --lines, also print N lines either side of each match")
+    ap.add_argument("--max-lines", type=int, default=DEFAULT_CONFIG["max_lines"], metavar="N",
+                    help="with --lines, keep at most N matching lines per file; the count "
+                         "stays exact (default %(default)s)")
+    ap.add_argument("-t", "--type", action="append", default=[], metavar="EXT",
+                    help="only names ending in EXT; may be repeated")
+    ap.add_argument("--min-size", type=int, metavar="KB")
+    ap.add_argument("--max-size", type=int, metavar="KB")
+    ap.add_argument("--after",  type=day, metavar="YYYY-MM-DD", help="modified on or after")
+    ap.add_argument("--before", type=day, metavar="YYYY-MM-DD", help="modified on or before")
+    ap.add_argument("--sort", choices=SORT_CHOICES)
+    ap.add_argument("-D", "--duplicates", action="store_true",
+                    help="list only files with identical contents, grouped, "
+                         "most reclaimable space first")
+    ap.add_argument("-n", "--max", type=int, default=DEFAULT_CONFIG["max_results"],
+                    help="maximum number of matches, 0 for no limit (default %(default)s)")
+    ap.add_argument("-j", "--workers", type=int, default=1,
+                    help="processes for content search (default 1)")
+    ap.add_argument("--readahead", type=int, default=DEFAULT_CONFIG["readahead"], metavar="N",
+                    help="threads reading files ahead of the matcher, 0 for none "
+                         "(default %(default)s; only with one worker)")
+    ap.add_argument("--readahead-mb", type=int, default=DEFAULT_CONFIG["readahead_mb"],
+                    metavar="MB", help="most file data read ahead at once (default %(default)s)")
+    ap.add_argument("--max-mb", type=int, default=0, help="skip contents of larger files")
+    ap.add_argument("-x", "--exclude", action="append", default=[], metavar="GLOB",
+                    help="skip paths matching GLOB (gitignore syntax, e.g. node_modules "
+                         "or build/); may be repeated")
+    ap.add_argument("--ignore-files", action="store_true",
+                    help="also skip what .gitignore and .ignore files list")
+    ap.add_argument("--index", action="store_true", help="use the folder index")
+    ap.add_argument("--refresh-index", action="store_true", help="refresh the index first")
+    ap.add_argument("--json", action="store_true", help="print JSON Lines instead of paths")
+    ap.add_argument("-o", "--output", metavar="FILE",
+                    help="write matches to FILE instead: CSV, JSON Lines or SQLite by its "
+                         "extension (.csv, .jsonl, .db), else one path per line")
+    ap.add_argument("--stats", action="store_true",
+                    help="print counters and phase timings to stderr as JSON when done")
+    a = ap.parse_intermixed_args(argv)
+    for folder in [a.folder, *a.root]:
+        if not os.path.isdir(folder): ap.error(f"not a folder: {folder}")
+    terms = a.term
+    if a.terms_file:
         try:
-            start_dt = datetime.strptime(s, "%Y-%m-%d") if s else None
-            end_dt   = datetime.strptime(e, "%Y-%m-%d") if e else None
-        except ValueError:
-            self.status_bar.showMessage("Invalid date — use YYYY-MM-DD", 3000); return
-
-        config = dict(
-            folder=self.folder_path, query=self.search_bar.text(),
-            types=types, start_dt=start_dt, end_dt=end_dt,
-            fuzzy=self.btn_fuzzy.isChecked(), fuzzy_threshold=self.fuzzy_threshold.value(),
-            regex=self.btn_regex.isChecked(), case_sensitive=self.btn_case.isChecked(),
-            search_content=self.btn_content.isChecked(),
-            min_size=self.min_size.value() or None, max_size=self.max_size.value() or None,
-            sort_by=self.sort_combo.currentText(), max_results=self.max_results_spin.value(),
-        )
-        self._worker = SearchWorker(config)
-        self._worker.result_ready.connect(self._on_results)
-        self._worker.progress.connect(self.progress_bar.setValue)
-        self._worker.status_msg.connect(self.status_bar.showMessage)
-        self._worker.finished.connect(self._on_done)
-        self.progress_bar.setValue(0); self.progress_bar.show()
-        self.status_bar.showMessage("Searching...")
-        self._worker.start()
-
-    def _on_results(self, results):
-        self._current_results = results
-        self._populate_tree(results)
-
-    def _populate_tree(self, results):
-        self.tree.clear()
-        if not results: return
-        if self.group_btn.isChecked():
-            folders = {}
-            for r in results: folders.setdefault(r["folder"],[]).append(r)
-            for folder, items in sorted(folders.items()):
-                rel = os.path.relpath(folder, self.folder_path)
-                p   = QTreeWidgetItem(self.tree, [rel, "", f"{len(items)} files", ""])
-                p.setForeground(0, QColor("#94a3b8"))
-                for r in items: self._add_row(p, r)
-                p.setExpanded(True)
+            with (sys.stdin if a.terms_file == "-" else
+                  open(a.terms_file, encoding="utf-8", errors="replace")) as f:
+                terms = terms + read_terms(f.read())
+        except OSError as ex:
+            ap.error(f"cannot read {a.terms_file}: {ex.strerror}")
+    # The query, if any, is searched for as one more term.
+    terms = read_terms("\n".join([a.query, *terms])) if terms else []
+
+    c = make_config(
+        a.folder, query=a.query, types=a.type, start_dt=a.after, end_dt=a.before,
+        fuzzy=a.fuzzy is not None, fuzzy_threshold=a.fuzzy or 0,
+        regex=a.regex, case_sensitive=a.case_sensitive,
+        search_content=a.content or a.lines, content_workers=a.workers, content_max_mb=a.max_mb,
+        lines=a.lines, context_lines=a.context, max_lines=a.max_lines,
+        readahead=a.readahead, readahead_mb=a.readahead_mb,
+        use_index=a.index or a.refresh_index, refresh_index=a.refresh_index,
+        min_size=a.min_size, max_size=a.max_size,
+        sort_by=SORT_CHOICES.get(a.sort, "Relevance"), max_results=a.max or sys.maxsize,
+        roots=[a.folder, *a.root] if a.root else None,
+        excludes=a.exclude, ignore_files=a.ignore_files, duplicates=a.duplicates,
+        terms=terms,
+        # With no limit and nothing to sort, matches are written and let go.
+        keep_results=bool(a.max) or a.sort is not None or a.duplicates,
+    )
+    try:
+        search = make_search(c, status=lambda message: print(message, file=sys.stderr))
+    except re.error as ex:
+        print(f"finderplus: invalid regex: {ex}", file=sys.stderr)
+        return 2
+
+    out = sys.stdout
+    try:
+        export = Exporter(a.output) if a.output else None
+    except (OSError, sqlite3.Error) as ex:
+        print(f"finderplus: cannot write {a.output}: {ex}", file=sys.stderr)
+        return 2
+    def emit(r):
+        if export:
+            export.write(r)
+        elif a.json:
+            if not fill_stat(r).missing: out.write(json.dumps(result_dict(r)) + "\n")
+        elif r.lines:
+            # grep's layout: ':' after a matching line's number, '-' after a
+            # context line's, and '--' between runs that are not adjacent.
+            prev = None
+            for n, t, hit in r.lines:
+                if a.context and prev is not None and n > prev + 1: out.write("--\n")
+                out.write(f"{r.full_path}{':' if hit else '-'}{n}{':' if hit else '-'}{t}\n")
+                prev = n
+        elif r.terms is not None:
+            out.write(f"{r.full_path}\t{format_terms(r.terms)}\n")
         else:
-            for r in results: self._add_row(self.tree, r)
-
-    def _add_row(self, parent, r):
-        item = QTreeWidgetItem([
-            r["name"], r["rel_path"], fmt_size(r["size"]),
-            r["mtime"].strftime("%Y-%m-%d")
-        ])
-        item.setData(0, Qt.UserRole, r["full_path"])
-        item.setForeground(0, QColor(ext_color(r["ext"])))
-        item.setForeground(1, QColor("#94a3b8"))
-        item.setForeground(2, QColor("#64748b"))
-        item.setForeground(3, QColor("#64748b"))
-        if r["content_matches"]:
-            item.setForeground(1, QColor("#16a34a"))
-            item.setToolTip(1, "Content match: " + r["content_matches"][0][:120])
-        if isinstance(parent, QTreeWidget): parent.addTopLevelItem(item)
-        else: parent.addChild(item)
-
-    def _on_done(self, count, elapsed):
-        self.progress_bar.hide()
-        self._lbl_count.setText(f"{count:,} results")
-        self._lbl_time.setText(f"  {elapsed:.2f}s")
-        self.status_bar.showMessage(f"Found {count:,} results in {elapsed:.2f}s", 5000)
-
-    # ── PREVIEW ───────────────────────────────────────────────
-    def _on_select(self, current, _):
-        if not current: return
-        path = current.data(0, Qt.UserRole)
-        if path and os.path.isfile(path): self._load_preview(path)
-
-    def _load_preview(self, path):
-        self.preview_path_lbl.setText(os.path.basename(path))
-        ext = Path(path).suffix.lower()
-        TEXT_EXTS = {
-            ".txt",".py",".js",".ts",".jsx",".tsx",".html",".htm",".css",
-            ".scss",".json",".xml",".yaml",".yml",".md",".rst",".toml",
-            ".ini",".cfg",".sh",".bash",".c",".cpp",".h",".java",".kt",
-            ".go",".rs",".rb",".php",".swift",".sql",".log",".csv",".env",
-            ".lua",".dart",".vue",".svelte",".ipynb",".tf",
-        }
-        if ext not in TEXT_EXTS:
-            self.preview.setPlainText(f"[No preview available for {ext} files]"); return
-        try:
-            with open(path, "r", encoding="utf-8", errors="ignore") as f:
-                content = f.read(500_000)
-            if os.path.getsize(path) > 500_000:
-                content += "\n\n[... truncated at 500 KB ...]"
-            self.preview.setPlainText(content)
-            self._highlighter = MatchHighlighter(
-                self.preview.document(), self.search_bar.text(),
-                self.btn_case.isChecked(), self.btn_regex.isChecked()
-            )
-            q = self.search_bar.text()
-            if q:
-                cur = self.preview.document().find(q)
-                if cur and not cur.isNull():
-                    self.preview.setTextCursor(cur)
-                    self.preview.ensureCursorVisible()
-        except Exception as ex:
-            self.preview.setPlainText(f"[Error reading file: {ex}]")
-
-    # ── CONTEXT MENU ──────────────────────────────────────────
-    def _context_menu(self, pos):
-        items = self.tree.selectedItems()
-        if not items: return
-        menu   = QMenu(self)
-        a_open = menu.addAction("Open file")
-        a_dir  = menu.addAction("Open containing folder")
-        menu.addSeparator()
-        a_cp   = menu.addAction("Copy path")
-        a_cn   = menu.addAction("Copy filename")
-        a_ca   = menu.addAction(f"Copy all paths  ({len(items)})")
-        act    = menu.exec(QCursor.pos())
-        paths  = [i.data(0, Qt.UserRole) for i in items if i.data(0, Qt.UserRole)]
-        if not paths: return
-        if   act == a_open: [QDesktopServices.openUrl(QUrl.fromLocalFile(p)) for p in paths[:5] if os.path.isfile(p)]
-        elif act == a_dir:  [QDesktopServices.openUrl(QUrl.fromLocalFile(os.path.dirname(p))) for p in paths[:5]]
-        elif act == a_cp:   QApplication.clipboard().setText(paths[0])
-        elif act == a_cn:   QApplication.clipboard().setText(os.path.basename(paths[0]))
-        elif act == a_ca:   QApplication.clipboard().setText("\n".join(paths))
-
-    def _open_item(self, item, _):
-        path = item.data(0, Qt.UserRole)
-        if path and os.path.isfile(path): QDesktopServices.openUrl(QUrl.fromLocalFile(path))
-
-    # ── EXPORT ────────────────────────────────────────────────
-    def export_results(self):
-        if not self._current_results:
-            self.status_bar.showMessage("Nothing to export", 2000); return
-        save_path, _ = QFileDialog.getSaveFileName(
-            self, "Export Results", "results.txt",
-            "Text Files (*.txt);;CSV Files (*.csv)"
-        )
-        if not save_path: return
-        try:
-            with open(save_path, "w", encoding="utf-8") as f:
-                if save_path.endswith(".csv"):
-                    f.write("Name,Path,Size,Modified,Extension\n")
-                    for r in self._current_results:
-                        f.write(f'"{r["name"]}","{r["full_path"]}",{r["size"]},{r["mtime"]:%Y-%m-%d},{r["ext"]}\n')
-                else:
-                    f.write(f"QuickSearch Export — {datetime.now():%Y-%m-%d %H:%M:%S}\n")
-                    f.write(f"Folder : {self.folder_path}\nQuery  : {self.search_bar.text()}\n")
-                    f.write(f"Results: {len(self._current_results)}\n{'─'*80}\n\n")
-                    for r in self._current_results: f.write(r["full_path"] + "\n")
-            self.status_bar.showMessage(f"Exported to {save_path}", 3000)
-        except Exception as ex:
-            self.status_bar.showMessage(f"Export failed: {ex}", 4000)
+            out.write(r.full_path + "\n")
+
+    # Duplicates come out a group at a time once the scan is done, groups
+    # separated by a blank line in plain output.
+    ordered = a.sort is not None or a.duplicates
+    found = 0
+    try:
+        for r in search:
+            if not ordered: emit(r)
+            found += 1
+        group = None
+        for r in search.results() if ordered else ():
+            if a.duplicates and not (a.json or export) and group not in (None, r.dup_group):
+                out.write("\n")
+            group = r.dup_group
+            emit(r)
+        out.flush()
+        if a.stats: print(json.dumps(search.report(), indent=2), file=sys.stderr)
+        elif terms:
+            # Per-term totals close the run, on stderr so piped output stays paths.
+            print(f"{'hits':>10} {'files':>8}  term", file=sys.stderr)
+            for term, t in search.report()["terms"].items():
+                print(f"{t['hits']:>10,} {t['files']:>8,}  {term}", file=sys.stderr)
+    except BrokenPipeError:
+        # The reader went away (`| head`); stop quietly, and keep Python
+        # from failing again when it flushes stdout at exit.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    except (OSError, sqlite3.Error) as ex:
+        print(f"finderplus: cannot write {a.output or 'output'}: {ex}", file=sys.stderr)
+        return 2
+    except KeyboardInterrupt:
+        return 130
+    finally:
+        if export: export.close()
+    return 0 if found else 1
 
 
 # ══════════════════════════════════════════════════════════════
 #  ENTRY POINT
 # ══════════════════════════════════════════════════════════════
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    app.setStyle("Fusion")
-    app.setStyleSheet(STYLE)
-
-    pal = QPalette()
-    pal.setColor(QPalette.Window,          QColor("#ffffff"))
-    pal.setColor(QPalette.WindowText,      QColor("#1a1a2e"))
-    pal.setColor(QPalette.Base,            QColor("#ffffff"))
-    pal.setColor(QPalette.AlternateBase,   QColor("#f9fafb"))
-    pal.setColor(QPalette.ToolTipBase,     QColor("#ffffff"))
-    pal.setColor(QPalette.ToolTipText,     QColor("#1a1a2e"))
-    pal.setColor(QPalette.Text,            QColor("#1a1a2e"))
-    pal.setColor(QPalette.Button,          QColor("#ffffff"))
-    pal.setColor(QPalette.ButtonText,      QColor("#374151"))
-    pal.setColor(QPalette.BrightText,      QColor("#6366f1"))
-    pal.setColor(QPalette.Highlight,       QColor("#e0e7ff"))
-    pal.setColor(QPalette.HighlightedText, QColor("#3730a3"))
-    pal.setColor(QPalette.Light,           QColor("#f9fafb"))
-    pal.setColor(QPalette.Mid,             QColor("#e5e7eb"))
-    pal.setColor(QPalette.Dark,            QColor("#d1d5db"))
-    pal.setColor(QPalette.Shadow,          QColor("#9ca3af"))
-    app.setPalette(pal)
-
-    window = QuickSearch()
-    window.show()
-    sys.exit(app.exec())
+    multiprocessing.freeze_support()
+    if "--cli" in sys.argv[1:]:
+        argv = sys.argv[1:]
+        argv.remove("--cli")
+        sys.exit(cli(argv))
+    from finderplus_gui import main
+    main()
@@ -0,0 +1,2307 @@
+"""Finder+ desktop window: a PySide6 front end over the engine in finderplus.py."""
+import sys
+import os
+import re
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+from PySide6.QtWidgets import (
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLineEdit,
+    QLabel, QPushButton, QFileDialog, QFrame, QSplitter,
+    QTreeView, QTextEdit, QStatusBar, QComboBox,
+    QSpinBox, QMenu, QHeaderView, QMainWindow,
+    QAbstractItemView, QProgressBar, QDialog, QDialogButtonBox, QPlainTextEdit
+)
+from PySide6.QtGui import (
+    QFont, QDesktopServices, QAction, QKeySequence, QColor,
+    QSyntaxHighlighter, QTextCharFormat, QTextCursor, QPalette, QCursor
+)
+from PySide6.QtCore import (
+    Qt, QUrl, QThread, Signal, QTimer, QAbstractItemModel, QModelIndex, QPoint,
+    QObject, QFileSystemWatcher
+)
+
+from finderplus import (
+    DEFAULT_CONFIG, FUZZY_AVAILABLE, Exporter, fill_stat, fmt_size, format_terms, ignore_rules,
+    is_refinement, is_view_change, list_dir, make_search, poll_changes, read_terms, search_roots,
+    term_matcher, view_needs_stat, view_results, walk_dirs, walk_files,
+)
+
+# ══════════════════════════════════════════════════════════════
+#  PALETTE
+#  bg:          #ffffff   (pure white)
+#  surface:     #f7f8fc   (off-white panels)
+#  text:        #1a1a2e   (near-black — ultra high contrast)
+#  muted:       #6b7280
+#  border:      #e5e7eb
+#
+#  pastel accents (all high-contrast against white):
+#    mint:      bg #d1fae5  text #065f46
+#    sky:       bg #dbeafe  text #1e3a8a
+#    coral:     bg #ffe4e6  text #9f1239
+#    violet:    bg #ede9fe  text #4c1d95
+#    amber:     bg #fef3c7  text #78350f
+#    lime:      bg #ecfccb  text #365314
+#
+#  primary action: #6366f1 (indigo) — crisp, bold
+# ══════════════════════════════════════════════════════════════
+
+STYLE = """
+/* ─── BASE ─────────────────────────────────────────────── */
+QMainWindow, QWidget {
+    background-color: #ffffff;
+    color: #1a1a2e;
+    font-family: 'Outfit', 'Poppins', 'Segoe UI', sans-serif;
+    font-size: 13px;
+}
+
+/* ─── TOOLBAR ───────────────────────────────────────────── */
+QFrame#toolbar {
+    background: #6366f1;
+    border: none;
+    min-height: 60px;
+}
+QFrame#toolbar QLabel {
+    color: #ffffff;
+    background: transparent;
+}
+
+/* ─── FILTER PANEL ──────────────────────────────────────── */
+QFrame#filterPanel {
+    background: #f7f8fc;
+    border-bottom: 2px solid #e5e7eb;
+}
+
+/* ─── INPUTS ────────────────────────────────────────────── */
+QLineEdit {
+    background: #ffffff;
+    border: 2px solid #e5e7eb;
+    border-radius: 8px;
+    color: #1a1a2e;
+    padding: 7px 12px;
+    font-size: 13px;
+    selection-background-color: #c7d2fe;
+    selection-color: #1a1a2e;
+}
+QLineEdit:focus {
+    border-color: #6366f1;
+    background: #fafafe;
+}
+QLineEdit::placeholder {
+    color: #9ca3af;
+}
+
+/* ─── BUTTONS ───────────────────────────────────────────── */
+QPushButton {
+    background: #ffffff;
+    border: 2px solid #e5e7eb;
+    border-radius: 8px;
+    color: #374151;
+    padding: 7px 16px;
+    font-size: 12px;
+    font-weight: 600;
+    min-width: 80px;
+    min-height: 34px;
+}
+QPushButton:hover {
+    border-color: #6366f1;
+    color: #6366f1;
+    background: #eef2ff;
+}
+QPushButton:pressed {
+    background: #e0e7ff;
+    border-color: #4f46e5;
+    color: #4f46e5;
+}
+
+/* primary / accent */
+QPushButton#accentBtn {
+    background: #ffffff;
+    border: 2px solid #ffffff;
+    border-radius: 8px;
+    color: #4f46e5;
+    font-size: 13px;
+    font-weight: 700;
+    min-width: 150px;
+    min-height: 38px;
+    padding: 6px 20px;
+}
+QPushButton#accentBtn:hover {
+    background: #eef2ff;
+    border-color: #e0e7ff;
+    color: #3730a3;
+}
+QPushButton#accentBtn:pressed {
+    background: #e0e7ff;
+    color: #3730a3;
+}
+
+/* danger */
+QPushButton#dangerBtn {
+    color: #dc2626;
+    border-color: #fecaca;
+    background: #fff5f5;
+    min-width: 80px;
+}
+QPushButton#dangerBtn:hover {
+    background: #fee2e2;
+    border-color: #f87171;
+}
+
+/* toggle buttons — mint when off, indigo when on */
+QPushButton#toggleBtn {
+    min-width: 48px;
+    max-width: 58px;
+    min-height: 34px;
+    padding: 6px 8px;
+    font-size: 13px;
+    font-weight: 800;
+    letter-spacing: 0;
+    background: #f0fdf4;
+    border: 2px solid #bbf7d0;
+    color: #15803d;
+    border-radius: 8px;
+}
+QPushButton#toggleBtn:hover {
+    background: #dcfce7;
+    border-color: #86efac;
+}
+QPushButton#toggleBtn:checked {
+    background: #6366f1;
+    border-color: #6366f1;
+    color: #ffffff;
+}
+QPushButton#toggleBtn:checked:hover {
+    background: #4f46e5;
+    border-color: #4f46e5;
+}
+QPushButton#statLink {
+    background: transparent;
+    border: none;
+    color: #6366f1;
+    font-size: 11px;
+    padding: 0 6px;
+}
+QPushButton#statLink:hover { text-decoration: underline; }
+QPushButton#statLink:disabled { color: #d1d5db; }
+
+/* ─── COMBOBOX ──────────────────────────────────────────── */
+QComboBox {
+    background: #ffffff;
+    border: 2px solid #e5e7eb;
+    border-radius: 8px;
+    color: #1a1a2e;
+    padding: 6px 10px;
+    font-size: 12px;
+    min-width: 120px;
+    min-height: 34px;
+}
+QComboBox:hover { border-color: #6366f1; }
+QComboBox:focus { border-color: #6366f1; }
+QComboBox::drop-down { border: none; width: 22px; }
+QComboBox QAbstractItemView {
+    background: #ffffff;
+    border: 2px solid #c7d2fe;
+    border-radius: 8px;
+    color: #1a1a2e;
+    selection-background-color: #e0e7ff;
+    selection-color: #4f46e5;
+    outline: none;
+    padding: 4px;
+}
+
+/* ─── SPINBOX ───────────────────────────────────────────── */
+QSpinBox {
+    background: #ffffff;
+    border: 2px solid #e5e7eb;
+    border-radius: 8px;
+    color: #1a1a2e;
+    padding: 5px 8px;
+    min-height: 32px;
+}
+QSpinBox:focus { border-color: #6366f1; }
+QSpinBox::up-button, QSpinBox::down-button {
+    border: none; background: transparent; width: 16px;
+}
+
+/* ─── TREE ──────────────────────────────────────────────── */
+QTreeView {
+    background: #ffffff;
+    border: 2px solid #e5e7eb;
+    border-radius: 10px;
+    alternate-background-color: #f9fafb;
+    show-decoration-selected: 1;
+    outline: none;
+}
+QTreeView::item {
+    padding: 5px 8px;
+    border-radius: 6px;
+    margin: 1px 4px;
+}
+QTreeView::item:hover {
+    background: #f0f9ff;
+}
+QTreeView::item:selected {
+    background: #e0e7ff;
+    color: #3730a3;
+}
+QTreeView::item:selected:hover {
+    background: #c7d2fe;
+}
+
+QHeaderView::section {
+    background: #f1f5f9;
+    border: none;
+    border-bottom: 2px solid #e5e7eb;
+    border-right: 1px solid #e5e7eb;
+    color: #64748b;
+    font-size: 10px;
+    font-weight: 800;
+    letter-spacing: 0.12em;
+    padding: 6px 10px;
+    text-transform: uppercase;
+}
+QHeaderView::section:last { border-right: none; }
+
+/* ─── TEXT EDIT ─────────────────────────────────────────── */
+QTextEdit {
+    background: #f8fafc;
+    border: 2px solid #e5e7eb;
+    border-radius: 10px;
+    color: #1e293b;
+    padding: 10px 12px;
+    font-family: 'Cascadia Code', 'Fira Code', 'JetBrains Mono', 'Consolas', monospace;
+    font-size: 11.5px;
+    selection-background-color: #c7d2fe;
+    selection-color: #1a1a2e;
+}
+
+/* ─── SPLITTER ──────────────────────────────────────────── */
+QSplitter { background: #ffffff; }
+QSplitter::handle { background: #e5e7eb; }
+QSplitter::handle:horizontal { width: 2px; }
+QSplitter::handle:vertical   { height: 2px; }
+QSplitter::handle:hover { background: #6366f1; }
+
+/* ─── SCROLLBARS ────────────────────────────────────────── */
+QScrollBar:vertical {
+    background: #f1f5f9;
+    width: 8px;
+    border-radius: 4px;
+    margin: 4px 2px;
+}
+QScrollBar::handle:vertical {
+    background: #cbd5e1;
+    min-height: 28px;
+    border-radius: 4px;
+}
+QScrollBar::handle:vertical:hover { background: #6366f1; }
+QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0; }
+QScrollBar:horizontal {
+    background: #f1f5f9;
+    height: 8px;
+    border-radius: 4px;
+    margin: 2px 4px;
+}
+QScrollBar::handle:horizontal {
+    background: #cbd5e1;
+    min-width: 28px;
+    border-radius: 4px;
+}
+QScrollBar::handle:horizontal:hover { background: #6366f1; }
+QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal { width: 0; }
+
+/* ─── STATUS BAR ────────────────────────────────────────── */
+QStatusBar {
+    background: #f1f5f9;
+    border-top: 1px solid #e5e7eb;
+    color: #64748b;
+    font-size: 11px;
+    padding: 2px 10px;
+}
+QStatusBar::item { border: none; }
+
+/* ─── PROGRESS BAR ──────────────────────────────────────── */
+QProgressBar {
+    background: #e5e7eb;
+    border: none;
+    border-radius: 2px;
+    height: 4px;
+    max-height: 4px;
+    color: transparent;
+}
+QProgressBar::chunk {
+    background: qlineargradient(x1:0,y1:0,x2:1,y2:0,
+        stop:0 #6366f1, stop:0.5 #a78bfa, stop:1 #38bdf8);
+    border-radius: 2px;
+}
+
+/* ─── MENU ──────────────────────────────────────────────── */
+QMenu {
+    background: #ffffff;
+    border: 2px solid #e5e7eb;
+    border-radius: 10px;
+    color: #1a1a2e;
+    padding: 5px;
+}
+QMenu::item {
+    padding: 7px 20px 7px 12px;
+    border-radius: 6px;
+    font-size: 12px;
+}
+QMenu::item:selected {
+    background: #e0e7ff;
+    color: #4f46e5;
+}
+QMenu::separator { height: 1px; background: #e5e7eb; margin: 4px 0; }
+
+/* ─── LABELS ────────────────────────────────────────────── */
+QLabel#appTitle {
+    font-size: 18px;
+    font-weight: 800;
+    color: #ffffff;
+    letter-spacing: 0.02em;
+}
+QLabel#appSubtitle {
+    font-size: 11px;
+    color: #c7d2fe;
+    letter-spacing: 0.04em;
+}
+QLabel#sectionLabel {
+    color: #6b7280;
+    font-size: 10px;
+    font-weight: 800;
+    letter-spacing: 0.14em;
+}
+QLabel#statAccent {
+    color: #6366f1;
+    font-size: 11px;
+    font-weight: 700;
+}
+QLabel#statMuted {
+    color: #9ca3af;
+    font-size: 11px;
+}
+QLabel#folderLabel {
+    color: #e0e7ff;
+    font-size: 12px;
+}
+
+QFrame#statsPopup {
+    background: #ffffff;
+    border: 1px solid #e5e7eb;
+    border-radius: 8px;
+}
+QLabel#statsText {
+    color: #374151;
+    font-family: "Consolas", "Menlo", monospace;
+    font-size: 11px;
+}
+
+/* ─── COLORED SECTION TAGS ──────────────────────────────── */
+QLabel#tagMint {
+    background: #d1fae5;
+    color: #065f46;
+    border-radius: 5px;
+    padding: 2px 8px;
+    font-size: 10px;
+    font-weight: 800;
+    letter-spacing: 0.1em;
+}
+QLabel#tagSky {
+    background: #dbeafe;
+    color: #1e40af;
+    border-radius: 5px;
+    padding: 2px 8px;
+    font-size: 10px;
+    font-weight: 800;
+    letter-spacing: 0.1em;
+}
+"""
+
+
+# ══════════════════════════════════════════════════════════════
+#  SEARCH WORKER
+# ══════════════════════════════════════════════════════════════
+# Matches are streamed to the UI in batches: whichever of these limits is
+# reached first flushes the pending batch, so the tree fills in while the
+# scan is still running without flooding the event loop with signals.
+BATCH_SIZE     = 200
+BATCH_INTERVAL = 0.15   # seconds
+
+
+class SearchWorker(QThread):
+    """Runs a ``Search`` off the UI thread and reports it through signals."""
+    result_ready   = Signal(list)
+    results_sorted = Signal(list)
+    progress       = Signal(int, int)   # files, directories visited
+    status_msg     = Signal(str)
+    finished       = Signal(int, float)
+    snapshot_ready = Signal(object, bool)   # snapshot, differs from the one searched
+
+    def __init__(self, config):
+        super().__init__()
+        self.config    = config
+        self.search    = None
+        self.matched   = 0
+        self.truncated = False
+        self.report    = None   # Search.report(), once the scan is done
+        self.live_changed = False   # a live watch saw a change during the scan
+        self._abort    = False
+
+    def abort(self):
+        self._abort = True
+        if self.search: self.search.abort()
+
+    def aborted(self): return self._abort
+
+    def run(self):
+        try:
+            search = make_search(self.config, self.progress.emit, self.status_msg.emit)
+        except re.error:
+            self.status_msg.emit("Invalid regex pattern")
+            self.finished.emit(0, 0.0)
+            return
+        self.search = search
+        if self._abort: search.abort()
+
+        pending, last_flush = [], time.monotonic()
+        for r in search:
+            pending.append(r)
+            now = time.monotonic()
+            if len(pending) >= BATCH_SIZE or now - last_flush >= BATCH_INTERVAL:
+                self.result_ready.emit(pending)
+                pending, last_flush = [], now
+        if pending: self.result_ready.emit(pending)
+
+        # Batches arrive in scan order, and with a capped search some of the
+        # rows streamed early may have been beaten since; the final, sorted
+        # top-K replaces them.
+        results = search.results()
+        self.matched, self.truncated = search.matched, search.truncated
+        self.report = search.report()
+        self.results_sorted.emit(results)
+        self.finished.emit(len(results), search.elapsed)
+
+        settled = search.settle_snapshot()
+        if settled: self.snapshot_ready.emit(*settled)
+
+
+class ExportWorker(QThread):
+    """Runs a search with no result cap and writes each match to a file as
+    it is found, so nothing is kept in memory however many there are."""
+    progress   = Signal(int)        # rows written so far
+    status_msg = Signal(str)
+    finished   = Signal(int, str)   # rows written, error message or ""
+
+    def __init__(self, config, path, header=()):
+        super().__init__()
+        self.config = dict(config, refine_from=None, paths=None, snapshot=None,
+                           refresh_index=False, max_results=sys.maxsize, keep_results=False)
+        self.path, self.header = path, header
+        self.search = None
+        self._abort = False
+
+    def abort(self):
+        self._abort = True
+        if self.search: self.search.abort()
+
+    def aborted(self): return self._abort
+
+    def run(self):
+        try:
+            search = make_search(self.config, status=self.status_msg.emit)
+        except re.error:
+            self.finished.emit(0, "invalid regex pattern"); return
+        self.search = search
+        if self._abort: search.abort()
+        count, error, last = 0, "", time.monotonic()
+        try:
+            with Exporter(self.path, header=self.header) as out:
+                for r in search:
+                    out.write(r); count = out.count
+                    now = time.monotonic()
+                    if now - last >= BATCH_INTERVAL:
+                        self.progress.emit(count); last = now
+        except Exception as ex:
+            search.abort(); error = str(ex) or type(ex).__name__
+        self.finished.emit(count, error)
+
+
+class ViewWorker(QThread):
+    """Stats the results a sorted or filtered view needs sizes and dates
+    for, off the UI thread, then applies the view to them."""
+    ready = Signal(list)
+
+    def __init__(self, results, config, message=None):
+        super().__init__()
+        self.results, self.config = results, config
+        self.message = message   # passed back to QuickSearch._show_rows
+        self._abort  = False
+
+    def abort(self): self._abort = True
+
+    def aborted(self): return self._abort
+
+    def run(self):
+        for r in self.results:
+            if self._abort: return
+            fill_stat(r)
+        self.ready.emit(view_results(self.results, self.config))
+
+
+# ══════════════════════════════════════════════════════════════
+#  LIVE UPDATES
+# ══════════════════════════════════════════════════════════════
+LIVE_MAX_WATCHES  = 8192   # paths handed to QFileSystemWatcher before polling instead
+LIVE_POLL_SECONDS = 2.0
+LIVE_SETTLE_MS    = 300    # changes arriving within this window are handled together
+
+
+class DirPoller(QThread):
+    """Lists a folder's directories, then polls mtimes once ``poll`` is set.
+
+    Until then it only waits, so a watch that has to fall back to polling
+    later can do so without walking the folder again.
+    """
+    ready   = Signal(list)   # every directory under the root
+    changed = Signal(list)   # paths whose mtime changed, or that are gone
+
+    def __init__(self, root, ignore=None):
+        super().__init__()
+        self.root     = root
+        self.ignore   = ignore
+        self.poll     = False
+        self._mtimes  = {}
+        self._pending = []
+        self._lock    = threading.Lock()
+        self._stop    = False
+
+    def stop(self): self._stop = True
+
+    def track(self, add=(), forget=()):
+        """Start (or stop) polling these paths from the next round on."""
+        with self._lock: self._pending.append((list(add), list(forget)))
+
+    def run(self):
+        self._mtimes = walk_dirs(self.root, lambda: self._stop, self.ignore)
+        if self._stop: return
+        self.ready.emit(list(self._mtimes))
+        while not self._stop:
+            for _ in range(int(LIVE_POLL_SECONDS * 10)):
+                if self._stop: return
+                self.msleep(100)
+            with self._lock: pending, self._pending = self._pending, []
+            for add, forget in pending:
+                for p in forget: self._mtimes.pop(p, None)
+                for p in add: self._mtimes.setdefault(p, None)
+            if not self.poll: continue
+            changed = poll_changes(self._mtimes)
+            if changed: self.changed.emit(changed)
+
+
+class LiveWatch(QObject):
+    """Reports changes under a searched folder as ``changed(dirs, files)``.
+
+    Directories are watched for files coming and going, and the files on
+    screen for edits in place. Both go through ``QFileSystemWatcher`` until
+    there are more than ``LIVE_MAX_WATCHES`` directories or the system
+    refuses a watch; from then on their mtimes are polled instead.
+    Directories the search's *ignore* rules prune are not watched.
+    """
+    changed = Signal(list, list)
+
+    def __init__(self, root, parent=None, ignore=None):
+        super().__init__(parent)
+        self.root     = root
+        self.ignore   = ignore
+        self.dirs     = set()
+        self.polling  = False
+        self._files   = set()
+        self._dirty   = (set(), set())
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(lambda p: self._mark([p], []))
+        self._watcher.fileChanged.connect(lambda p: self._mark([], [p]))
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(LIVE_SETTLE_MS)
+        self._timer.timeout.connect(self._flush)
+        self._poller = DirPoller(root, ignore)
+        self._poller.ready.connect(self._on_ready)
+        self._poller.changed.connect(self._on_polled)
+        self._poller.start()
+
+    def stop(self):
+        self._timer.stop()
+        self._poller.stop(); self._poller.wait()
+        paths = self._watcher.directories() + self._watcher.files()
+        if paths: self._watcher.removePaths(paths)
+
+    def add_dirs(self, dirs):
+        dirs = [d for d in dirs if d not in self.dirs]
+        self.dirs.update(dirs)
+        self._watch(dirs)
+
+    def remove_dirs(self, dirs):
+        dirs = [d for d in dirs if d in self.dirs]
+        self.dirs.difference_update(dirs)
+        if self.polling: self._poller.track(forget=dirs)
+        elif dirs: self._watcher.removePaths(dirs)
+
+    def set_files(self, paths):
+        """Watch *paths*, the files on screen, for edits, as far as the
+        watch budget left over by the directories allows."""
+        budget = max(0, LIVE_MAX_WATCHES - len(self.dirs))
+        want   = set(paths[:budget]) if not self.polling else set(paths)
+        have   = self._files if self.polling else set(self._watcher.files())
+        gone, new = have - want, want - have
+        self._files = want
+        if self.polling:
+            self._poller.track(new, gone)
+        else:
+            if gone: self._watcher.removePaths(list(gone))
+            self._watch(list(new))
+
+    def _watch(self, paths):
+        if not paths: return
+        if self.polling:
+            self._poller.track(paths)
+        elif self._watcher.addPaths(paths):
+            self._fall_back()
+
+    def _fall_back(self):
+        paths = self._watcher.directories() + self._watcher.files()
+        if paths: self._watcher.removePaths(paths)
+        self.polling = True
+        self._poller.track(list(self.dirs) + list(self._files))
+        self._poller.poll = True
+
+    def _on_ready(self, dirs):
+        self.dirs.update(dirs)
+        if len(self.dirs) > LIVE_MAX_WATCHES: self._fall_back()
+        else: self._watch(list(self.dirs))
+
+    def _on_polled(self, paths):
+        self._mark([p for p in paths if p in self.dirs],
+                   [p for p in paths if p not in self.dirs])
+
+    def _mark(self, dirs, files):
+        self._dirty[0].update(dirs); self._dirty[1].update(files)
+        self._timer.start()
+
+    def _flush(self):
+        dirs, files = self._dirty
+        self._dirty = (set(), set())
+        self.changed.emit(sorted(dirs), sorted(files))
+
+
+# ══════════════════════════════════════════════════════════════
+#  MATCH HIGHLIGHTER
+# ══════════════════════════════════════════════════════════════
+class MatchHighlighter(QSyntaxHighlighter):
+    def __init__(self, doc, query, case_sensitive=False, is_regex=False, terms=None):
+        super().__init__(doc)
+        self.query = query; self.case_sensitive = case_sensitive; self.is_regex = is_regex
+        self.terms = terms   # a TermMatcher, highlighted instead of the query
+        self.fmt = QTextCharFormat()
+        self.fmt.setBackground(QColor("#fde68a"))
+        self.fmt.setForeground(QColor("#78350f"))
+
+    def highlightBlock(self, text):
+        if self.terms is not None:
+            for start, end, _ in self.terms.finditer(text):
+                self.setFormat(start, end - start, self.fmt)
+            return
+        if not self.query: return
+        if self.is_regex:
+            flags = 0 if self.case_sensitive else re.IGNORECASE
+            try:
+                for m in re.finditer(self.query, text, flags):
+                    self.setFormat(m.start(), m.end()-m.start(), self.fmt)
+            except: pass
+        else:
+            t = text if self.case_sensitive else text.lower()
+            q = self.query if self.case_sensitive else self.query.lower()
+            idx = 0
+            while True:
+                pos = t.find(q, idx)
+                if pos == -1: break
+                self.setFormat(pos, len(q), self.fmt)
+                idx = pos + 1
+
+
+# ══════════════════════════════════════════════════════════════
+#  HELPERS
+# ══════════════════════════════════════════════════════════════
+EXT_COLORS = {
+    ".py":"#2563eb",   ".ipynb":"#7c3aed",
+    ".js":"#d97706",   ".ts":"#1d4ed8",  ".jsx":"#0891b2", ".tsx":"#0891b2",
+    ".html":"#dc2626", ".css":"#2563eb", ".scss":"#9333ea",
+    ".json":"#16a34a", ".yaml":"#7c3aed",".yml":"#7c3aed",
+    ".md":"#4f46e5",   ".rs":"#ea580c",  ".go":"#0891b2",
+    ".java":"#ca8a04", ".kt":"#7c3aed",  ".rb":"#dc2626",
+    ".sh":"#16a34a",   ".bash":"#16a34a",
+    ".txt":"#64748b",  ".log":"#64748b",
+    ".sql":"#b45309",  ".csv":"#15803d",
+    ".c":"#4338ca",    ".cpp":"#4338ca",
+    ".png":"#db2777",  ".jpg":"#db2777",  ".jpeg":"#db2777",
+    ".svg":"#ea580c",  ".pdf":"#dc2626",
+    ".zip":"#854d0e",  ".tar":"#854d0e",
+}
+def ext_color(ext): return EXT_COLORS.get(ext, "#64748b")
+
+STAT_LABELS = (
+    ("files", "Files visited"), ("dirs", "Folders visited"),
+    ("stat_calls", "Files stat'ed"), ("content_scanned", "Contents read"),
+    ("skipped_type", "Skipped by type"), ("skipped_name", "Skipped by name"),
+    ("skipped_size", "Skipped by size"), ("skipped_date", "Skipped by date"),
+    ("skipped_not_text", "Skipped, not text"), ("skipped_too_big", "Skipped, too big"),
+    ("skipped_trigram", "Skipped by trigrams"), ("skipped_unreadable", "Unreadable"),
+    ("pruned_dirs", "Folders pruned"), ("skipped_ignored", "Files ignored"),
+    ("dup_candidates", "Same-size files"), ("partial_hashed", "Ends hashed"),
+    ("full_hashed", "Fully hashed"), ("skipped_hardlink", "Hard links skipped"),
+    ("dup_groups", "Duplicate groups"),
+)
+
+def format_report(report):
+    """Lay a ``Search.report()`` out as aligned text for the details popup."""
+    counts, seconds = report["counts"], report["seconds"]
+    lines = [f"{'Source':<22}{report['source']}",
+             f"{'Matched':<22}{report['matched']:,}" + ("  (capped)" if report["truncated"] else ""),
+             f"{'Content size':<22}{fmt_size(counts['content_bytes'])}", ""]
+    lines += [f"{label:<22}{counts[key]:,}" for key, label in STAT_LABELS if counts.get(key)]
+    if counts.get("bytes_hashed"): lines.insert(3, f"{'Bytes hashed':<22}{fmt_size(counts['bytes_hashed'])}")
+    lines += ["", *(f"{phase.title():<22}{secs * 1000:,.1f} ms" for phase, secs in seconds.items()),
+              f"{'Total':<22}{report['elapsed'] * 1000:,.1f} ms"]
+    terms = report.get("terms")
+    if terms:
+        lines += ["", f"{'Term':<22}{'Hits':>10}{'Files':>9}"]
+        lines += [f"{t[:21]:<22}{n['hits']:>10,}{n['files']:>9,}" for t, n in terms.items()]
+    return "\n".join(lines)
+
+
+# ══════════════════════════════════════════════════════════════
+#  RESULTS MODEL
+# ══════════════════════════════════════════════════════════════
+class ResultsModel(QAbstractItemModel):
+    """Item model over a list of ``Result`` records, formatted on demand.
+
+    Nothing is built per row: ``data()`` derives text, colors and tooltips
+    from the result record only for the rows the view actually paints.
+    Sizes and dates the scan did not stat are read on a background thread
+    as their rows are painted.
+    In grouped mode the top level holds one row per folder. ``internalId``
+    is 0 for a top-level row, ``2 * (group + 1)`` for a file in a group and
+    ``2 * (file + 1) + 1`` for one of a file's matching lines, *file*
+    being its position in the result list. Groups hand their rows to the
+    view ``FETCH_STEP`` at a time through ``canFetchMore``/``fetchMore``.
+    Results from several roots get a column naming each row's root, and a
+    multi-term search one listing the terms each file matched.
+    Duplicate results are always grouped, one group per set of identical
+    files.
+    """
+
+    HEADERS    = ["Name", "Path", "Size", "Modified"]
+    FETCH_STEP = 500
+
+    # Looking up Qt enum members costs more than the rest of data(), so
+    # the roles it compares against are resolved once here.
+    DISPLAY, FOREGROUND, TOOLTIP, USER = (
+        Qt.DisplayRole, Qt.ForegroundRole, Qt.ToolTipRole, Qt.UserRole)
+    LINE = Qt.UserRole + 1   # a line row's line number
+
+    # Emitted from the stat thread once a batch of painted rows has its
+    # sizes and dates.
+    stats_filled = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._unstated = {}    # id -> painted result still waiting for its stat
+        self._stat_pool = ThreadPoolExecutor(1, "finderplus-stat")
+        self._rows, self._grouped, self._base = [], False, ""
+        self._dupes    = False
+        self._key      = "folder"   # result attribute rows are grouped by
+        self._roots    = {}    # root -> short name, when there is more than one
+        self._root_col = -1    # column naming each row's root, or -1
+        self._terms_col = -1   # column listing matched terms, or -1
+        self._headers  = self.HEADERS
+        self._groups   = []    # [folder or dup_group, [row numbers], rows handed to the view]
+        self._group_of = {}    # folder or dup_group -> group number
+        self._pos      = {}    # row number -> position in its group
+        self._colors   = {}
+
+    def _stat_later(self, r):
+        """Queue *r*'s deferred stat for the stat thread; its cells stay
+        blank until ``stats_filled`` repaints them."""
+        if not self._unstated: QTimer.singleShot(0, self._flush_stats)
+        self._unstated[id(r)] = r
+
+    def _flush_stats(self):
+        batch, self._unstated = list(self._unstated.values()), {}
+        def work():
+            for r in batch: fill_stat(r)
+            self.stats_filled.emit()
+        self._stat_pool.submit(work)
+
+    def _color(self, hex_):
+        c = self._colors.get(hex_)
+        if c is None: c = self._colors[hex_] = QColor(hex_)
+        return c
+
+    # ── contents ──────────────────────────────────────────────
+    def set_results(self, results, grouped=False, base="", roots=(), dupes=False,
+                    terms=False):
+        """Show *results*; grouped mode lists them by folder, folders sorted.
+
+        *roots* are the folders searched; with more than one, rows show
+        which of them they came from. With *dupes* the rows are grouped by
+        ``dup_group`` instead, in the order the groups first appear. With
+        *terms* a last column lists each file's matched terms.
+        """
+        self.beginResetModel()
+        self._rows, self._grouped, self._base = list(results), grouped or dupes, base
+        self._dupes, self._key = dupes, "dup_group" if dupes else "folder"
+        self._roots, self._headers = {}, self.HEADERS
+        if len(roots) > 1:
+            names = [os.path.basename(r.rstrip(os.sep)) or r for r in roots]
+            self._roots = {r: n if names.count(n) == 1 else r for r, n in zip(roots, names)}
+            self._headers = self.HEADERS + ["Root"]
+        self._root_col  = len(self.HEADERS) if self._roots else -1
+        self._terms_col = len(self._headers) if terms else -1
+        if terms: self._headers = self._headers + ["Terms"]
+        self._groups, self._group_of, self._pos = [], {}, {}
+        if self._grouped:
+            keys = {}
+            for i, r in enumerate(self._rows): keys.setdefault(getattr(r, self._key), []).append(i)
+            for key in (keys if dupes else sorted(keys)):
+                self._group_of[key] = len(self._groups)
+                self._groups.append([key, keys[key], 0])
+                self._pos.update((k, p) for p, k in enumerate(keys[key]))
+        self.endResetModel()
+
+    def clear(self):
+        self.set_results([], self._grouped and not self._dupes, self._base,
+                         list(self._roots), self._dupes, self._terms_col >= 0)
+
+    def append(self, batch):
+        """Add streamed results; returns the indexes of any new groups, and
+        of new files with matching lines.
+
+        New folders are appended after the existing ones; the final sorted
+        result set goes through ``set_results`` and restores folder order.
+        """
+        if not batch: return []
+        start = len(self._rows)
+        if not self._grouped:
+            self.beginInsertRows(QModelIndex(), start, start + len(batch) - 1)
+            self._rows.extend(batch)
+            self.endInsertRows()
+            return [self.index(i, 0) for i, r in enumerate(batch, start) if r.lines]
+        self._rows.extend(batch)
+        added, new = {}, []
+        for i, r in enumerate(batch, start):
+            key = getattr(r, self._key)
+            g = self._group_of.get(key)
+            if g is None:
+                g = len(self._groups)
+                self.beginInsertRows(QModelIndex(), g, g)
+                self._group_of[key] = g
+                self._groups.append([key, [], 0])
+                self.endInsertRows()
+                new.append(self.index(g, 0))
+            added.setdefault(g, []).append(i)
+        for g, rows in added.items():
+            group  = self._groups[g]
+            parent = self.index(g, 0)
+            self._pos.update((k, p) for p, k in enumerate(rows, len(group[1])))
+            group[1].extend(rows)
+            shown = min(len(group[1]), max(group[2], self.FETCH_STEP))
+            if shown > group[2]:
+                new += [self.index(p, 0, parent) for p in range(group[2], shown)
+                        if self._rows[group[1][p]].lines]
+                self.beginInsertRows(parent, group[2], shown - 1)
+                group[2] = shown
+                self.endInsertRows()
+            first, last = self.index(g, 0 if self._dupes else 2), self.index(g, 2)
+            self.dataChanged.emit(first, last, [self.DISPLAY])
+        return new
+
+    def _row_number(self, index):
+        """Position in the result list of the file at *index*, or None."""
+        i = index.internalId()
+        if i & 1: return None
+        if not self._grouped: return index.row()
+        if i == 0: return None
+        return self._groups[i // 2 - 1][1][index.row()]
+
+    def result(self, index):
+        """Return the result behind *index* (a line row's file), or
+        None for a folder row."""
+        if not index.isValid(): return None
+        i = index.internalId()
+        if i & 1: return self._rows[i // 2 - 1]
+        k = self._row_number(index)
+        return None if k is None else self._rows[k]
+
+    # ── structure ─────────────────────────────────────────────
+    def index(self, row, column, parent=QModelIndex()):
+        # Called for every row when the view lays out, so the bounds
+        # checks are inlined rather than going through hasIndex().
+        if row >= 0 and 0 <= column < len(self._headers):
+            if not parent.isValid():
+                if row < len(self._groups if self._grouped else self._rows):
+                    return self.createIndex(row, column, 0)
+                return QModelIndex()
+            if parent.internalId() & 1: return QModelIndex()
+            if self._grouped and parent.internalId() == 0:
+                if row < self._groups[parent.row()][2]:
+                    return self.createIndex(row, column, 2 * (parent.row() + 1))
+                return QModelIndex()
+            k = self._row_number(parent)
+            lines = self._rows[k].lines
+            if lines and row < len(lines):
+                return self.createIndex(row, column, 2 * (k + 1) + 1)
+        return QModelIndex()
+
+    def parent(self, index=QModelIndex()):
+        if not index.isValid(): return QModelIndex()
+        i = index.internalId()
+        if i == 0: return QModelIndex()
+        if not i & 1: return self.createIndex(i // 2 - 1, 0, 0)
+        k = i // 2 - 1
+        if not self._grouped: return self.createIndex(k, 0, 0)
+        g = self._group_of[getattr(self._rows[k], self._key)]
+        return self.createIndex(self._pos[k], 0, 2 * (g + 1))
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self._groups) if self._grouped else len(self._rows)
+        if parent.column() != 0 or parent.internalId() & 1: return 0
+        if self._grouped and parent.internalId() == 0:
+            return self._groups[parent.row()][2]
+        return len(self._rows[self._row_number(parent)].lines or ())
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self._headers)
+
+    def hasChildren(self, parent=QModelIndex()):
+        if parent.isValid(): return self.rowCount(parent) > 0 or (
+            self._grouped and parent.internalId() == 0 and parent.column() == 0)
+        return bool(self._groups if self._grouped else self._rows)
+
+    def canFetchMore(self, parent):
+        if not (self._grouped and parent.isValid() and parent.internalId() == 0): return False
+        group = self._groups[parent.row()]
+        return group[2] < len(group[1])
+
+    def fetchMore(self, parent):
+        if not self.canFetchMore(parent): return
+        group = self._groups[parent.row()]
+        shown = min(len(group[1]), group[2] + self.FETCH_STEP)
+        self.beginInsertRows(parent, group[2], shown - 1)
+        group[2] = shown
+        self.endInsertRows()
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self._headers[section]
+        return None
+
+    # ── display ───────────────────────────────────────────────
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid(): return None
+        col = index.column()
+        i = index.internalId()
+        if i & 1:
+            return self._line_data(self._rows[i // 2 - 1], index.row(), col, role)
+        if self._grouped and i == 0:
+            folder, rows, _ = self._groups[index.row()]
+            if self._dupes:
+                return self._dup_group_data(rows, col, role)
+            if role == self.DISPLAY:
+                if col == 0 and self._roots:
+                    root = self._rows[rows[0]].root
+                    rel  = os.path.relpath(folder, root)
+                    name = self._roots.get(root, root)
+                    return name if rel == "." else os.path.join(name, rel)
+                if col == 0: return os.path.relpath(folder, self._base)
+                if col == 2: return f"{len(rows)} files"
+            elif role == self.FOREGROUND and col == 0:
+                return self._color("#94a3b8")
+            return None
+        r = self.result(index)
+        if role == self.DISPLAY:
+            if col == 0: return r.name
+            if col == 1:
+                n = r.line_count
+                return f"{r.rel_path}  ({n:,} line{'s' * (n != 1)})" if n else r.rel_path
+            if col == self._terms_col: return format_terms(r.terms or {})
+            if col == self._root_col: return self._roots.get(r.root, r.root)
+            if r.mtime is None: self._stat_later(r); return ""
+            if r.missing: return "unavailable" if col == 2 else "—"
+            if col == 2: return fmt_size(r.size)
+            return r.modified.strftime("%Y-%m-%d")
+        if role == self.FOREGROUND:
+            if col == 0: return self._color(ext_color(r.ext))
+            if col == self._terms_col: return self._color("#4f46e5")
+            if col == 1: return self._color("#16a34a" if r.content_matches else "#94a3b8")
+            return self._color("#64748b")
+        if role == self.TOOLTIP:
+            if col == 1 and r.content_matches:
+                return "Content match: " + r.content_matches[0][:120]
+            if col == self._terms_col and r.terms:
+                return "\n".join(f"{t}: {n:,}" for t, n in r.terms.items())
+            if col == self._root_col: return r.root
+            if col in (2, 3) and r.missing: return "The file can no longer be read"
+        if role == self.USER:
+            return r.full_path
+        return None
+
+    def _line_data(self, r, row, col, role):
+        number, text, hit = r.lines[row]
+        if role == self.DISPLAY:
+            if col == 0: return f"{number:>7}{':' if hit else ' '}"
+            if col == 1: return text
+        elif role == self.FOREGROUND:
+            return self._color(("#1a1a2e" if hit else "#94a3b8") if col == 1 else "#94a3b8")
+        elif role == self.TOOLTIP and col == 1:
+            return text
+        elif role == self.USER:
+            return r.full_path
+        elif role == self.LINE:
+            return number
+        return None
+
+    def _dup_group_data(self, rows, col, role):
+        size = self._rows[rows[0]].size
+        if role == self.DISPLAY:
+            if col == 0: return f"{len(rows)} identical files"
+            if col == 1: return f"{fmt_size(size * (len(rows) - 1))} reclaimable"
+            if col == 2: return fmt_size(size)
+        elif role == self.FOREGROUND:
+            return self._color("#dc2626" if col == 1 else "#94a3b8")
+        return None
+
+
+# ══════════════════════════════════════════════════════════════
+#  TERMS DIALOG
+# ══════════════════════════════════════════════════════════════
+class TermsDialog(QDialog):
+    """Edit the term list of a multi-term search, one term a line."""
+
+    def __init__(self, terms, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Search Terms")
+        self.resize(420, 480)
+        lay = QVBoxLayout(self)
+        hint = QLabel("One term a line. Files matching any of them are listed "
+                      "with the terms each one holds.")
+        hint.setWordWrap(True)
+        lay.addWidget(hint)
+        self.edit = QPlainTextEdit("\n".join(terms))
+        self.edit.setFont(QFont("Monospace"))
+        self.edit.textChanged.connect(self._count)
+        lay.addWidget(self.edit)
+        row = QHBoxLayout()
+        load_btn  = QPushButton("Load from file…")
+        clear_btn = QPushButton("Clear")
+        self.count_lbl = QLabel()
+        load_btn.clicked.connect(self._load)
+        clear_btn.clicked.connect(self.edit.clear)
+        row.addWidget(load_btn); row.addWidget(clear_btn); row.addStretch()
+        row.addWidget(self.count_lbl)
+        lay.addLayout(row)
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        lay.addWidget(buttons)
+        self._count()
+
+    def terms(self):
+        return read_terms(self.edit.toPlainText())
+
+    def _count(self):
+        n = len(self.terms())
+        self.count_lbl.setText(f"{n:,} term{'s' * (n != 1)}")
+
+    def _load(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Load Terms", "", "Text Files (*.txt);;All Files (*)")
+        if not path: return
+        try:
+            with open(path, encoding="utf-8", errors="replace") as f:
+                loaded = read_terms(f.read())
+        except OSError as ex:
+            self.count_lbl.setText(f"Cannot read file: {ex.strerror}"); return
+        self.edit.setPlainText("\n".join(read_terms("\n".join([*self.terms(), *loaded]))))
+
+
+# ══════════════════════════════════════════════════════════════
+#  MAIN WINDOW
+# ══════════════════════════════════════════════════════════════
+class QuickSearch(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Finder+")
+        self.setMinimumSize(1050, 680)
+        self.resize(1300, 820)
+        self.folder_path      = ""
+        self.extra_roots      = []     # folders searched along with folder_path
+        self._worker          = None
+        self._current_results = []
+        self._last_config     = None
+        self._last_complete   = False
+        self._scanned         = None   # full result list of the last finished scan
+        self._snapshot        = None
+        self._retired         = []     # aborted workers still winding down
+        self._report          = None   # counters and timings of the last search
+        self._view_config     = None   # config of the results on screen
+        self._lives           = {}     # root -> LiveWatch on that searched folder
+        self._live_worker     = None
+        self._view_worker     = None   # ViewWorker stat'ing results for a view
+        self._export_worker   = None   # ExportWorker writing a full search to disk
+        self._terms           = []     # multi-term list, searched along with the query
+        self._live_pending    = (set(), set())
+        self._render_time     = 0.0
+        self._search_timer    = QTimer()
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(320)
+        self._search_timer.timeout.connect(self.run_search)
+        self.init_ui()
+        self.setup_shortcuts()
+
+    # ── UI ────────────────────────────────────────────────────
+    def init_ui(self):
+        central = QWidget()
+        self.setCentralWidget(central)
+        root = QVBoxLayout(central)
+        root.setContentsMargins(0, 0, 0, 0)
+        root.setSpacing(0)
+
+        root.addWidget(self._build_toolbar())
+        root.addWidget(self._build_filter_panel())
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 0)   # busy: the total is not known up front
+        self.progress_bar.setFixedHeight(4)
+        self.progress_bar.hide()
+        root.addWidget(self.progress_bar)
+
+        body = QWidget()
+        body.setStyleSheet("background:#ffffff;")
+        body_lay = QHBoxLayout(body)
+        body_lay.setContentsMargins(12, 12, 12, 12)
+        body_lay.setSpacing(12)
+
+        splitter = QSplitter(Qt.Horizontal)
+        splitter.setHandleWidth(2)
+        splitter.addWidget(self._build_results_panel())
+        splitter.addWidget(self._build_preview_panel())
+        splitter.setSizes([740, 500])
+        body_lay.addWidget(splitter)
+        root.addWidget(body, stretch=1)
+
+        self.status_bar = QStatusBar()
+        self.setStatusBar(self.status_bar)
+        self._lbl_folder = QLabel("No folder selected")
+        self._lbl_folder.setObjectName("statMuted")
+        self._lbl_count  = QLabel("")
+        self._lbl_count.setObjectName("statAccent")
+        self._lbl_time   = QLabel("")
+        self._lbl_time.setObjectName("statMuted")
+        self.status_bar.addWidget(self._lbl_folder)
+        self._btn_stats  = QPushButton("Details")
+        self._btn_stats.setObjectName("statLink")
+        self._btn_stats.setCursor(Qt.PointingHandCursor)
+        self._btn_stats.setToolTip("Counters and phase timings of the last search")
+        self._btn_stats.setEnabled(False)
+        self._btn_stats.clicked.connect(self._show_stats)
+        self.status_bar.addPermanentWidget(self._lbl_count)
+        self.status_bar.addPermanentWidget(self._lbl_time)
+        self.status_bar.addPermanentWidget(self._btn_stats)
+
+    def _build_toolbar(self):
+        bar = QFrame()
+        bar.setObjectName("toolbar")
+        bar.setMinimumHeight(60)
+        lay = QHBoxLayout(bar)
+        lay.setContentsMargins(20, 8, 20, 8)
+        lay.setSpacing(14)
+
+        # title
+        title = QLabel("Finder+")
+        title.setStyleSheet(
+            "color: #ffffff; font-size: 22px; font-weight: 800; "
+            "letter-spacing: 1px; background: transparent; border: none;"
+        )
+        title.setMinimumWidth(120)
+        lay.addWidget(title)
+
+        lay.addWidget(self._vsep("#818cf8"))
+
+        # folder display
+        self.folder_label = QLabel("No folder selected")
+        self.folder_label.setStyleSheet(
+            "color: #c7d2fe; font-size: 12px; background: transparent; border: none;"
+        )
+        self.folder_label.setMaximumWidth(480)
+        lay.addWidget(self.folder_label)
+
+        # Select Folder — ghost/outline style that belongs on the indigo bar
+        folder_btn = QPushButton("Select Folder")
+        folder_btn.setStyleSheet(
+            "QPushButton {"
+            "  background: transparent;"
+            "  border: 2px solid #a5b4fc;"
+            "  border-radius: 8px;"
+            "  color: #e0e7ff;"
+            "  font-size: 13px;"
+            "  font-weight: 700;"
+            "  min-width: 140px;"
+            "  min-height: 36px;"
+            "  padding: 6px 20px;"
+            "}"
+            "QPushButton:hover {"
+            "  background: #4f46e5;"
+            "  border-color: #c7d2fe;"
+            "  color: #ffffff;"
+            "}"
+            "QPushButton:pressed {"
+            "  background: #3730a3;"
+            "  border-color: #818cf8;"
+            "}"
+        )
+        folder_btn.clicked.connect(self.select_folder)
+        lay.addWidget(folder_btn)
+
+        add_btn = QPushButton("+")
+        add_btn.setToolTip("Add another folder to search along with this one")
+        add_btn.setStyleSheet(
+            "QPushButton {"
+            "  background: transparent;"
+            "  border: 2px solid #a5b4fc;"
+            "  border-radius: 8px;"
+            "  color: #e0e7ff;"
+            "  font-size: 16px;"
+            "  font-weight: 700;"
+            "  min-width: 36px;"
+            "  min-height: 36px;"
+            "}"
+            "QPushButton:hover {"
+            "  background: #4f46e5;"
+            "  border-color: #c7d2fe;"
+            "  color: #ffffff;"
+            "}"
+            "QPushButton:pressed {"
+            "  background: #3730a3;"
+            "  border-color: #818cf8;"
+            "}"
+        )
+        add_btn.clicked.connect(self.add_folder)
+        lay.addWidget(add_btn)
+
+        lay.addStretch()
+
+        # Export — soft indigo pill
+        export_btn = QPushButton("Export")
+        export_btn.setStyleSheet(
+            "QPushButton {"
+            "  background: rgba(255,255,255,0.15);"
+            "  border: 2px solid rgba(255,255,255,0.35);"
+            "  border-radius: 8px;"
+            "  color: #e0e7ff;"
+            "  font-size: 12px;"
+            "  font-weight: 700;"
+            "  min-width: 82px;"
+            "  min-height: 34px;"
+            "  padding: 6px 14px;"
+            "}"
+            "QPushButton:hover {"
+            "  background: rgba(255,255,255,0.25);"
+            "  border-color: rgba(255,255,255,0.6);"
+            "  color: #ffffff;"
+            "}"
+            "QPushButton:pressed { background: rgba(255,255,255,0.1); }"
+            "QPushButton::menu-indicator { width: 0; }"
+        )
+        export_menu = QMenu(self)
+        export_menu.addAction("Results on screen...", self.export_results)
+        export_menu.addAction("Full search, no limit...", self.export_full_search)
+        export_btn.setMenu(export_menu)
+        lay.addWidget(export_btn)
+
+        # Clear — soft red pill that still feels at home on indigo
+        clear_btn = QPushButton("Clear")
+        clear_btn.setStyleSheet(
+            "QPushButton {"
+            "  background: rgba(254,202,202,0.2);"
+            "  border: 2px solid rgba(252,165,165,0.5);"
+            "  border-radius: 8px;"
+            "  color: #fecaca;"
+            "  font-size: 12px;"
+            "  font-weight: 700;"
+            "  min-width: 72px;"
+            "  min-height: 34px;"
+            "  padding: 6px 12px;"
+            "}"
+            "QPushButton:hover {"
+            "  background: rgba(239,68,68,0.3);"
+            "  border-color: #fca5a5;"
+            "  color: #ffffff;"
+            "}"
+            "QPushButton:pressed { background: rgba(239,68,68,0.5); }"
+        )
+        clear_btn.clicked.connect(self.clear_all)
+        lay.addWidget(clear_btn)
+
+        return bar
+
+    def _build_filter_panel(self):
+        panel = QFrame()
+        panel.setObjectName("filterPanel")
+        outer = QVBoxLayout(panel)
+        outer.setContentsMargins(16, 10, 16, 10)
+        outer.setSpacing(8)
+
+        # ── Row 1: search + mode toggles ──
+        r1 = QHBoxLayout(); r1.setSpacing(8)
+
+        tag1 = QLabel("SEARCH")
+        tag1.setStyleSheet(
+            "background: #6366f1; color: #ffffff; border-radius: 6px;"
+            "padding: 4px 10px; font-size: 10px; font-weight: 800; letter-spacing: 0.1em;"
+        )
+        tag1.setFixedHeight(28)
+        r1.addWidget(tag1)
+
+        self.search_bar = QLineEdit()
+        self.search_bar.setPlaceholderText("Type to search filenames or file contents...")
+        self.search_bar.setMinimumHeight(36)
+        self.search_bar.textChanged.connect(self._trigger)
+        r1.addWidget(self.search_bar)
+
+        def tbtn(text, tip, sc=""):
+            b = QPushButton(text)
+            b.setObjectName("toggleBtn")
+            b.setCheckable(True)
+            b.setToolTip(f"{tip}  {sc}".strip())
+            b.toggled.connect(self._trigger)
+            return b
+
+        self.btn_regex   = tbtn(".*",  "Regex mode",            "Ctrl+R")
+        self.btn_case    = tbtn("Aa",  "Case sensitive",         "Ctrl+Shift+C")
+        self.btn_fuzzy   = tbtn("~",   "Fuzzy match",            "Ctrl+F")
+        self.btn_content = tbtn("[ ]", "Search inside files",    "Ctrl+Shift+F")
+
+        if not FUZZY_AVAILABLE:
+            self.btn_fuzzy.setEnabled(False)
+            self.btn_fuzzy.setToolTip("pip install rapidfuzz to enable fuzzy matching")
+
+        # Checked while a term list is set; clicking opens the list instead
+        # of toggling it.
+        self.btn_terms = QPushButton("Terms")
+        self.btn_terms.setObjectName("toggleBtn")
+        self.btn_terms.setCheckable(True)
+        self.btn_terms.setToolTip("Search for a list of terms at once  Ctrl+T")
+        self.btn_terms.clicked.connect(self.edit_terms)
+
+        for b in (self.btn_regex, self.btn_case, self.btn_fuzzy, self.btn_content, self.btn_terms):
+            r1.addWidget(b)
+        outer.addLayout(r1)
+
+        # ── Row 2: filters ──
+        r2 = QHBoxLayout(); r2.setSpacing(8)
+
+        tag2 = QLabel("FILTERS")
+        tag2.setStyleSheet(
+            "background: #06b6d4; color: #ffffff; border-radius: 6px;"
+            "padding: 4px 10px; font-size: 10px; font-weight: 800; letter-spacing: 0.1em;"
+        )
+        tag2.setFixedHeight(28)
+        r2.addWidget(tag2)
+
+        self.type_filter = QLineEdit()
+        self.type_filter.setPlaceholderText("Extensions: .py .js .txt")
+        self.type_filter.setMaximumWidth(200)
+        self.type_filter.setMinimumHeight(32)
+        self.type_filter.textChanged.connect(self._trigger)
+        r2.addWidget(self.type_filter)
+
+        self.exclude_filter = QLineEdit()
+        self.exclude_filter.setPlaceholderText("Exclude: node_modules build/ *.min.js")
+        self.exclude_filter.setToolTip(
+            "Folders and files to skip, in .gitignore syntax; excluded folders are not entered")
+        self.exclude_filter.setMaximumWidth(240)
+        self.exclude_filter.setMinimumHeight(32)
+        self.exclude_filter.textChanged.connect(self._trigger)
+        r2.addWidget(self.exclude_filter)
+
+        self.ignore_btn = QPushButton(".gitignore")
+        self.ignore_btn.setCheckable(True)
+        self.ignore_btn.setMinimumHeight(32)
+        self.ignore_btn.setToolTip("Also skip what .gitignore and .ignore files list")
+        self.ignore_btn.toggled.connect(self._trigger)
+        r2.addWidget(self.ignore_btn)
+
+        r2.addWidget(self._vsep())
+
+        self.start_date = QLineEdit()
+        self.start_date.setPlaceholderText("From YYYY-MM-DD")
+        self.start_date.setMaximumWidth(138)
+        self.start_date.setMinimumHeight(32)
+        self.start_date.textChanged.connect(self._trigger)
+        r2.addWidget(self.start_date)
+
+        self.end_date = QLineEdit()
+        self.end_date.setPlaceholderText("To YYYY-MM-DD")
+        self.end_date.setMaximumWidth(138)
+        self.end_date.setMinimumHeight(32)
+        self.end_date.textChanged.connect(self._trigger)
+        r2.addWidget(self.end_date)
+
+        r2.addWidget(self._vsep())
+
+        for ltext in ["SIZE KB"]:
+            lbl = QLabel(ltext); lbl.setObjectName("sectionLabel"); r2.addWidget(lbl)
+
+        self.min_size = QSpinBox()
+        self.min_size.setRange(0, 1_000_000); self.min_size.setSpecialValueText("min")
+        self.min_size.setMaximumWidth(78); self.min_size.setMinimumHeight(32)
+        self.min_size.valueChanged.connect(self._trigger)
+        r2.addWidget(self.min_size)
+
+        dash = QLabel("—"); dash.setObjectName("sectionLabel"); r2.addWidget(dash)
+
+        self.max_size = QSpinBox()
+        self.max_size.setRange(0, 1_000_000); self.max_size.setSpecialValueText("max")
+        self.max_size.setMaximumWidth(78); self.max_size.setMinimumHeight(32)
+        self.max_size.valueChanged.connect(self._trigger)
+        r2.addWidget(self.max_size)
+
+        r2.addWidget(self._vsep())
+
+        sort_lbl = QLabel("SORT"); sort_lbl.setObjectName("sectionLabel"); r2.addWidget(sort_lbl)
+        self.sort_combo = QComboBox()
+        self.sort_combo.addItems(["Relevance","Name","Date","Size","Extension"])
+        self.sort_combo.setMinimumHeight(32)
+        self.sort_combo.currentTextChanged.connect(self._trigger)
+        r2.addWidget(self.sort_combo)
+
+        r2.addWidget(self._vsep())
+
+        max_lbl = QLabel("MAX"); max_lbl.setObjectName("sectionLabel"); r2.addWidget(max_lbl)
+        self.max_results_spin = QSpinBox()
+        self.max_results_spin.setRange(10, 100_000); self.max_results_spin.setValue(5000)
+        self.max_results_spin.setSingleStep(500); self.max_results_spin.setMaximumWidth(82)
+        self.max_results_spin.setMinimumHeight(32)
+        self.max_results_spin.valueChanged.connect(self._trigger)
+        r2.addWidget(self.max_results_spin)
+
+        self.fuzzy_thr_lbl = QLabel("THRESHOLD"); self.fuzzy_thr_lbl.setObjectName("sectionLabel")
+        self.fuzzy_thr_lbl.hide(); r2.addWidget(self.fuzzy_thr_lbl)
+
+        self.fuzzy_threshold = QSpinBox()
+        self.fuzzy_threshold.setRange(0,100); self.fuzzy_threshold.setValue(60)
+        self.fuzzy_threshold.setMaximumWidth(68); self.fuzzy_threshold.setMinimumHeight(32)
+        self.fuzzy_threshold.hide(); self.fuzzy_threshold.valueChanged.connect(self._trigger)
+        r2.addWidget(self.fuzzy_threshold)
+        self.btn_fuzzy.toggled.connect(lambda v:(
+            self.fuzzy_thr_lbl.setVisible(v), self.fuzzy_threshold.setVisible(v)))
+
+        self.workers_lbl = QLabel("WORKERS"); self.workers_lbl.setObjectName("sectionLabel")
+        self.workers_lbl.hide(); r2.addWidget(self.workers_lbl)
+
+        self.workers_spin = QSpinBox()
+        self.workers_spin.setRange(1, os.cpu_count() or 1); self.workers_spin.setValue(1)
+        self.workers_spin.setToolTip("Processes used for content search (1 = no process pool)")
+        self.workers_spin.setMaximumWidth(68); self.workers_spin.setMinimumHeight(32)
+        self.workers_spin.hide(); self.workers_spin.valueChanged.connect(self._trigger)
+        r2.addWidget(self.workers_spin)
+
+        self.readahead_lbl = QLabel("READ-AHEAD"); self.readahead_lbl.setObjectName("sectionLabel")
+        self.readahead_lbl.hide(); r2.addWidget(self.readahead_lbl)
+
+        self.readahead_spin = QSpinBox()
+        self.readahead_spin.setRange(0, 32); self.readahead_spin.setValue(DEFAULT_CONFIG["readahead"])
+        self.readahead_spin.setSpecialValueText("off")
+        self.readahead_spin.setToolTip(
+            "Threads reading the next files ahead of the matcher, up to "
+            f"{DEFAULT_CONFIG['readahead_mb']} MB at a time.\n"
+            "Off by default: it helps on network drives and cold disks, but costs\n"
+            "time when the files are already cached. Only used with 1 worker.")
+        self.readahead_spin.setMaximumWidth(68); self.readahead_spin.setMinimumHeight(32)
+        self.readahead_spin.hide(); self.readahead_spin.valueChanged.connect(self._trigger)
+        r2.addWidget(self.readahead_spin)
+
+        self.max_mb_lbl = QLabel("MAX MB"); self.max_mb_lbl.setObjectName("sectionLabel")
+        self.max_mb_lbl.hide(); r2.addWidget(self.max_mb_lbl)
+
+        self.max_mb_spin = QSpinBox()
+        self.max_mb_spin.setRange(0, 1_000_000); self.max_mb_spin.setSpecialValueText("any")
+        self.max_mb_spin.setToolTip("Skip files larger than this when searching contents (any = no limit)")
+        self.max_mb_spin.setMaximumWidth(78); self.max_mb_spin.setMinimumHeight(32)
+        self.max_mb_spin.hide(); self.max_mb_spin.valueChanged.connect(self._trigger)
+        r2.addWidget(self.max_mb_spin)
+
+        self.lines_btn = QPushButton("Lines")
+        self.lines_btn.setCheckable(True)
+        self.lines_btn.setMinimumHeight(32)
+        self.lines_btn.setToolTip(
+            "List every matching line under its file, like grep, with exact counts.\n"
+            f"At most {DEFAULT_CONFIG['max_lines']} lines are kept per file.")
+        self.lines_btn.hide(); self.lines_btn.toggled.connect(self._trigger)
+        r2.addWidget(self.lines_btn)
+
+        self.context_spin = QSpinBox()
+        self.context_spin.setRange(0, 20); self.context_spin.setSpecialValueText("no context")
+        self.context_spin.setSuffix(" context")
+        self.context_spin.setToolTip("Lines shown either side of each matching line")
+        self.context_spin.setMaximumWidth(110); self.context_spin.setMinimumHeight(32)
+        self.context_spin.hide(); self.context_spin.valueChanged.connect(self._trigger)
+        r2.addWidget(self.context_spin)
+        self.btn_content.toggled.connect(lambda v:(
+            self.workers_lbl.setVisible(v), self.workers_spin.setVisible(v),
+            self.readahead_lbl.setVisible(v), self.readahead_spin.setVisible(v),
+            self.max_mb_lbl.setVisible(v), self.max_mb_spin.setVisible(v),
+            self.lines_btn.setVisible(v), self.context_spin.setVisible(v)))
+
+        r2.addStretch()
+
+        self.index_btn = QPushButton("Use index")
+        self.index_btn.setCheckable(True)
+        self.index_btn.setMinimumHeight(32)
+        self.index_btn.setToolTip(
+            "Answer searches from an on-disk index of this folder.\n"
+            "The index is only updated when you press Refresh index.")
+        self.index_btn.toggled.connect(self._trigger)
+        r2.addWidget(self.index_btn)
+
+        self.refresh_btn = QPushButton("Refresh index")
+        self.refresh_btn.setMinimumHeight(32)
+        self.refresh_btn.clicked.connect(lambda: self.run_search(refresh_index=True))
+        r2.addWidget(self.refresh_btn)
+
+        self.rescan_btn = QPushButton("Rescan")
+        self.rescan_btn.setMinimumHeight(32)
+        self.rescan_btn.setToolTip("Walk the folder again instead of using the in-memory snapshot  F5")
+        self.rescan_btn.clicked.connect(self.rescan)
+        r2.addWidget(self.rescan_btn)
+
+        self.live_btn = QPushButton("Live")
+        self.live_btn.setCheckable(True)
+        self.live_btn.setMinimumHeight(32)
+        self.live_btn.setToolTip(
+            "Keep the results up to date as files are added, changed or removed")
+        self.live_btn.toggled.connect(self._set_live)
+        r2.addWidget(self.live_btn)
+
+        self.dup_btn = QPushButton("Duplicates")
+        self.dup_btn.setCheckable(True)
+        self.dup_btn.setMinimumHeight(32)
+        self.dup_btn.setToolTip(
+            "Show only files with identical contents, grouped, most reclaimable space first")
+        self.dup_btn.toggled.connect(self._trigger)
+        r2.addWidget(self.dup_btn)
+
+        self.group_btn = QPushButton("Group by folder")
+        self.group_btn.setCheckable(True)
+        self.group_btn.setMinimumHeight(32)
+        self.group_btn.toggled.connect(lambda _: self._populate_tree(self._current_results))
+        r2.addWidget(self.group_btn)
+
+        outer.addLayout(r2)
+        return panel
+
+    def _build_results_panel(self):
+        wrap = QWidget()
+        wrap.setStyleSheet("QWidget { background: #ffffff; }")
+        lay = QVBoxLayout(wrap)
+        lay.setContentsMargins(0, 0, 0, 0)
+        lay.setSpacing(6)
+
+        hdr = QHBoxLayout()
+        res_lbl = QLabel("RESULTS")
+        res_lbl.setStyleSheet(
+            "color: #6366f1; font-size: 10px; font-weight: 800; letter-spacing: 0.15em;"
+        )
+        hdr.addWidget(res_lbl); hdr.addStretch()
+        lay.addLayout(hdr)
+
+        self.tree = QTreeView()
+        self.results_model = ResultsModel(self)
+        self.tree.setModel(self.results_model)
+        self.results_model.stats_filled.connect(self.tree.viewport().update)
+        self.tree.setUniformRowHeights(True)
+        self.tree.setAlternatingRowColors(True)
+        self.tree.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.tree.setRootIsDecorated(True)
+        self.tree.header().setSectionResizeMode(0, QHeaderView.Interactive)
+        self.tree.header().setSectionResizeMode(1, QHeaderView.Stretch)
+        self.tree.header().setSectionResizeMode(2, QHeaderView.Fixed)
+        self.tree.header().setSectionResizeMode(3, QHeaderView.Fixed)
+        self.tree.header().resizeSection(0, 240)
+        self.tree.header().resizeSection(2, 78)
+        self.tree.header().resizeSection(3, 94)
+        self.tree.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.tree.customContextMenuRequested.connect(self._context_menu)
+        self.tree.selectionModel().currentChanged.connect(self._on_select)
+        self.tree.activated.connect(self._open_item)
+        self.tree.verticalScrollBar().valueChanged.connect(self._fetch_visible)
+        lay.addWidget(self.tree)
+        return wrap
+
+    def _build_preview_panel(self):
+        wrap = QWidget()
+        wrap.setStyleSheet("QWidget { background: #ffffff; }")
+        lay = QVBoxLayout(wrap)
+        lay.setContentsMargins(0, 0, 0, 0)
+        lay.setSpacing(6)
+
+        hdr = QHBoxLayout()
+        hdr.setContentsMargins(0, 0, 0, 0)
+        prev_lbl = QLabel("PREVIEW")
+        prev_lbl.setStyleSheet(
+            "color: #06b6d4; font-size: 10px; font-weight: 800; letter-spacing: 0.15em;"
+        )
+        hdr.addWidget(prev_lbl); hdr.addStretch()
+        self.preview_path_lbl = QLabel("")
+        self.preview_path_lbl.setObjectName("statMuted")
+        self.preview_path_lbl.setMaximumWidth(300)
+        hdr.addWidget(self.preview_path_lbl)
+        lay.addLayout(hdr)
+
+        self.preview = QTextEdit()
+        self.preview.setReadOnly(True)
+        self.preview.setLineWrapMode(QTextEdit.NoWrap)
+        lay.addWidget(self.preview)
+        self._highlighter = None
+        return wrap
+
+    # ── HELPERS ───────────────────────────────────────────────
+    def _vsep(self, color="#e5e7eb"):
+        s = QFrame(); s.setFrameShape(QFrame.VLine)
+        s.setStyleSheet(f"color: {color};"); s.setFixedHeight(22)
+        return s
+
+    # ── SHORTCUTS ─────────────────────────────────────────────
+    def setup_shortcuts(self):
+        for key, fn in [
+            ("Ctrl+R",       lambda: self.btn_regex.setChecked(not self.btn_regex.isChecked())),
+            ("Ctrl+F",       lambda: self.btn_fuzzy.setChecked(not self.btn_fuzzy.isChecked())),
+            ("Ctrl+Shift+F", lambda: self.btn_content.setChecked(not self.btn_content.isChecked())),
+            ("Ctrl+Shift+C", lambda: self.btn_case.setChecked(not self.btn_case.isChecked())),
+            ("Ctrl+T",       self.edit_terms),
+            ("Ctrl+L",       self.search_bar.setFocus),
+            ("Escape",       self.abort_search),
+            ("Ctrl+E",       self.export_results),
+            ("Ctrl+Shift+E", self.export_full_search),
+            ("Ctrl+O",       self.select_folder),
+            ("F5",           self.rescan),
+        ]:
+            a = QAction(self); a.setShortcut(QKeySequence(key))
+            a.triggered.connect(fn); self.addAction(a)
+
+    # ── EVENTS ────────────────────────────────────────────────
+    def _trigger(self): self._search_timer.start()
+
+    def select_folder(self):
+        folder = QFileDialog.getExistingDirectory(self, "Select Folder")
+        if folder:
+            self.folder_path, self.extra_roots = folder, []
+            self._show_folders()
+            self.run_search()
+
+    def add_folder(self):
+        """Add a folder to search along with the selected one."""
+        if not self.folder_path: return self.select_folder()
+        folder = QFileDialog.getExistingDirectory(self, "Add Folder")
+        if folder and folder != self.folder_path and folder not in self.extra_roots:
+            self.extra_roots.append(folder)
+            self._show_folders()
+            self.run_search()
+
+    def _show_folders(self):
+        folder = self.folder_path
+        display = folder if len(folder) < 65 else "..." + folder[-62:]
+        if self.extra_roots:
+            display = f"{display}  + {len(self.extra_roots)} more"
+        tip = "\n".join([folder, *self.extra_roots]) if self.extra_roots else ""
+        self.folder_label.setText(display); self.folder_label.setToolTip(tip)
+        self._lbl_folder.setText(display); self._lbl_folder.setToolTip(tip)
+
+    def abort_search(self):
+        self._stop_view()
+        if self._worker and self._worker.isRunning():
+            self._worker.abort(); self.progress_bar.hide()
+            self.status_bar.showMessage("Cancelled", 2000)
+        if self._export_worker and self._export_worker.isRunning():
+            self._export_worker.abort()
+
+    def clear_all(self):
+        self._stop_view()
+        for w in (self.search_bar, self.type_filter, self.exclude_filter,
+                  self.start_date, self.end_date):
+            w.clear()
+        self.results_model.clear(); self.preview.clear()
+        self.preview_path_lbl.setText("")
+        self._current_results = []
+        self._last_complete   = False; self._scanned = None
+        self._lbl_count.setText(""); self._lbl_time.setText("")
+        self._report = None; self._btn_stats.setEnabled(False)
+        self._set_terms([])
+
+    # ── TERMS ─────────────────────────────────────────────────
+    def edit_terms(self):
+        dialog = TermsDialog(self._terms, self)
+        if dialog.exec() == QDialog.Accepted:
+            self._set_terms(dialog.terms())
+            self._trigger()
+        else:
+            self._set_terms(self._terms)
+
+    def _set_terms(self, terms):
+        self._terms = terms
+        self.btn_terms.setChecked(bool(terms))
+        self.btn_terms.setText(f"Terms ({len(terms):,})" if terms else "Terms")
+        self.search_bar.setPlaceholderText(
+            "Add one more term..." if terms else "Type to search filenames or file contents...")
+
+    def _search_terms(self):
+        """The term list with the search bar's text as one more term, or
+        [] for an ordinary search."""
+        if not self._terms: return []
+        return read_terms("\n".join([self.search_bar.text(), *self._terms]))
+
+    # ── SEARCH ────────────────────────────────────────────────
+    def run_search(self, refresh_index=False):
+        if not self.folder_path: return
+        types = [t.strip() for t in self.type_filter.text().replace(","," ").split() if t.strip()]
+        s, e  = self.start_date.text().strip(), self.end_date.text().strip()
+        try:
+            start_dt = datetime.strptime(s, "%Y-%m-%d") if s else None
+            end_dt   = datetime.strptime(e, "%Y-%m-%d") if e else None
+        except ValueError:
+            self.status_bar.showMessage("Invalid date — use YYYY-MM-DD", 3000); return
+
+        config = dict(
+            folder=self.folder_path, query=self.search_bar.text(),
+            types=types, start_dt=start_dt, end_dt=end_dt,
+            fuzzy=self.btn_fuzzy.isChecked(), fuzzy_threshold=self.fuzzy_threshold.value(),
+            regex=self.btn_regex.isChecked(), case_sensitive=self.btn_case.isChecked(),
+            search_content=self.btn_content.isChecked(),
+            content_workers=self.workers_spin.value(),
+            readahead=self.readahead_spin.value(), readahead_mb=DEFAULT_CONFIG["readahead_mb"],
+            content_max_mb=self.max_mb_spin.value(),
+            lines=self.btn_content.isChecked() and self.lines_btn.isChecked(),
+            context_lines=self.context_spin.value(), max_lines=DEFAULT_CONFIG["max_lines"],
+            use_index=self.index_btn.isChecked() or refresh_index,
+            refresh_index=refresh_index,
+            min_size=self.min_size.value() or None, max_size=self.max_size.value() or None,
+            sort_by=self.sort_combo.currentText(), max_results=self.max_results_spin.value(),
+            refine_from=None, paths=None,
+            roots=[self.folder_path, *self.extra_roots] if self.extra_roots else None,
+            excludes=self.exclude_filter.text().split(), ignore_files=self.ignore_btn.isChecked(),
+            duplicates=self.dup_btn.isChecked(), keep_results=True, terms=self._search_terms(),
+            snapshot=self._snapshot if self._snapshot and self._snapshot.root == self.folder_path else None,
+        )
+        # Sort order, cap and narrower post-filters are applied to the last
+        # scan's results in place; anything else goes to a worker.
+        if not refresh_index and self._show_view(config): return
+        self.abort_search()
+        self._stop_live_update()
+        # Narrowing a finished, untruncated search only needs its results.
+        if (self._last_complete and not refresh_index
+                and is_refinement(self._last_config, config)):
+            config["refine_from"] = self._scanned
+        self._last_config, self._last_complete, self._scanned = config, False, None
+        self._view_config     = config
+        self._current_results = []
+        self._render_time     = 0.0
+        self._populate_tree([])   # also switches the model in or out of duplicates mode
+        # A QThread destroyed while running takes the process down, so an
+        # aborted worker is kept referenced until its thread has exited.
+        self._retired = [w for w in self._retired if w.isRunning()]
+        if self._worker and self._worker.isRunning(): self._retired.append(self._worker)
+        self._worker = SearchWorker(config)
+        self._worker.result_ready.connect(self._on_results)
+        self._worker.results_sorted.connect(self._on_sorted)
+        self._worker.progress.connect(self._on_progress)
+        self._worker.status_msg.connect(self.status_bar.showMessage)
+        self._worker.finished.connect(self._on_done)
+        self._worker.snapshot_ready.connect(self._on_snapshot)
+        self.progress_bar.show()
+        self.status_bar.showMessage("Searching...")
+        self._worker.start()
+
+    def _show_view(self, config):
+        """Show *config* from the last scan's results if it cannot add matches."""
+        if self._scanned is None or not is_view_change(
+                self._last_config, config, self._last_complete):
+            return False
+        self._lbl_time.setText("")
+        self._apply_view(self._scanned, config)
+        return True
+
+    def _apply_view(self, rows, config, message=None):
+        """Show *config*'s view of *rows*. *message* is a live update's
+        status text, "" for one that changed nothing the user sees; a live
+        update keeps the tree's scroll position.
+
+        A view that sorts or filters by size or date first has a worker
+        stat the rows the scan left unstat'ed, so the UI thread never
+        waits on the file system.
+        """
+        self._stop_view()
+        self._view_config = config
+        if not (view_needs_stat(config) and any(r.mtime is None for r in rows)):
+            self._show_rows(view_results(rows, config), message); return
+        self._retired = [w for w in self._retired if w.isRunning()]
+        self._view_worker = ViewWorker(rows, config, message)
+        self._view_worker.ready.connect(self._on_view_ready)
+        self.progress_bar.show()
+        self.status_bar.showMessage("Reading sizes and dates...")
+        self._view_worker.start()
+
+    def _stop_view(self):
+        worker, self._view_worker = self._view_worker, None
+        if worker and worker.isRunning():
+            worker.abort(); self._retired.append(worker)
+            self.progress_bar.hide(); self.status_bar.clearMessage()
+
+    def _on_view_ready(self, results):
+        worker = self.sender()
+        if worker is not self._view_worker: return
+        self._view_worker = None
+        self.progress_bar.hide(); self.status_bar.clearMessage()
+        self._show_rows(results, worker.message)
+
+    def _show_rows(self, results, message=None):
+        bar = self.tree.verticalScrollBar(); pos = bar.value()
+        self._current_results = results
+        self._populate_tree(results)
+        if message is not None: bar.setValue(pos)
+        self._lbl_count.setText(f"{len(results):,} results")
+        self._watch_results()
+        if message: self.status_bar.showMessage(message, 4000)
+
+    def _on_results(self, batch):
+        # Ignore batches still queued from a worker that has been replaced.
+        if self.sender() is not self._worker: return
+        self._current_results.extend(batch)
+        self._append_rows(batch)
+        self._lbl_count.setText(f"{len(self._current_results):,} results")
+
+    def _on_sorted(self, results):
+        if self.sender() is not self._worker: return
+        self._current_results = results
+        self._populate_tree(results)
+
+    def _populate_tree(self, results):
+        t0 = time.perf_counter()
+        c = self._last_config
+        dupes = bool(c and c["duplicates"])
+        self.results_model.set_results(results, self.group_btn.isChecked(), self.folder_path,
+                                       search_roots(c) if c else (), dupes,
+                                       bool(c and c["terms"]))
+        if self.group_btn.isChecked() or dupes or c and c["lines"]: self.tree.expandAll()
+        self._render_time += time.perf_counter() - t0
+
+    def _append_rows(self, batch):
+        t0 = time.perf_counter()
+        for index in self.results_model.append(batch):
+            self.tree.expand(index)
+        self._render_time += time.perf_counter() - t0
+
+    def _fetch_visible(self, _=None):
+        # Qt only fetches more children for the last expanded folder; load
+        # the next slice of whichever folder reaches the bottom of the view.
+        model  = self.results_model
+        index  = self.tree.indexAt(self.tree.viewport().rect().bottomLeft())
+        parent = index.parent()
+        if parent.isValid():
+            if index.row() < model.rowCount(parent) - 50: return
+        else:
+            parent = index.siblingAtRow(index.row() - 1)
+        if parent.isValid() and self.tree.isExpanded(parent) and model.canFetchMore(parent):
+            model.fetchMore(parent)
+
+    def _on_snapshot(self, snapshot, changed):
+        if self.sender() is not self._worker: return
+        # Edits in place do not touch a directory's mtime, so a snapshot
+        # taken while live changes came in is checked again before use.
+        if self._worker.live_changed: snapshot.validated = float("-inf")
+        self._snapshot = snapshot
+        if changed:
+            # The folder changed under the results on screen: search again,
+            # now against the revalidated snapshot.
+            self._last_complete, self._scanned = False, None
+            self.run_search()
+
+    def rescan(self):
+        """Forget the in-memory snapshot and walk the folder again."""
+        self._snapshot = None
+        self._last_complete, self._scanned = False, None
+        self.run_search()
+
+    def _on_progress(self, files, dirs):
+        if self.sender() is not self._worker: return
+        self.status_bar.showMessage(f"Scanned {files:,} files in {dirs:,} folders...")
+
+    def _on_done(self, count, elapsed):
+        if self.sender() is not self._worker: return
+        matched = self._worker.matched
+        self._last_complete = not self._worker.aborted() and not self._worker.truncated
+        if not self._worker.aborted(): self._scanned = self._current_results
+        self.progress_bar.hide()
+        self._lbl_count.setText(f"{count:,} results")
+        self._lbl_time.setText(f"  {elapsed:.2f}s")
+        self._report = self._worker.report
+        if self._report: self._report["seconds"]["render"] = round(self._render_time, 6)
+        self._btn_stats.setEnabled(self._report is not None)
+        if self.live_btn.isChecked() and not self._worker.aborted(): self._start_live()
+        # Changes that came in during the scan may have been missed by it.
+        self._run_live_update()
+        pruned = self._report["counts"]["pruned_dirs"] if self._report else 0
+        pruned = f", {pruned:,} folder{'s' * (pruned != 1)} pruned" if pruned else ""
+        if self._last_config["duplicates"]:
+            groups = {}
+            for r in self._current_results: groups.setdefault(r.dup_group, []).append(r.size)
+            reclaim = sum(sum(sizes[1:]) for sizes in groups.values())
+            self.status_bar.showMessage(
+                f"{count:,} duplicates in {len(groups):,} groups, {fmt_size(reclaim)} "
+                f"reclaimable, in {elapsed:.2f}s{pruned}", 5000)
+        elif self._last_config["terms"] and self._report:
+            found = sum(1 for t in self._report["terms"].values() if t["hits"])
+            self.status_bar.showMessage(
+                f"{count:,} files hold {found:,} of {len(self._report['terms']):,} terms, "
+                f"in {elapsed:.2f}s{pruned}", 5000)
+        elif matched > count:
+            self.status_bar.showMessage(
+                f"Showing top {count:,} of {matched:,} matches in {elapsed:.2f}s{pruned}", 5000)
+        else:
+            self.status_bar.showMessage(f"Found {count:,} results in {elapsed:.2f}s{pruned}", 5000)
+
+    # ── LIVE UPDATES ──────────────────────────────────────────
+    def _set_live(self, on):
+        if on and self._last_config and not (self._worker and self._worker.isRunning()):
+            self._start_live()
+        elif not on:
+            self._stop_live_update()
+            for live in self._lives.values(): live.stop()
+            self._lives = {}
+            self._live_pending = (set(), set())
+
+    def _start_live(self):
+        # A changed file can start or end a duplicate group anywhere in the
+        # results, so duplicates are only refreshed by searching again.
+        roots  = [] if self._last_config["duplicates"] else search_roots(self._last_config)
+        ignore = {r: ignore_rules(dict(self._last_config, folder=r)) for r in roots}
+        key    = lambda rules: rules.key if rules else None
+        for root in [r for r, live in self._lives.items()
+                     if r not in roots or key(live.ignore) != key(ignore[r])]:
+            self._lives.pop(root).stop()
+        for root in roots:
+            if root not in self._lives:
+                self._lives[root] = LiveWatch(root, self, ignore[root])
+                self._lives[root].changed.connect(self._on_live_change)
+        self._watch_results()
+
+    def _watch_results(self):
+        """Point each live watch at the results on screen from its root."""
+        for root, live in self._lives.items():
+            live.set_files([r.full_path for r in self._current_results if r.root == root])
+
+    def _live_for(self, path):
+        for root, live in self._lives.items():
+            if path == root or path.startswith(root.rstrip(os.sep) + os.sep): return live
+        return None
+
+    def _stop_live_update(self):
+        worker, self._live_worker = self._live_worker, None
+        if worker and worker.isRunning():
+            worker.abort(); self._retired.append(worker)
+            # Put its changes back, to be checked once nothing else is running.
+            self._live_pending[0].update(worker.pending[0])
+            self._live_pending[1].update(worker.pending[1])
+
+    def _on_live_change(self, dirs, files):
+        """Re-check the files under *dirs* and the *files* that changed."""
+        if self.sender() not in self._lives.values(): return
+        self._live_pending[0].update(dirs); self._live_pending[1].update(files)
+        # The snapshot no longer matches the disk: make the next search
+        # against it check the directory mtimes again.
+        if self._snapshot: self._snapshot.validated = float("-inf")
+        # A running search may already have passed the change; it is
+        # queued and checked once the search is done.
+        if self._worker and self._worker.isRunning():
+            self._worker.live_changed = True; return
+        self._run_live_update()
+
+    def _run_live_update(self):
+        if not self._lives or not any(self._live_pending): return
+        if self._worker and self._worker.isRunning(): return
+        if self._live_worker and self._live_worker.isRunning(): return
+        dirs, files = self._live_pending
+        self._live_pending = (set(), set())
+        paths, changed, removed = set(files), set(), []
+        for d in dirs:
+            live = self._live_for(d)
+            if live is None: continue
+            if not os.path.isdir(d):
+                removed.append(d); continue
+            changed.add(d)
+            names, subdirs = list_dir(d, live.ignore)
+            paths.update(names)
+            for sub in subdirs:
+                if sub in live.dirs: continue
+                added = []
+                paths.update(e.path for _, e in
+                             walk_files(sub, on_dir=added.append, ignore=live.ignore))
+                live.add_dirs(added)
+        for live in self._lives.values():
+            live.remove_dirs([d for d in live.dirs
+                              if any(d == r or d.startswith(r + os.sep) for r in removed)])
+
+        worker = SearchWorker(dict(self._last_config, paths=sorted(paths), refine_from=None,
+                                   snapshot=None, use_index=False, refresh_index=False))
+        worker.stale = (changed, paths, tuple(r + os.sep for r in removed), set(removed), files)
+        worker.pending = (dirs, files)
+        worker.results_sorted.connect(self._on_live_results)
+        worker.finished.connect(lambda *_: self._run_live_update())
+        self._retired = [w for w in self._retired if w.isRunning()]
+        self._live_worker = worker
+        worker.start()
+
+    def _on_live_results(self, results):
+        worker = self.sender()
+        if worker is not self._live_worker: return
+        changed, paths, prefixes, removed, edited = worker.stale
+        def stale(r):
+            folder = r.folder
+            return (folder in changed or r.full_path in paths or folder in removed
+                    or folder.startswith(prefixes))
+        before = {r.full_path: r.mtime for r in self._current_results if stale(r)}
+        if self._scanned is not None:
+            self._scanned = [r for r in self._scanned if not stale(r)] + results
+            rows = self._scanned
+        else:
+            rows = [r for r in self._current_results if not stale(r)] + results
+        after = {r.full_path: r.mtime for r in results}
+        added   = len(after.keys() - before.keys())
+        dropped = len(before.keys() - after.keys())
+        updated = sum(1 for p in after.keys() & before.keys()
+                      if p in edited or before[p] is not None and before[p] != after[p])
+        message = (f"Live: {added:,} added, {updated:,} updated, {dropped:,} removed"
+                   if added or updated or dropped else "")
+        self._apply_view(rows, self._view_config, message)
+
+    def closeEvent(self, event):
+        for live in self._lives.values(): live.stop()
+        if self._export_worker and self._export_worker.isRunning():
+            self._export_worker.abort(); self._export_worker.wait()
+        super().closeEvent(event)
+
+    def _show_stats(self):
+        """Pop the last search's counters and timings up above the status bar."""
+        if not self._report: return
+        popup = QFrame(self, Qt.Popup)
+        popup.setObjectName("statsPopup")
+        popup.setAttribute(Qt.WA_DeleteOnClose)
+        lay = QVBoxLayout(popup)
+        lay.setContentsMargins(14, 12, 14, 12)
+        text = QLabel(format_report(self._report))
+        text.setObjectName("statsText")
+        text.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        lay.addWidget(text)
+        row = QHBoxLayout()
+        copy_btn = QPushButton("Copy JSON")
+        save_btn = QPushButton("Save JSON…")
+        copy_btn.clicked.connect(lambda: (
+            QApplication.clipboard().setText(json.dumps(self._report, indent=2)),
+            self.status_bar.showMessage("Search details copied", 2000)))
+        save_btn.clicked.connect(lambda: (popup.close(), self._save_stats()))
+        row.addStretch(); row.addWidget(copy_btn); row.addWidget(save_btn)
+        lay.addLayout(row)
+        popup.adjustSize()
+        corner = self._btn_stats.mapToGlobal(self._btn_stats.rect().topRight())
+        popup.move(corner - QPoint(popup.width(), popup.height()))
+        popup.show()
+
+    def _save_stats(self):
+        save_path, _ = QFileDialog.getSaveFileName(
+            self, "Save Search Details", "finderplus-search.json", "JSON Files (*.json)")
+        if not save_path: return
+        try:
+            with open(save_path, "w", encoding="utf-8") as f:
+                json.dump(self._report, f, indent=2); f.write("\n")
+            self.status_bar.showMessage(f"Saved to {save_path}", 3000)
+        except OSError as ex:
+            self.status_bar.showMessage(f"Save failed: {ex}", 4000)
+
+    # ── PREVIEW ───────────────────────────────────────────────
+    def _on_select(self, current, _):
+        path = current.data(Qt.UserRole)
+        if path and os.path.isfile(path): self._load_preview(path, current.data(ResultsModel.LINE))
+
+    def _load_preview(self, path, line=None):
+        self.preview_path_lbl.setText(os.path.basename(path))
+        ext = Path(path).suffix.lower()
+        TEXT_EXTS = {
+            ".txt",".py",".js",".ts",".jsx",".tsx",".html",".htm",".css",
+            ".scss",".json",".xml",".yaml",".yml",".md",".rst",".toml",
+            ".ini",".cfg",".sh",".bash",".c",".cpp",".h",".java",".kt",
+            ".go",".rs",".rb",".php",".swift",".sql",".log",".csv",".env",
+            ".lua",".dart",".vue",".svelte",".ipynb",".tf",
+        }
+        if ext not in TEXT_EXTS:
+            self.preview.setPlainText(f"[No preview available for {ext} files]"); return
+        try:
+            with open(path, "r", encoding="utf-8", errors="ignore") as f:
+                content = f.read(500_000)
+            if os.path.getsize(path) > 500_000:
+                content += "\n\n[... truncated at 500 KB ...]"
+            self.preview.setPlainText(content)
+            terms = self._search_terms()
+            try:
+                matcher = term_matcher(tuple(terms), self.btn_regex.isChecked(),
+                                       self.btn_case.isChecked()) if terms else None
+            except re.error:
+                matcher = None
+            self._highlighter = MatchHighlighter(
+                self.preview.document(), self.search_bar.text(),
+                self.btn_case.isChecked(), self.btn_regex.isChecked(), matcher
+            )
+            q = self.search_bar.text()
+            block = self.preview.document().findBlockByNumber(line - 1 if line else -1)
+            if block.isValid():
+                self.preview.setTextCursor(QTextCursor(block))
+                self.preview.ensureCursorVisible()
+            elif q:
+                cur = self.preview.document().find(q)
+                if cur and not cur.isNull():
+                    self.preview.setTextCursor(cur)
+                    self.preview.ensureCursorVisible()
+        except Exception as ex:
+            self.preview.setPlainText(f"[Error reading file: {ex}]")
+
+    # ── CONTEXT MENU ──────────────────────────────────────────
+    def _context_menu(self, pos):
+        paths = [p for p in (i.data(Qt.UserRole) for i in self.tree.selectionModel().selectedRows())
+                 if p]
+        if not paths: return
+        menu   = QMenu(self)
+        a_open = menu.addAction("Open file")
+        a_dir  = menu.addAction("Open containing folder")
+        menu.addSeparator()
+        a_cp   = menu.addAction("Copy path")
+        a_cn   = menu.addAction("Copy filename")
+        a_ca   = menu.addAction(f"Copy all paths  ({len(paths)})")
+        act    = menu.exec(QCursor.pos())
+        if   act == a_open: [QDesktopServices.openUrl(QUrl.fromLocalFile(p)) for p in paths[:5] if os.path.isfile(p)]
+        elif act == a_dir:  [QDesktopServices.openUrl(QUrl.fromLocalFile(os.path.dirname(p))) for p in paths[:5]]
+        elif act == a_cp:   QApplication.clipboard().setText(paths[0])
+        elif act == a_cn:   QApplication.clipboard().setText(os.path.basename(paths[0]))
+        elif act == a_ca:   QApplication.clipboard().setText("\n".join(paths))
+
+    def _open_item(self, index):
+        path = index.data(Qt.UserRole)
+        if path and os.path.isfile(path): QDesktopServices.openUrl(QUrl.fromLocalFile(path))
+
+    # ── EXPORT ────────────────────────────────────────────────
+    EXPORT_FILTERS = ("Text Files (*.txt);;CSV Files (*.csv);;JSON Lines (*.jsonl);;"
+                      "SQLite Database (*.db)")
+
+    def _export_path(self, title):
+        """Ask where to export; a name without an extension gets the chosen
+        filter's, which also picks the format."""
+        path, chosen = QFileDialog.getSaveFileName(self, title, "results.txt", self.EXPORT_FILTERS)
+        if path and not os.path.splitext(path)[1]:
+            m = re.search(r"\*(\.\w+)", chosen)
+            if m: path += m.group(1)
+        return path
+
+    def _export_header(self):
+        """Heading lines of a plain-text export."""
+        return [f"QuickSearch Export — {datetime.now():%Y-%m-%d %H:%M:%S}",
+                *(f"Folder : {folder}" for folder in [self.folder_path, *self.extra_roots]),
+                f"Query  : {self.search_bar.text()}",
+                *([f"Terms  : {', '.join(self._search_terms())}"] if self._terms else [])]
+
+    def export_results(self):
+        if not self._current_results:
+            self.status_bar.showMessage("Nothing to export", 2000); return
+        save_path = self._export_path("Export Results")
+        if not save_path: return
+        header = [*self._export_header(), f"Results: {len(self._current_results)}", "─" * 80, ""]
+        try:
+            with Exporter(save_path, header=header) as out:
+                for r in self._current_results: out.write(r)
+            self.status_bar.showMessage(f"Exported {out.count:,} results to {save_path}", 3000)
+        except Exception as ex:
+            self.status_bar.showMessage(f"Export failed: {ex}", 4000)
+
+    def export_full_search(self):
+        """Run the last search again with no result limit, writing every
+        match straight to a file instead of to the window."""
+        if self._view_config is None:
+            self.status_bar.showMessage("Run a search first", 2000); return
+        if self._export_worker and self._export_worker.isRunning():
+            self.status_bar.showMessage("An export is already running", 2000); return
+        save_path = self._export_path("Export Full Search")
+        if not save_path: return
+        worker = ExportWorker(self._view_config, save_path, [*self._export_header(), "─" * 80, ""])
+        worker.progress.connect(
+            lambda n: self.status_bar.showMessage(f"Exporting... {n:,} matches written"))
+        worker.status_msg.connect(self.status_bar.showMessage)
+        worker.finished.connect(self._on_export_done)
+        self._export_worker = worker
+        self.status_bar.showMessage("Exporting...")
+        worker.start()
+
+    def _on_export_done(self, count, error):
+        worker = self.sender()
+        if error:
+            self.status_bar.showMessage(f"Export failed after {count:,} matches: {error}", 6000)
+        elif worker.aborted():
+            self.status_bar.showMessage(f"Export cancelled after {count:,} matches", 4000)
+        else:
+            self.status_bar.showMessage(f"Exported {count:,} matches to {worker.path}", 6000)
+
+
+# ══════════════════════════════════════════════════════════════
+#  ENTRY POINT
+# ══════════════════════════════════════════════════════════════
+def main():
+    if sys.platform == "win32":
+        import ctypes
+        ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID("finderplus.app")
+    app = QApplication(sys.argv)
+    app.setStyle("Fusion")
+    app.setStyleSheet(STYLE)
+
+    pal = QPalette()
+    pal.setColor(QPalette.Window,          QColor("#ffffff"))
+    pal.setColor(QPalette.WindowText,      QColor("#1a1a2e"))
+    pal.setColor(QPalette.Base,            QColor("#ffffff"))
+    pal.setColor(QPalette.AlternateBase,   QColor("#f9fafb"))
+    pal.setColor(QPalette.ToolTipBase,     QColor("#ffffff"))
+    pal.setColor(QPalette.ToolTipText,     QColor("#1a1a2e"))
+    pal.setColor(QPalette.Text,            QColor("#1a1a2e"))
+    pal.setColor(QPalette.Button,          QColor("#ffffff"))
+    pal.setColor(QPalette.ButtonText,      QColor("#374151"))
+    pal.setColor(QPalette.BrightText,      QColor("#6366f1"))
+    pal.setColor(QPalette.Highlight,       QColor("#e0e7ff"))
+    pal.setColor(QPalette.HighlightedText, QColor("#3730a3"))
+    pal.setColor(QPalette.Light,           QColor("#f9fafb"))
+    pal.setColor(QPalette.Mid,             QColor("#e5e7eb"))
+    pal.setColor(QPalette.Dark,            QColor("#d1d5db"))
+    pal.setColor(QPalette.Shadow,          QColor("#9ca3af"))
+    app.setPalette(pal)
+
+    window = QuickSearch()
+    window.show()
+    sys.exit(app.exec())